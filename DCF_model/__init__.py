@@ -2,13 +2,16 @@
 YPF DCF Model Package
 
 Usage:
-    from ypf_model import YPFModel
+    from DCF_model import YPFModel
     model = YPFModel("path/to/YPF_DCF.xlsx")   # or .csv
 """
 
 from .ypf_model import YPFModel
 from .data_loader import DataLoader
 from .base_schedule import BaseSchedule
+from .valuation import DCFValuation
+from .scenario import Scenario
+from .series import Series
 from .schedules import (
     OilRevenueSchedule,
     CrudeProductsRevenueSchedule,
@@ -30,6 +33,9 @@ __all__ = [
     "YPFModel",
     "DataLoader",
     "BaseSchedule",
+    "DCFValuation",
+    "Scenario",
+    "Series",
     "OilRevenueSchedule",
     "CrudeProductsRevenueSchedule",
     "OtherProductsRevenueSchedule",
@@ -0,0 +1,101 @@
+"""
+Forward-mode automatic differentiation with vector tangents.
+
+A Dual carries a value array and, for each of N seed directions, the
+derivative of that value: tan has shape (N, *value.shape).  Seeding every
+input element as its own direction gives the full gradient of any output in
+one pass whose cost grows with N only through array width.
+
+Supports what DriverModel uses: + − × ÷ with arrays and scalars, negation,
+@ against a constant matrix or vector, cumprod along an axis and sum.
+
+Usage:
+    x = Dual.seed(np.array([1.0, 2.0]))      # 2 directions, one per element
+    y = (x * x).sum()
+    y.value, y.tan                            # 5.0, [2.0, 4.0]
+"""
+
+import numpy as np
+
+
+class Dual:
+    __slots__ = ("value", "tan")
+    __array_ufunc__ = None   # make numpy defer to our reflected operators
+
+    def __init__(self, value, tan):
+        self.value = np.asarray(value, dtype=float)
+        self.tan = np.asarray(tan, dtype=float)
+
+    @classmethod
+    def seed(cls, value: np.ndarray, n: int | None = None, offset: int = 0) -> "Dual":
+        """
+        Value whose elements are directions offset … offset+size-1 out of n
+        (default n = size), so several inputs can share one tangent space.
+        """
+        value = np.asarray(value, dtype=float)
+        n = value.size if n is None else n
+        tan = np.zeros((n, value.size))
+        tan[offset + np.arange(value.size), np.arange(value.size)] = 1.0
+        return cls(value, tan.reshape((n,) + value.shape))
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    # ── Arithmetic ───────────────────────────────────────────────────────────
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.tan + other.tan)
+        value = self.value + other
+        return Dual(value, np.broadcast_to(self.tan, self.tan.shape[:1] + value.shape))
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Dual(-self.value, -self.tan)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value,
+                        self.tan * other.value + self.value * other.tan)
+        return Dual(self.value * other, self.tan * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            value = self.value / other.value
+            return Dual(value, (self.tan - value * other.tan) / other.value)
+        return Dual(self.value / other, self.tan / other)
+
+    def __rtruediv__(self, other):
+        value = other / self.value
+        return Dual(value, -value / self.value * self.tan)
+
+    def __matmul__(self, other):
+        """Product with a constant matrix / vector on the right."""
+        return Dual(self.value @ other, self.tan @ other)
+
+    # ── Reductions ───────────────────────────────────────────────────────────
+
+    def cumprod(self, axis: int = -1) -> "Dual":
+        """d(Π x) = Π x · Σ dx / x  (inputs must be non-zero)."""
+        value = np.cumprod(self.value, axis=axis)
+        tan_axis = axis if axis < 0 else axis + 1
+        return Dual(value, value * np.cumsum(self.tan / self.value, axis=tan_axis))
+
+    def sum(self, axis=None) -> "Dual":
+        if axis is None:
+            return Dual(self.value.sum(), self.tan.reshape(len(self.tan), -1).sum(axis=1))
+        tan_axis = axis if axis < 0 else axis + 1
+        return Dual(self.value.sum(axis=axis), self.tan.sum(axis=tan_axis))
+
+    def __repr__(self):
+        return f"<Dual: value shape {self.value.shape}, {len(self.tan)} directions>"
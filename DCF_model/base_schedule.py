@@ -2,7 +2,8 @@
 Base schedule class that all individual schedule classes inherit from.
 """
 
-from multi_sheet_loader import MultiSheetLoader
+from . import timings
+from .multi_sheet_loader import MultiSheetLoader
 
 
 class BaseSchedule:
@@ -18,12 +19,23 @@ class BaseSchedule:
 
     def __init__(self, loader: MultiSheetLoader):
         self.loader = loader
-        self.years = loader.ALL_YEARS
-        self.historical_years = loader.HISTORICAL_YEARS
-        self.projected_years = loader.PROJECTED_YEARS
+
+    # Read through to the loader, so a delta that rolls the year split shows up
+    @property
+    def years(self) -> list[int]:
+        return self.loader.ALL_YEARS
+
+    @property
+    def historical_years(self) -> list[int]:
+        return self.loader.HISTORICAL_YEARS
+
+    @property
+    def projected_years(self) -> list[int]:
+        return self.loader.PROJECTED_YEARS
 
     def _field(self, key: str) -> dict[int, float]:
         """Return {year: value} for the given field key from this schedule's sheet."""
+        timings.count("field_lookups")
         return self.loader.field(self.SHEET_NAME, key)
 
     def summary(self) -> dict:
@@ -0,0 +1,320 @@
+"""
+Content-addressed cache of valuation results and schedule summaries.
+
+A result is keyed by a SHA-256 of what determines it: the bytes of the data
+file, the full assumption set (wacc, terminal growth, …), any scenario
+overrides and the deltas applied to the loaded data (see delta.py).  The
+same inputs give the same key in every process and on every machine, so
+jobs can share results; a changed data file or assumption is simply a
+different key, never a stale hit.
+
+Lookups go through three layers, fastest first:
+
+    memory   per-process LRU of the newest `max_memory` results
+    local    directory of one file per result (directory=)
+    shared   optional second directory, e.g. on a cluster file system
+             (shared=); hits there are copied into the local layer
+
+Every entry expires `ttl` seconds after it was computed (None: never), and
+each directory keeps at most `max_entries` files, the least recently used
+going first.  The data file is hashed once per (path, mtime, size), so a
+repeat request costs a stat() and a dict lookup.
+
+Entries on disk are pickles: only point the directories at storage you trust.
+
+Usage:
+    from DCF_model.cache import ResultCache
+    cache = ResultCache("~/.cache/dcf", shared="/mnt/team/dcf-cache", ttl=86400)
+    cache.valuation("data/YPF_historicals.xlsx", wacc=0.11)     # dict, as DCFValuation.summary()
+    cache.summary(model)                                      # model.summary()
+    cache.valuation(bear_scenario, wacc=0.12)                 # overrides are part of the key
+    cache.stats                                               # hits per layer, misses, …
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from . import timings
+
+CACHE_VERSION = 1   # bump when the stored results change shape
+
+# {path: ((mtime_ns, size), sha256 hex)} of every data file hashed so far
+_DIGESTS: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's bytes, recomputed only when its mtime or size changes."""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    known = _DIGESTS.get(path)
+    if known is not None and known[0] == stamp:
+        return known[1]
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    _DIGESTS[path] = (stamp, digest)
+    return digest
+
+
+def _source(obj) -> tuple[str, dict, str | None]:
+    """
+    (data file, merged overrides, patch digest) behind a path, YPFModel,
+    loader or Scenario.
+    """
+    if isinstance(obj, str):
+        return obj, {}, None
+    loader = getattr(obj, "loader", obj)
+    layers = []
+    while hasattr(loader, "base"):          # Scenario chain, innermost last
+        layers.append(loader.overrides)
+        loader = loader.base
+    path = getattr(loader, "filepath", None)
+    if not isinstance(path, str):
+        raise TypeError(f"Cannot derive a cache key from {obj!r}: no data file behind it")
+    overrides = {}
+    for layer in reversed(layers):
+        overrides.update(layer)
+    return path, overrides, getattr(loader, "patch_digest", None)
+
+
+def result_key(kind: str, source, **assumptions) -> str:
+    """
+    Cache key for one result: kind ("valuation", "summary", …) of the data
+    behind source under the given assumptions.
+    """
+    path, overrides, patches = _source(source)
+    spec = {
+        "version":     CACHE_VERSION,
+        "kind":        kind,
+        "data":        file_digest(path),
+        "assumptions": assumptions,
+        "overrides":   sorted([sheet, key, sorted(series.items())]
+                              for (sheet, key), series in overrides.items()),
+    }
+    if patches is not None:
+        spec["patches"] = patches
+    text = json.dumps(spec, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class _DirectoryStore:
+    """One result per file, <dir>/<key[:2]>/<key>; mtime records the last use."""
+
+    def __init__(self, directory: str, max_entries: int | None):
+        self.directory = os.path.expanduser(directory)
+        self.max_entries = max_entries
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> tuple[float, object] | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            os.utime(path)
+        except Exception:   # missing, truncated or unloadable: a miss, and put() replaces it
+            return None
+        return entry
+
+    def put(self, key: str, entry: tuple[float, object]):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)   # readers never see a partial entry
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def prune(self, ttl: float | None) -> int:
+        """
+        Drop entries unused for longer than ttl and the least recently used
+        beyond max_entries.  Returns how many files were removed.
+        """
+        files = []
+        for sub in os.scandir(self.directory):
+            if sub.is_dir():
+                files.extend((e.stat().st_mtime, e.path) for e in os.scandir(sub.path)
+                             if not e.name.endswith(".tmp"))
+        files.sort(reverse=True)
+        keep = len(files) if self.max_entries is None else self.max_entries
+        cutoff = None if ttl is None else time.time() - ttl
+        removed = 0
+        for i, (mtime, path) in enumerate(files):
+            if i >= keep or (cutoff is not None and mtime < cutoff):
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def __repr__(self):
+        return f"<_DirectoryStore: {self.directory}>"
+
+
+class ResultCache:
+    """
+    Memory → local directory → shared directory cache of results by
+    result_key().  directory=None keeps results in memory only.  Hits return
+    the cached object itself: treat results as read-only.  Safe to use from
+    several threads; only one prune runs at a time.
+    """
+
+    def __init__(self, directory: str | None = None, shared: str | None = None,
+                 ttl: float | None = None, max_memory: int = 4096,
+                 max_entries: int | None = 100_000, prune_every: int = 256):
+        self.ttl = ttl
+        self.max_memory = max_memory
+        self.prune_every = prune_every
+        # (stats label, store), fastest first
+        self.stores = [(layer, _DirectoryStore(d, max_entries))
+                       for layer, d in (("local", directory), ("shared", shared)) if d]
+        self.stats = {"memory_hits": 0, "local_hits": 0, "shared_hits": 0, "misses": 0,
+                      "expired": 0, "stores": 0, "evictions": 0}
+        self._memory: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._puts = 0
+        self._lock = threading.Lock()      # the memory layer, stats and _puts
+        self._pruning = threading.Lock()
+
+    def _fresh(self, entry: tuple[float, object]) -> bool:
+        return self.ttl is None or time.time() - entry[0] <= self.ttl
+
+    def _count(self, stat: str, n: int = 1):
+        with self._lock:
+            self.stats[stat] += n
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._fresh(entry):
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    timings.count("result_cache_hits")
+                    return entry[1]
+                del self._memory[key]
+                self.stats["expired"] += 1
+
+        # The directories are read outside the lock: they may be slow
+        for i, (layer, store) in enumerate(self.stores):
+            entry = store.get(key)
+            if entry is None:
+                continue
+            if not self._fresh(entry):
+                store.delete(key)
+                self._count("expired")
+                continue
+            self._count(f"{layer}_hits")
+            timings.count("result_cache_hits")
+            for _, faster in self.stores[:i]:
+                faster.put(key, entry)
+            self._remember(key, entry)
+            return entry[1]
+
+        self._count("misses")
+        timings.count("result_cache_misses")
+        return default
+
+    def put(self, key: str, value):
+        entry = (time.time(), value)
+        self._remember(key, entry)
+        for _, store in self.stores:
+            store.put(key, entry)
+        with self._lock:
+            self.stats["stores"] += 1
+            self._puts += 1
+            due = self.prune_every and self._puts % self.prune_every == 0
+        if due:
+            self.prune()
+
+    def _remember(self, key: str, entry: tuple[float, object]):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory:
+                self._memory.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def get_or_compute(self, key: str, compute):
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def prune(self) -> int:
+        """
+        Expire and LRU-trim the directories now (put() does it every
+        prune_every stores).  Returns 0 at once if a prune is already running.
+        """
+        if not self._pruning.acquire(blocking=False):
+            return 0
+        try:
+            removed = sum(store.prune(self.ttl) for _, store in self.stores)
+        finally:
+            self._pruning.release()
+        self._count("evictions", removed)
+        return removed
+
+    def clear(self):
+        """Forget the in-memory layer (the directories are left alone)."""
+        with self._lock:
+            self._memory.clear()
+
+    # ── Model results ────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _model(source, engine: str):
+        if isinstance(source, str):
+            from .ypf_model import YPFModel
+            return YPFModel(source, engine=engine)
+        if hasattr(source, "all_schedules"):
+            return source
+        if hasattr(source, "model"):        # Scenario
+            return source.model()
+        from .ypf_model import YPFModel
+        return YPFModel.from_loader(source)
+
+    def valuation(self, source, wacc: float = 0.10, terminal_growth: float = 0.02,
+                  engine: str = "openpyxl") -> dict:
+        """
+        DCFValuation(...).summary() of source – a data file path, YPFModel,
+        loader or Scenario.  A path is only loaded on a miss.
+        """
+        key = result_key("valuation", source, wacc=wacc, terminal_growth=terminal_growth)
+
+        def compute():
+            from .valuation import DCFValuation
+            return DCFValuation(self._model(source, engine), wacc, terminal_growth).summary()
+
+        return self.get_or_compute(key, compute)
+
+    def summary(self, source, engine: str = "openpyxl") -> dict:
+        """model.summary() of source (see valuation())."""
+        key = result_key("summary", source)
+        return self.get_or_compute(key, lambda: self._model(source, engine).summary())
+
+    def info(self) -> dict:
+        return {
+            "memory_entries": len(self._memory),
+            "directories":    {layer: s.directory for layer, s in self.stores},
+            "ttl":            self.ttl,
+            **self.stats,
+        }
+
+    def __repr__(self):
+        hits = sum(v for k, v in self.stats.items() if k.endswith("_hits"))
+        return (f"<ResultCache: {len(self._memory)} in memory, {len(self.stores)} "
+                f"directories, {hits} hits / {self.stats['misses']} misses>")
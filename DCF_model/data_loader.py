@@ -4,14 +4,17 @@ Loads historical and projected data from a CSV/Excel source file.
 """
 
 import csv
+import importlib.util
+import io
 import os
 from typing import Optional
 
-try:
-    import openpyxl
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
+from . import timings
+from .xlsx_reader import XlsxReader
+
+# openpyxl is imported lazily in _load_excel – it is slow to import and not
+# needed for CSV input or the "xml" engine
+HAS_OPENPYXL = importlib.util.find_spec("openpyxl") is not None
 
 
 class DataLoader:
@@ -20,6 +23,10 @@ class DataLoader:
     
     The data is stored as a dict-of-dicts keyed by (row, col) 1-indexed coordinates,
     mirroring the Excel layout. Column H=8 corresponds to 2020, I=9 to 2021, etc.
+
+    Excel files are read with openpyxl by default; engine="xml" uses the
+    built-in XlsxReader instead, which only extracts cell values.
+    data= parses bytes already read; filepath then only names the file.
     """
 
     # Column-to-year mapping (H=8 -> 2020, ..., V=22 -> 2034)
@@ -32,12 +39,25 @@ class DataLoader:
     PROJECTED_YEARS = [2025, 2026, 2027, 2028, 2029, 2030, 2031, 2032, 2033, 2034]
     ALL_YEARS = HISTORICAL_YEARS + PROJECTED_YEARS
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, engine: str = "openpyxl", data: bytes | None = None):
+        if engine not in ("openpyxl", "xml"):
+            raise ValueError(f"Unsupported engine: {engine}")
         self.filepath = filepath
+        self.engine = engine
         self._data: dict[tuple[int, int], float | str | None] = {}
+        self._bytes = data
         self._load()
 
     def _load(self):
+        with timings.span("load", os.path.basename(self.filepath)):
+            self._load_file()
+        self._bytes = None
+
+    def _source(self):
+        """The file to open: filepath, or the bytes passed as data."""
+        return self.filepath if self._bytes is None else io.BytesIO(self._bytes)
+
+    def _load_file(self):
         ext = os.path.splitext(self.filepath)[1].lower()
         if ext == '.csv':
             self._load_csv()
@@ -47,7 +67,8 @@ class DataLoader:
             raise ValueError(f"Unsupported file type: {ext}")
 
     def _load_csv(self):
-        with open(self.filepath, 'r') as f:
+        with (open(self.filepath, 'r') if self._bytes is None
+              else io.StringIO(self._bytes.decode())) as f:
             reader = csv.reader(f)
             for r_idx, row in enumerate(reader, start=1):
                 for c_idx, val in enumerate(row, start=1):
@@ -58,9 +79,15 @@ class DataLoader:
                             self._data[(r_idx, c_idx)] = val
 
     def _load_excel(self):
+        if self.engine == "xml":
+            with XlsxReader(self._source()) as reader:
+                for r, c, value in reader.iter_cells('Model'):
+                    self._data[(r, c)] = value
+            return
         if not HAS_OPENPYXL:
             raise ImportError("openpyxl is required to read Excel files")
-        wb = openpyxl.load_workbook(self.filepath, data_only=True)
+        import openpyxl
+        wb = openpyxl.load_workbook(self._source(), data_only=True)
         ws = wb['Model']
         for row in ws.iter_rows(min_row=1, max_row=ws.max_row,
                                 max_col=ws.max_column, values_only=False):
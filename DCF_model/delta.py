@@ -0,0 +1,133 @@
+"""
+Incremental updates to a loaded model.
+
+A Delta is what changed since the data was loaded: revised cells, new field
+rows, a new year column, or the split between actual and projected years
+moving on (2025 becoming an actual year).  YPFModel.apply(delta) patches the
+loader's store in place – nothing is re-read or re-parsed – and marks dirty
+only the schedules whose sheets the delta touched (every schedule, when the
+year axes change).
+
+    cells             {sheet: {field_key: {year: value}}}; a key the sheet
+                      lacks becomes a new row, a year outside the axis a new
+                      column, and a None value clears the cell
+    actuals_through   last actual year; later years are projected
+
+Deltas can be written as JSON ({"actuals_through": 2025, "cells": {...}}),
+as a workbook in the data-file layout holding only the changed rows, or as
+a long CSV with a sheet,key,year,value header.
+
+Usage:
+    from DCF_model.delta import Delta, read_delta
+    model = YPFModel("data/YPF_historicals.xlsx")
+    model.apply(Delta({"Income Statement": {"revenue": {2025: 19_850.0}}},
+                      actuals_through=2025))
+    model.apply(read_delta("data/YPF_2025Q4.json"))
+    model.dirty          # {"Income Statement", ...} until the caller clears it
+"""
+
+import csv
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from numbers import Real
+
+
+class Delta:
+    """One batch of changes to apply to a loaded model."""
+
+    def __init__(self, cells: dict[str, dict[str, dict[int, float | None]]] | None = None,
+                 actuals_through: int | None = None):
+        if actuals_through is not None and (isinstance(actuals_through, bool)
+                                            or not isinstance(actuals_through, int)):
+            raise ValueError(f"actuals_through must be a year, got {actuals_through!r}")
+        self.cells = {
+            sheet: {key: _series(sheet, key, series) for key, series in
+                    _mapping(fields, f"cells[{sheet!r}]").items()}
+            for sheet, fields in _mapping(cells or {}, "cells").items()
+        }
+        self.actuals_through = actuals_through
+
+    @classmethod
+    def from_spec(cls, spec: dict) -> "Delta":
+        """From the JSON form: {"actuals_through": year, "cells": {sheet: {key: {year: value}}}}."""
+        spec = _mapping(spec, "A delta spec")
+        unknown = set(spec) - {"cells", "actuals_through"}
+        if unknown:
+            raise ValueError(f"Unknown delta spec entries: {sorted(unknown)}. "
+                             f"Choose from ['cells', 'actuals_through']")
+        return cls(spec.get("cells"), spec.get("actuals_through"))
+
+    def to_spec(self) -> dict:
+        spec = {"cells": {sheet: {key: {str(y): v for y, v in series.items()}
+                                  for key, series in fields.items()}
+                          for sheet, fields in self.cells.items()}}
+        if self.actuals_through is not None:
+            spec["actuals_through"] = self.actuals_through
+        return spec
+
+    def digest(self) -> str:
+        """SHA-256 of the canonical JSON form – the same changes give the same digest."""
+        text = json.dumps(self.to_spec(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    @property
+    def sheets(self) -> set[str]:
+        return set(self.cells)
+
+    @property
+    def years(self) -> set[int]:
+        return {y for fields in self.cells.values() for series in fields.values() for y in series}
+
+    def __len__(self) -> int:
+        return sum(len(series) for fields in self.cells.values() for series in fields.values())
+
+    def __repr__(self):
+        split = f", actuals through {self.actuals_through}" if self.actuals_through else ""
+        return f"<Delta: {len(self)} cells in {len(self.cells)} sheets{split}>"
+
+
+def _mapping(value, what: str) -> Mapping:
+    if not isinstance(value, Mapping):
+        raise ValueError(f"{what} must be an object, got {type(value).__name__}")
+    return value
+
+
+def _series(sheet: str, key: str, series) -> dict[int, float | None]:
+    """One field's {year: value} changes, checked and normalised."""
+    out = {}
+    for y, v in _mapping(series, f"cells[{sheet!r}][{key!r}]").items():
+        try:
+            year = int(y)
+        except (TypeError, ValueError):
+            raise ValueError(f"cells[{sheet!r}][{key!r}]: {y!r} is not a year") from None
+        if v is not None and (isinstance(v, bool) or not isinstance(v, Real)):
+            raise ValueError(f"cells[{sheet!r}][{key!r}][{y!r}] must be a number or null, "
+                             f"got {v!r}")
+        out[year] = None if v is None else float(v)
+    return out
+
+
+def _read_csv(path: str) -> Delta:
+    cells: dict[str, dict[str, dict[int, float | None]]] = {}
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            value = row["value"].strip()
+            cells.setdefault(row["sheet"], {}).setdefault(row["key"].strip(), {})[
+                int(row["year"])] = float(value) if value else None
+    return Delta(cells)
+
+
+def read_delta(path: str, engine: str = "openpyxl") -> Delta:
+    """Read a delta from a .json spec, a long .csv or a workbook in the data-file layout."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        with open(path) as f:
+            return Delta.from_spec(json.load(f))
+    if ext == ".csv":
+        return _read_csv(path)
+    if ext in (".xlsx", ".xlsm"):
+        from .multi_sheet_loader import MultiSheetLoader
+        return Delta(MultiSheetLoader(path, engine=engine)._sheets)
+    raise ValueError(f"Unsupported delta file type: {ext}. Choose from ['.json', '.csv', '.xlsx']")
@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
 """
 Demo script – loads the YPF Model from CSV or Excel and prints key outputs.
+
+Usage (from repo root):
+    python -m DCF_model.demo [path/to/YPF_DCF.xlsx]
+
+The same report is available as `dcf show <ticker>`.
 """
 
 import sys
 import os
 
-# Allow running from this directory or parent
-sys.path.insert(0, os.path.dirname(__file__))
-
-from data_loader import DataLoader
-from ypf_model import YPFModel
+from .ypf_model import YPFModel
 
 
 def fmt(val, width=12):
@@ -31,29 +32,8 @@ def print_table(title: str, data: dict[int, float], indent=2):
     print(f"{prefix}{'Value':<8}" + "".join(fmt(data.get(y)) for y in years))
 
 
-def main():
-    # Default: try Excel first, fall back to CSV
-    if len(sys.argv) > 1:
-        filepath = sys.argv[1]
-    else:
-        filepath = None
-        candidates = [
-            "/mnt/user-data/uploads/YPF_DCF__1_.xlsx",
-            "model_data.csv",
-            "../model_data.csv",
-        ]
-        for c in candidates:
-            if os.path.exists(c):
-                filepath = c
-                break
-
-    if filepath is None:
-        print("ERROR: No data file found. Provide a path as argument.")
-        print("Usage: python demo.py [path/to/YPF_DCF.xlsx]")
-        sys.exit(1)
-
-    print(f"Loading model from: {filepath}")
-    model = YPFModel(filepath)
+def show(model: YPFModel):
+    """Print the key outputs of a loaded model."""
     print(model)
     print(f"Schedules: {[s.SCHEDULE_NAME for s in model.all_schedules]}")
 
@@ -120,5 +100,30 @@ def main():
     print("\n\nDone. All 14 schedules loaded successfully.")
 
 
+def main():
+    # Default: try Excel first, fall back to CSV
+    if len(sys.argv) > 1:
+        filepath = sys.argv[1]
+    else:
+        filepath = None
+        candidates = [
+            "/mnt/user-data/uploads/YPF_DCF__1_.xlsx",
+            "model_data.csv",
+            "../model_data.csv",
+        ]
+        for c in candidates:
+            if os.path.exists(c):
+                filepath = c
+                break
+
+    if filepath is None:
+        print("ERROR: No data file found. Provide a path as argument.")
+        print("Usage: python -m DCF_model.demo [path/to/YPF_DCF.xlsx]")
+        sys.exit(1)
+
+    print(f"Loading model from: {filepath}")
+    show(YPFModel(filepath))
+
+
 if __name__ == "__main__":
     main()
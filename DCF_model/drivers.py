@@ -0,0 +1,299 @@
+"""
+Driver bridge: from input drivers to the DCF valuation.
+
+The schedules hold precomputed values, so changing a driver such as an oil
+price or an inflation path does not by itself move anything downstream.
+DriverModel links the drivers to free cash flow with a small set of
+relationships calibrated on the loaded model, so that the base drivers
+reproduce the model's own FCF (and DCFValuation's EV) exactly:
+
+    upstream revenue   Σ_p rev_p · price_p/price_p⁰ · vol_p/vol_p⁰ · I(volumes_growth)
+    other revenue      scales with macro oil_prices
+    ARS-linked costs   · I(argentina_inflation) / (fx_rate/fx⁰ · I(depreciation_rate))
+    USD-linked costs   · I(usa_inflation)
+    oil-linked costs   · oil_prices / oil_prices⁰
+    royalties          · upstream revenue / upstream revenue⁰
+    NOPAT              + Δ(revenue − costs) · NOPAT/EBIT
+    working capital    balance_i · days_i/days_i⁰ · revenue/revenue⁰, CF = −Δ balance
+
+where x⁰ is the base value and I(r) the cumulative index Π(1 + r) of a rate
+driver relative to its base path.  Every driver is a projected-years vector.
+
+evaluate() takes arrays with any leading batch shape (…, years), so a whole
+set of bumped or solved inputs is one call; it also accepts autodiff.Dual
+inputs, which is how gradients are taken.
+
+Usage:
+    from DCF_model.drivers import DriverModel
+    dm = DriverModel(model, wacc=0.10)
+    out = dm.evaluate({"macro.fx_rate": dm.base["macro.fx_rate"] * 1.1})
+    out["enterprise_value"]
+"""
+
+import numpy as np
+
+from .multi_sheet_loader import HISTORICAL_YEARS, PROJECTED_YEARS
+from .valuation import _check_rates, discount_factors, free_cash_flow, terminal_multiple
+
+_OIL  = "Oil Revenue Schedule"
+_PROD = "Production Costs Expenses Schedule"
+_WC   = "Working Capital Schedule"
+_IS   = "Income Statement"
+_CF   = "Cash Flow Statement"
+_BS   = "Balance Sheet"
+_DEBT = "Debt and Interest Schedule"
+_EQ   = "Shareholders' Equity Schedule"
+
+
+class Driver:
+    """An input series: label (schedule summary path), source field and kind."""
+
+    def __init__(self, label: str, sheet: str, key: str, kind: str = "level"):
+        self.label = label
+        self.sheet = sheet
+        self.key = key
+        self.kind = kind   # "level" (value) or "rate" (compounded into an index)
+
+    def __repr__(self):
+        return f"<Driver: {self.label}>"
+
+
+_PRODUCTS = ("oil_and_consolidates", "ngl", "natural_gas")
+
+# days_in key → (balance-sheet field, +1 asset / −1 liability)
+_WC_BALANCES = {
+    "current": {
+        "trade_receivables":    ("ca_trade_receivables", 1),
+        "contract_asset":       ("ca_contract_asset", 1),
+        "other_receivables":    ("ca_other_receivables", 1),
+        "inventories":          ("ca_inventories", 1),
+        "accounts_payable":     ("cl_accounts_payable", -1),
+        "other_liabilities":    ("cl_other_liabilities", -1),
+        "lease_liabilities":    ("cl_lease_liabilities", -1),
+        "salaries":             ("cl_salaries_ss", -1),
+        "taxes":                ("cl_taxes_payable", -1),
+        "income_tax":           ("cl_income_tax_payable", -1),
+        "contract_liabilities": ("cl_contract_liabilities", -1),
+        "provisions":           ("cl_provisions", -1),
+    },
+    "non_current": {
+        "trade_receivables":    ("nca_trade_receivables", 1),
+        "other_receivables":    ("nca_other_receivables", 1),
+        "accounts_payable":     ("ncl_accounts_payable", -1),
+        "other_liabilities":    ("ncl_other_liabilities", -1),
+        "lease_liabilities":    ("ncl_lease_liabilities", -1),
+        "salaries":             ("ncl_salaries_ss", -1),
+        "taxes":                ("ncl_taxes_payable", -1),
+        "income_tax":           ("ncl_income_tax_payable", -1),
+        "contract_liabilities": ("ncl_contract_liabilities", -1),
+        "provisions":           ("ncl_provisions", -1),
+    },
+}
+_DAYS_PREFIX = {"current": "days_c", "non_current": "days_nc"}
+
+DRIVERS: list[Driver] = [
+    Driver("macro.oil_prices",          _PROD, "macro_oil_prices"),
+    Driver("macro.volumes_growth",      _PROD, "macro_volumes_growth", "rate"),
+    Driver("macro.argentina_inflation", _PROD, "macro_argentina_inflation", "rate"),
+    Driver("macro.usa_inflation",       _PROD, "macro_usa_inflation", "rate"),
+    Driver("macro.fx_rate",             _PROD, "macro_fx_rate"),
+    Driver("macro.depreciation_rate",   _PROD, "macro_depreciation_rate", "rate"),
+    *(Driver(f"pricing.{p}", _OIL, f"price_{p}") for p in _PRODUCTS),
+    *(Driver(f"volumes.{p}", _OIL, f"vol_{p}") for p in _PRODUCTS),
+    *(Driver(f"days_in.{group}.{item}", _WC, f"{_DAYS_PREFIX[group]}_{item}")
+      for group, items in _WC_BALANCES.items() for item in items),
+]
+
+_ARG_COSTS = ("arg_salaries", "arg_other_personnel", "arg_rental", "arg_transportation",
+              "arg_preservation_repair", "arg_operation_services", "arg_taxes_charges")
+_USA_COSTS = ("usa_industrial_inputs", "usa_insurance")
+
+
+def _cumprod(x):
+    return x.cumprod(axis=-1)   # ndarray or autodiff.Dual
+
+
+def _inverse(base: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(1/base, offset) so x·inv + offset is x/base, or 1 where base is 0."""
+    nonzero = base != 0
+    inv = np.divide(1.0, base, out=np.zeros_like(base), where=nonzero)
+    return inv, (~nonzero).astype(float)
+
+
+class DriverModel:
+    """
+    Calibrated driver → FCF → valuation bridge for one model (or Scenario).
+
+    base      – {label: projected-years array} of the model's own drivers
+    drivers   – the Driver entries found in the model (missing fields dropped)
+    """
+
+    def __init__(self, model, wacc: float = 0.10, terminal_growth: float = 0.02,
+                 drivers: list[Driver] | None = None):
+        _check_rates(wacc, terminal_growth)
+        self.loader = getattr(model, "loader", model)
+        self.wacc = wacc
+        self.terminal_growth = terminal_growth
+        self.years = list(getattr(self.loader, "PROJECTED_YEARS", PROJECTED_YEARS))
+        self.valuation_year = getattr(self.loader, "HISTORICAL_YEARS", HISTORICAL_YEARS)[-1]
+
+        self.drivers = []
+        self.base: dict[str, np.ndarray] = {}
+        for d in DRIVERS if drivers is None else drivers:
+            series = self._series(d.sheet, d.key)
+            if series is not None:
+                self.drivers.append(d)
+                self.base[d.label] = series
+        self._kind = {d.label: d.kind for d in self.drivers}
+        # Per-driver (1/x⁰, offset) for levels, (1/(1 + r⁰), offset) for rates
+        self._inv = {
+            label: _inverse(x if self._kind[label] == "level" else 1.0 + x)
+            for label, x in self.base.items()
+        }
+        self._calibrate()
+
+    def _series(self, sheet: str, key: str, years: list[int] | None = None
+                ) -> np.ndarray | None:
+        try:
+            series = self.loader.field(sheet, key)
+        except KeyError:
+            return None
+        return np.array([series.get(y, 0.0) for y in (years or self.years)], dtype=float)
+
+    def _zeros_or(self, sheet: str, key: str, years: list[int] | None = None) -> np.ndarray:
+        s = self._series(sheet, key, years)
+        return s if s is not None else np.zeros(len(years or self.years))
+
+    def _calibrate(self):
+        """Base quantities every evaluation is measured against."""
+        f = self._zeros_or
+        self._up_rev = {p: f(_OIL, f"rev_{p}") for p in _PRODUCTS}
+        self._up_total = sum(self._up_rev.values())
+        self._up_inv = _inverse(self._up_total)
+        self._revenue = f(_IS, "revenue")
+        self._rev_inv = _inverse(self._revenue)[0]
+        self._other_rev = self._revenue - self._up_total
+
+        self._arg_cost = np.abs(sum(f(_PROD, k) for k in _ARG_COSTS))
+        self._usa_cost = np.abs(sum(f(_PROD, k) for k in _USA_COSTS))
+        self._oil_cost = np.abs(f(_PROD, "oil_fuel_gas_energy"))
+        self._royalties = np.abs(f(_PROD, "royalties_total"))
+
+        nopat, ebit = f(_IS, "nopat"), f(_IS, "ebit")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(ebit != 0, nopat / ebit, 1.0)
+        self._after_tax = np.clip(ratio, 0.0, 1.0)
+
+        self._fcf = free_cash_flow(nopat, f(_IS, "da"), f(_CF, "working_capital"),
+                                   f(_CF, "capex"))
+
+        # Working-capital balances, signed so that Σ = net working capital
+        self._wc = {}
+        for group, items in _WC_BALANCES.items():
+            for item, (bs_key, sign) in items.items():
+                label = f"days_in.{group}.{item}"
+                if label in self.base:
+                    self._wc[label] = sign * np.abs(f(_BS, bs_key))
+        # (x @ _diff)_t = x_t − x_{t−1}, with x_{-1} = 0 (valuation year unchanged)
+        n = len(self.years)
+        self._diff = np.eye(n) - np.eye(n, k=1)
+
+        v = [self.valuation_year]
+        self.net_debt = float(f(_DEBT, "totals_total_loans_revolver", v)[0]
+                              - f(_BS, "ca_cash", v)[0])
+        self.shares = float(f(_EQ, "shares_ending", v)[0])
+
+    # ── Building blocks ──────────────────────────────────────────────────────
+
+    def _ratio(self, inputs: dict, label: str):
+        """x / x⁰ for a level driver, I(r)/I(r⁰) for a rate driver (1 if absent)."""
+        if label not in self.base:
+            return 1.0
+        x = inputs.get(label, self.base[label])
+        inv, off = self._inv[label]
+        if self._kind[label] == "rate":
+            return _cumprod((1.0 + x) * inv + off)
+        return x * inv + off
+
+    def ev_weights(self, wacc=None, terminal_growth=None) -> np.ndarray:
+        """EV = FCF · weights: end-of-year discount factors plus the terminal value."""
+        w = np.asarray(self.wacc if wacc is None else wacc, dtype=float)[..., None]
+        g = np.asarray(self.terminal_growth if terminal_growth is None
+                       else terminal_growth, dtype=float)[..., None]
+        w, g = np.broadcast_arrays(w, g)
+        df = discount_factors(w[..., 0], len(self.years))
+        weights = df.copy()
+        weights[..., -1] += df[..., -1] * terminal_multiple(w, g)[..., 0]
+        return weights
+
+    def ev_weight_derivatives(self, wacc=None, terminal_growth=None
+                              ) -> tuple[np.ndarray, np.ndarray]:
+        """(d weights / d wacc, d weights / d terminal_growth), shaped like ev_weights()."""
+        w = np.asarray(self.wacc if wacc is None else wacc, dtype=float)[..., None]
+        g = np.asarray(self.terminal_growth if terminal_growth is None
+                       else terminal_growth, dtype=float)[..., None]
+        w, g = np.broadcast_arrays(w, g)
+        t = np.arange(1, len(self.years) + 1)
+        df = discount_factors(w[..., 0], len(self.years))
+        d_df = -t * df / (1.0 + w)
+        tv_mult = terminal_multiple(w, g)[..., 0]
+        d_w = d_df.copy()
+        d_w[..., -1] += d_df[..., -1] * tv_mult - df[..., -1] * ((1.0 + g) / (w - g) ** 2)[..., 0]
+        d_g = np.zeros_like(df)
+        d_g[..., -1] = df[..., -1] * ((1.0 + w) / (w - g) ** 2)[..., 0]
+        return d_w, d_g
+
+    # ── Evaluation ───────────────────────────────────────────────────────────
+
+    def free_cash_flow(self, inputs: dict | None = None):
+        """Projected FCF for the given driver overrides ({label: (…, years)})."""
+        inputs = inputs or {}
+        r = lambda label: self._ratio(inputs, label)
+
+        oil = r("macro.oil_prices")
+        volume_index = r("macro.volumes_growth")
+        up_rev = sum(self._up_rev[p] * r(f"pricing.{p}") * r(f"volumes.{p}")
+                     for p in _PRODUCTS) * volume_index
+        d_rev = (up_rev - self._up_total) + self._other_rev * (oil - 1.0)
+
+        fx = r("macro.fx_rate") * r("macro.depreciation_rate")
+        up_inv, up_off = self._up_inv
+        d_cost = (self._arg_cost * (r("macro.argentina_inflation") / fx - 1.0)
+                  + self._usa_cost * (r("macro.usa_inflation") - 1.0)
+                  + self._oil_cost * (oil - 1.0)
+                  + self._royalties * (up_rev * up_inv + up_off - 1.0))
+        d_nopat = (d_rev - d_cost) * self._after_tax
+
+        rev_ratio = 1.0 + d_rev * self._rev_inv
+        d_nwc = sum(balance * (r(label) * rev_ratio - 1.0)
+                    for label, balance in self._wc.items())
+        d_cf_wc = -(d_nwc @ self._diff) if self._wc else 0.0
+        return self._fcf + d_nopat + d_cf_wc
+
+    def evaluate(self, inputs: dict | None = None, wacc=None, terminal_growth=None) -> dict:
+        """
+        Valuation outputs for driver overrides {label: array (…, years)}; labels
+        not given keep their base path.  wacc / terminal_growth may be arrays
+        broadcasting against the batch shape.
+        """
+        fcf = self.free_cash_flow(inputs)
+        weights = self.ev_weights(wacc, terminal_growth)
+        if weights.ndim == 1:
+            ev = fcf @ weights
+        else:
+            ev = (fcf * weights).sum(axis=-1)
+        equity = ev - self.net_debt
+        price = equity * (1.0 / self.shares) if self.shares else equity * np.nan
+        return {
+            "free_cash_flow":   fcf,
+            "enterprise_value": ev,
+            "equity_value":     equity,
+            "price_per_share":  price,
+        }
+
+    def stack(self, n: int) -> dict[str, np.ndarray]:
+        """n copies of the base drivers as {label: (n, years)} arrays to edit in place."""
+        return {label: np.tile(x, (n, 1)) for label, x in self.base.items()}
+
+    def __repr__(self):
+        return f"<DriverModel: {len(self.drivers)} drivers, {len(self.years)} years>"
@@ -0,0 +1,289 @@
+"""
+Accounting integrity checks for the YPF DCF Model.
+
+Each identity states that a reported total equals the sum of its parts
+(optionally across schedules), e.g. ca_total = Σ current assets or
+CF ending cash = BS cash.  All identities are compiled once into a
+coefficient matrix A (identities × fields); a model's fields are gathered
+into X (fields × years), so every residual for every year comes out of a
+single product R = A @ X.  A residual is a violation when
+
+    |R| > abs_tol + rel_tol · Σ|terms|
+
+Years where a term is missing are not evaluated.
+
+Usage:
+    from DCF_model.integrity import check_integrity
+    report = check_integrity(model)
+    if not report.ok:
+        print(report.format())
+"""
+
+import numpy as np
+
+from . import timings
+
+_OIL       = "Oil Revenue Schedule"
+_CRUDE     = "Crude Products Revenue Schedule"
+_OTHER     = "Other Products Revenue Schedule"
+_DOWN      = "Downstream Revenue Schedule"
+_TOTAL_REV = "Total Revenue Schedule"
+_PROD      = "Production Costs Expenses Schedule"
+_SA        = "S&A Expenses Schedule"
+_IS        = "Income Statement"
+_CF        = "Cash Flow Statement"
+_BS        = "Balance Sheet"
+_FA        = "Fixed Assets (PP&E) Schedule"
+_DEBT      = "Debt and Interest Schedule"
+
+
+class Identity:
+    """total = Σ coef · part, where each term is a (sheet, field_key) pair."""
+
+    def __init__(self, name: str, total: tuple[str, str],
+                 parts: list[tuple[str, str] | tuple[str, str, float]]):
+        self.name = name
+        self.total = total
+        self.parts = [p if len(p) == 3 else (p[0], p[1], 1.0) for p in parts]
+
+    def __repr__(self):
+        return f"<Identity: {self.name}>"
+
+
+def _sum(sheet: str, total: str, parts: list[str]) -> Identity:
+    """Same-sheet subtotal: total = Σ parts."""
+    return Identity(f"{sheet}: {total}", (sheet, total), [(sheet, p) for p in parts])
+
+
+def _split(sheet: str, prefixes: list[str], kinds=("vol", "rev")) -> list[Identity]:
+    """Domestic + export = total for each product prefix."""
+    return [
+        _sum(sheet, f"{kind}_{p}_total", [f"{kind}_{p}_domestic", f"{kind}_{p}_export"])
+        for p in prefixes for kind in kinds
+    ]
+
+
+_CRUDE_PRODUCTS = ["diesel", "gasoline", "jet", "fueloil"]
+
+IDENTITIES: list[Identity] = [
+    # ── Revenue build-up ──
+    _sum(_OIL, "rev_total", ["rev_oil_and_consolidates", "rev_ngl", "rev_natural_gas"]),
+    *_split(_CRUDE, _CRUDE_PRODUCTS),
+    _sum(_CRUDE, "rev_total", [f"rev_{p}_total" for p in _CRUDE_PRODUCTS]),
+    *_split(_OTHER, ["naphtha", "petrochem", "fert"]),
+    _sum(_DOWN, "rev_subtotal_1",
+         ["rev_lubricants_byproducts", "rev_petroleum_coke", "rev_lpg", "rev_asphalts"]),
+    *_split(_TOTAL_REV, ["ng", "crude"]),
+    _sum(_TOTAL_REV, "other_rev_subtotal",
+         ["other_rev_gas_stations", "other_rev_construction_contracts",
+          "other_rev_lng_regasification", "other_rev_other_goods_services"]),
+    Identity("Income Statement revenue = Total Revenue Schedule",
+             (_IS, "revenue"), [(_TOTAL_REV, "total_revenue")]),
+
+    # ── Costs ──
+    _sum(_PROD, "royalties_total", ["royalties_easements", "fees_compensation"]),
+    _sum(_SA, "sell_total",
+         ["sell_salaries", "sell_fees", "sell_other_personnel", "sell_taxes",
+          "sell_royalties", "sell_insurance", "sell_rental", "sell_industrial_inputs",
+          "sell_operation_services", "sell_preservation", "sell_transportation",
+          "sell_publicity", "sell_doubtful_receivables", "sell_fuel_gas_energy"]),
+    _sum(_SA, "admin_total",
+         ["admin_salaries", "admin_fees", "admin_other_personnel", "admin_taxes",
+          "admin_operation_services", "admin_preservation", "admin_publicity",
+          "admin_other", "admin_fuel_gas_energy"]),
+
+    # ── Cash flow ──
+    _sum(_CF, "cf_operating_total",
+         ["net_income", "equity_interests", "depreciation_ppe", "amortization_ia",
+          "depreciation_rou", "retirement_ppe", "impairment", "income_tax_charge",
+          "provisions", "fx_interest_other", "working_capital"]),
+    _sum(_CF, "cf_investing_total", ["capex", "assets_held_for_sale", "acquisitions_jv"]),
+    _sum(_CF, "cf_financing_total",
+         ["loan_payments", "loan_proceeds", "interest_payments", "overdraft",
+          "buyback", "lease_payments"]),
+    _sum(_CF, "change_in_cash",
+         ["cf_operating_total", "cf_investing_total", "cf_financing_total"]),
+    _sum(_CF, "ending_cash", ["beginning_cash", "change_in_cash"]),
+    Identity("Cash Flow Statement ending cash = Balance Sheet cash",
+             (_CF, "ending_cash"), [(_BS, "ca_cash")]),
+
+    # ── Balance sheet ──
+    _sum(_BS, "ca_total",
+         ["ca_cash", "ca_investments", "ca_trade_receivables", "ca_contract_asset",
+          "ca_other_receivables", "ca_inventories", "ca_assets_held_for_sale"]),
+    _sum(_BS, "total_assets",
+         ["ca_total", "nca_financial_investments", "nca_trade_receivables",
+          "nca_other_receivables", "nca_deferred_tax_asset", "nca_associates_jv",
+          "nca_rou_assets", "nca_ppe", "nca_intangible"]),
+    _sum(_BS, "cl_total",
+         ["cl_accounts_payable", "cl_other_liabilities", "cl_loans",
+          "cl_lease_liabilities", "cl_salaries_ss", "cl_taxes_payable",
+          "cl_income_tax_payable", "cl_contract_liabilities", "cl_provisions",
+          "cl_liab_held_for_sale"]),
+    _sum(_BS, "ncl_total",
+         ["ncl_accounts_payable", "ncl_other_liabilities", "ncl_loans",
+          "ncl_lease_liabilities", "ncl_salaries_ss", "ncl_taxes_payable",
+          "ncl_income_tax_payable", "ncl_deferred_tax_liabilities",
+          "ncl_contract_liabilities", "ncl_provisions"]),
+    _sum(_BS, "eq_total", ["eq_common_stock", "eq_retained_earnings", "eq_minority_interest"]),
+    _sum(_BS, "total_liabilities_and_equity", ["cl_total", "ncl_total", "eq_total"]),
+    Identity("Balance Sheet: total_assets = total_liabilities_and_equity",
+             (_BS, "total_assets"), [(_BS, "total_liabilities_and_equity")]),
+    Identity("Balance Sheet: check = 0", (_BS, "check"), []),
+
+    # ── Supporting schedules ──
+    _sum(_FA, "ppe_depr_total",
+         ["ppe_depr_production_costs", "ppe_depr_selling", "ppe_depr_admin"]),
+    _sum(_FA, "ppe_amort_total",
+         ["ppe_amort_production_costs", "ppe_amort_selling", "ppe_amort_admin"]),
+    _sum(_FA, "rou_depr_total", ["rou_depr_production_costs", "rou_depr_selling"]),
+    _sum(_DEBT, "cash_ending", ["cash_beginning", "cash_change"]),
+    _sum(_DEBT, "loans_ending", ["loans_beginning", "loans_additions_repayments"]),
+    _sum(_DEBT, "revolver_ending", ["revolver_beginning", "revolver_change"]),
+    _sum(_DEBT, "totals_total_loans_revolver",
+         ["totals_st_loans_revolver", "totals_lt_loans_revolver"]),
+]
+
+
+# ─────────────────────────────────────────────────────────
+# Report
+# ─────────────────────────────────────────────────────────
+class IntegrityReport:
+    """
+    Result of one check.  residuals is an (identities × years) array of
+    total − Σ parts, NaN where the identity could not be evaluated.
+    """
+
+    def __init__(self, identities: list[Identity], years: list[int],
+                 residuals: np.ndarray, totals: np.ndarray, violated: np.ndarray):
+        self.identities = identities
+        self.years = years
+        self.residuals = residuals
+        self._totals = totals
+        self._violated = violated
+
+    @property
+    def ok(self) -> bool:
+        return not self._violated.any()
+
+    @property
+    def violations(self) -> list[dict]:
+        """One entry per failing (identity, year), in declaration order."""
+        out = []
+        for i, j in zip(*np.nonzero(self._violated)):
+            total, diff = float(self._totals[i, j]), float(self.residuals[i, j])
+            out.append({
+                "identity": self.identities[i].name,
+                "year":     self.years[j],
+                "reported": total,
+                "expected": total - diff,
+                "diff":     diff,
+            })
+        return out
+
+    @property
+    def skipped(self) -> list[str]:
+        """Identities that could not be evaluated for any year."""
+        return [ident.name for ident, row in zip(self.identities, self.residuals)
+                if np.isnan(row).all()]
+
+    def summary(self) -> dict:
+        evaluated = int((~np.isnan(self.residuals)).sum())
+        return {
+            "identities": len(self.identities),
+            "evaluated":  evaluated,
+            "violations": self.violations,
+            "skipped":    self.skipped,
+        }
+
+    def format(self, limit: int | None = None) -> str:
+        """One line per violation / skipped identity; at most `limit` lines."""
+        lines = []
+        for v in self.violations:
+            lines.append(f"  {v['year']}  {v['identity']}: reported {v['reported']:,.2f}, "
+                         f"expected {v['expected']:,.2f} (diff {v['diff']:+,.2f})")
+        for name in self.skipped:
+            lines.append(f"  skipped  {name}: fields missing")
+        if limit is not None and len(lines) > limit:
+            lines = lines[:limit] + [f"  ... {len(lines) - limit} more"]
+        return "\n".join(lines)
+
+    def __repr__(self):
+        n = int(self._violated.sum())
+        return f"<IntegrityReport: {len(self.identities)} identities, {n} violations>"
+
+
+# ─────────────────────────────────────────────────────────
+# Checker
+# ─────────────────────────────────────────────────────────
+class IntegrityChecker:
+    """
+    Compiles a list of identities into a coefficient matrix once; check()
+    can then be called on any number of models.
+    """
+
+    def __init__(self, identities: list[Identity] | None = None,
+                 abs_tol: float = 0.5, rel_tol: float = 1e-4):
+        self.identities = IDENTITIES if identities is None else identities
+        self.abs_tol = abs_tol
+        self.rel_tol = rel_tol
+
+        # Every distinct (sheet, key) becomes one row of X
+        index: dict[tuple[str, str], int] = {}
+        for ident in self.identities:
+            for sheet, key in [ident.total] + [p[:2] for p in ident.parts]:
+                index.setdefault((sheet, key), len(index))
+        self.fields = list(index)
+
+        self._coef = np.zeros((len(self.identities), len(index)))
+        self._total_idx = np.empty(len(self.identities), dtype=np.intp)
+        for i, ident in enumerate(self.identities):
+            t = index[ident.total]
+            self._total_idx[i] = t
+            self._coef[i, t] += 1.0
+            for sheet, key, coef in ident.parts:
+                self._coef[i, index[(sheet, key)]] -= coef
+        self._uses = (self._coef != 0).astype(float)
+        self._abs_coef = np.abs(self._coef)
+
+    def _matrix(self, loader, years: list[int]) -> np.ndarray:
+        """Gather every field into a (fields × years) array, NaN where missing."""
+        x = np.full((len(self.fields), len(years)), np.nan)
+        for r, (sheet, key) in enumerate(self.fields):
+            try:
+                series = loader.field(sheet, key)
+            except KeyError:
+                continue
+            x[r] = [series.get(y, np.nan) for y in years]
+        return x
+
+    def check(self, model) -> IntegrityReport:
+        """Evaluate every identity for every year of a YPFModel (or loader)."""
+        loader = getattr(model, "loader", model)
+        years = list(loader.ALL_YEARS)
+        with timings.span("integrity"):
+            x = self._matrix(loader, years)
+            missing = np.isnan(x)
+            filled = np.where(missing, 0.0, x)
+
+            residuals = self._coef @ filled
+            scale = self._abs_coef @ np.abs(filled)
+            # Any missing term makes the identity unevaluable for that year
+            residuals[(self._uses @ missing) > 0] = np.nan
+
+            with np.errstate(invalid="ignore"):
+                violated = np.abs(residuals) > self.abs_tol + self.rel_tol * scale
+        return IntegrityReport(self.identities, years, residuals,
+                               filled[self._total_idx], violated)
+
+
+_default_checker: IntegrityChecker | None = None
+
+
+def check_integrity(model, abs_tol: float = 0.5, rel_tol: float = 1e-4) -> IntegrityReport:
+    """Check a model against the built-in IDENTITIES (compiled once per process)."""
+    global _default_checker
+    if (_default_checker is None or _default_checker.abs_tol != abs_tol
+            or _default_checker.rel_tol != rel_tol):
+        _default_checker = IntegrityChecker(abs_tol=abs_tol, rel_tol=rel_tol)
+    return _default_checker.check(model)
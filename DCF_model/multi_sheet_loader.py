@@ -8,76 +8,272 @@ Sheet format:
     Row 2+: field_key | val  | val  | ... | val
 """
 
+import hashlib
+import importlib.util
+import io
+import json
 import os
 
-try:
-    import openpyxl
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
+from . import timings
+from .series import Series, year_axis
+from .xlsx_reader import XlsxReader
+
+# openpyxl is imported lazily where it is used – it is slow to import and not
+# needed at all with the "xml" engine
+HAS_OPENPYXL = importlib.util.find_spec("openpyxl") is not None
 
 
 HISTORICAL_YEARS = [2020, 2021, 2022, 2023, 2024]
 PROJECTED_YEARS  = [2025, 2026, 2027, 2028, 2029, 2030, 2031, 2032, 2033, 2034]
 ALL_YEARS        = HISTORICAL_YEARS + PROJECTED_YEARS
 
+ENGINES = ("openpyxl", "xml")
+
+
+def _to_series(data: dict[str, dict[int, float]]) -> dict[str, Series]:
+    """Pack one parsed sheet into Series sharing the sheet's year axis."""
+    axis = year_axis(y for values in data.values() for y in values)
+    return {key: Series.from_dict(values, axis) for key, values in data.items()}
+
+
+def _parse_rows(rows, keep: frozenset[str] | None = None) -> dict[str, Series]:
+    """
+    Parse one sheet's value rows → {field_key: Series}.
+    If keep is given, rows whose key is not in it are skipped.
+    """
+    rows = iter(rows)
+    year_row = next(rows, None)
+    if year_row is None:
+        return {}
+
+    # Row 0: year header — col 0 is the label column, col 1+ are years
+    years = []
+    for v in year_row[1:]:
+        if isinstance(v, (int, float)) and 2000 <= int(v) <= 2100:
+            years.append(int(v))
+
+    data = {}
+    for row in rows:
+        if not row or row[0] is None:
+            continue
+        key = str(row[0]).strip()
+        if keep is not None and key not in keep:
+            continue
+        values: dict[int, float] = {}
+        for i, year in enumerate(years):
+            raw = row[i + 1] if i + 1 < len(row) else None
+            if raw is not None:
+                try:
+                    values[year] = float(raw)
+                except (TypeError, ValueError):
+                    pass
+        data[key] = values
+
+    return _to_series(data)
+
+
+def _parse_cells(cells, keep: frozenset[str] | None = None) -> dict[str, Series]:
+    """
+    Parse one sheet from a stream of (row, col, value) tuples – same result as
+    _parse_rows, without materialising rows.  Used by the "xml" engine.
+    """
+    # Row 1: year header – the i-th year found reads column i + 2, as in _parse_rows
+    year_at_col: dict[int, int] = {}
+    data = {}
+    values: dict[int, float] | None = None
+    cur_row = 0
+    for r, c, v in cells:
+        if r == 1:
+            if c > 1 and isinstance(v, (int, float)) and 2000 <= int(v) <= 2100:
+                year_at_col[len(year_at_col) + 2] = int(v)
+            continue
+        if r != cur_row:
+            # First cell of a new row: only rows with a key in col A are kept
+            cur_row = r
+            values = None
+            if c == 1:
+                key = str(v).strip()
+                if keep is None or key in keep:
+                    values = data[key] = {}
+                continue
+        if values is None:
+            continue
+        year = year_at_col.get(c)
+        if year is not None:
+            try:
+                values[year] = float(v)
+            except (TypeError, ValueError):
+                pass
+
+    return _to_series(data)
+
+
+def _load_sheets(filepath: str, sheet_names: list[str], engine: str = "openpyxl",
+                 projection: dict[str, frozenset[str]] | None = None
+                 ) -> dict[str, dict[str, Series]]:
+    """
+    Worker entry point for parallel loading: open the workbook independently
+    and parse only the given sheets.  Must stay module-level so it pickles.
+    """
+    keep = (projection or {}).get
+    if engine == "xml":
+        with XlsxReader(filepath) as reader:
+            return {name: _parse_cells(reader.iter_cells(name, _key_filter(keep(name))),
+                                       keep(name))
+                    for name in sheet_names}
+
+    import openpyxl
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        return {name: _parse_rows(wb[name].iter_rows(values_only=True), keep(name))
+                for name in sheet_names}
+    finally:
+        wb.close()
+
+
+def _key_filter(keep: frozenset[str] | None):
+    """XlsxReader key_filter for a projected sheet (None when unprojected)."""
+    if keep is None:
+        return None
+    return lambda v: str(v).strip() in keep
+
+
+def read_projection(path: str) -> dict[str, frozenset[str]]:
+    """
+    Read a projection manifest – {sheet_name: [field_key, ...]} – from JSON.
+    An access report written by MultiSheetLoader.write_access_report() is
+    accepted too; its "projection" entry is used.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    data = data.get("projection", data)
+    return {sheet: frozenset(keys) for sheet, keys in data.items()}
+
 
 class MultiSheetLoader:
     """
     Reads a multi-sheet Excel workbook.  Each sheet holds one schedule's data
     as a flat table: col A = field key, row 1 = year headers, cells = values.
+
+    Pass workers > 1 (or None for one per CPU) to parse sheets concurrently in
+    a process pool; each worker opens the archive itself and parses its share
+    of the sheets, so wall time tends towards the slowest sheet rather than
+    the sum of all sheets.
+
+    engine="xml" reads values with the built-in XlsxReader instead of openpyxl,
+    skipping the style and cell object graphs entirely.
+
+    trace_access=True counts every field() hit per (sheet, key); the counts
+    become an access report and a projection manifest of the fields actually
+    used.  Passing that manifest back as projection= makes the loader skip
+    every other sheet and row while parsing.
+
+    data= parses the workbook from bytes already read (filepath then only
+    names it); they are dropped once parsed.
+
+    apply() patches the parsed store with a Delta (see delta.py), replacing
+    each touched series with a new one;
+    revision counts the deltas applied and patch_digest identifies them.
     """
 
     HISTORICAL_YEARS = HISTORICAL_YEARS
     PROJECTED_YEARS  = PROJECTED_YEARS
     ALL_YEARS        = ALL_YEARS
 
-    def __init__(self, filepath: str):
-        if not HAS_OPENPYXL:
+    def __init__(self, filepath: str, workers: int | None = 1, engine: str = "openpyxl",
+                 projection: dict[str, frozenset[str]] | None = None,
+                 trace_access: bool = False, data: bytes | None = None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unsupported engine: {engine}")
+        if engine == "openpyxl" and not HAS_OPENPYXL:
             raise ImportError("openpyxl is required to read multi-sheet Excel files")
         self.filepath = filepath
-        # {sheet_name: {field_key: {year: float}}}
-        self._sheets: dict[str, dict[str, dict[int, float]]] = {}
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.engine = engine
+        self.projection = (
+            {sheet: frozenset(keys) for sheet, keys in projection.items()}
+            if projection is not None else None
+        )
+        # {(sheet_name, field_key): hits}, only when tracing
+        self._access: dict[tuple[str, str], int] | None = {} if trace_access else None
+        # {sheet_name: {field_key: Series}}
+        self._sheets: dict[str, dict[str, Series]] = {}
+        self._bytes = data
+        self.revision = 0
+        self.patch_digest: str | None = None
         self._load()
 
     def _load(self):
-        wb = openpyxl.load_workbook(self.filepath, data_only=True)
-        for sheet_name in wb.sheetnames:
+        with timings.span("load", os.path.basename(self.filepath)):
+            self._load_sheets()
+        self._bytes = None
+
+    def _source(self):
+        """The file to open: filepath, or the bytes passed as data."""
+        return self.filepath if self._bytes is None else io.BytesIO(self._bytes)
+
+    def _load_sheets(self):
+        if self.workers > 1:
+            self._load_parallel()
+            return
+        if self.engine == "xml":
+            with XlsxReader(self._source()) as reader:
+                for sheet_name in self._projected(reader.sheetnames):
+                    keep = self._keep(sheet_name)
+                    self._sheets[sheet_name] = _parse_cells(
+                        reader.iter_cells(sheet_name, _key_filter(keep)), keep)
+            return
+        import openpyxl
+        wb = openpyxl.load_workbook(self._source(), data_only=True)
+        for sheet_name in self._projected(wb.sheetnames):
             ws = wb[sheet_name]
             self._sheets[sheet_name] = self._parse_sheet(ws)
 
-    def _parse_sheet(self, ws) -> dict[str, dict[int, float]]:
-        """Parse one sheet → {field_key: {year: value}}."""
-        rows = list(ws.iter_rows(values_only=True))
-        if not rows:
-            return {}
-
-        # Row 0: year header — col 0 is the label column, col 1+ are years
-        year_row = rows[0]
-        years = []
-        for v in year_row[1:]:
-            if isinstance(v, (int, float)) and 2000 <= int(v) <= 2100:
-                years.append(int(v))
-
-        data = {}
-        for row in rows[1:]:
-            if not row or row[0] is None:
-                continue
-            key = str(row[0]).strip()
-            values: dict[int, float] = {}
-            for i, year in enumerate(years):
-                raw = row[i + 1] if i + 1 < len(row) else None
-                if raw is not None:
-                    try:
-                        values[year] = float(raw)
-                    except (TypeError, ValueError):
-                        pass
-            data[key] = values
-
-        return data
-
-    def field(self, sheet_name: str, key: str) -> dict[int, float]:
-        """Return {year: value} for the given sheet + field key."""
+    def _projected(self, sheet_names: list[str]) -> list[str]:
+        if self.projection is None:
+            return sheet_names
+        return [name for name in sheet_names if name in self.projection]
+
+    def _keep(self, sheet_name: str) -> frozenset[str] | None:
+        return self.projection.get(sheet_name) if self.projection is not None else None
+
+    def _read_sheet_names(self) -> list[str]:
+        if self.engine == "xml":
+            with XlsxReader(self._source()) as reader:
+                return reader.sheetnames
+        import openpyxl
+        wb = openpyxl.load_workbook(self._source(), read_only=True, data_only=True)
+        try:
+            return wb.sheetnames
+        finally:
+            wb.close()
+
+    def _load_parallel(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        sheet_names = self._projected(self._read_sheet_names())
+
+        # Round-robin the sheets over the workers; merge back in workbook order
+        n = min(self.workers, len(sheet_names))
+        if n <= 1:
+            self._sheets.update(
+                _load_sheets(self._source(), sheet_names, self.engine, self.projection))
+            return
+        chunks = [sheet_names[i::n] for i in range(n)]
+        parsed = {}
+        with ProcessPoolExecutor(max_workers=n) as pool:
+            for result in pool.map(_load_sheets, [self._source() for _ in range(n)], chunks,
+                                   [self.engine] * n, [self.projection] * n):
+                parsed.update(result)
+        for sheet_name in sheet_names:
+            self._sheets[sheet_name] = parsed[sheet_name]
+
+    def _parse_sheet(self, ws) -> dict[str, Series]:
+        """Parse one sheet → {field_key: Series}."""
+        return _parse_rows(ws.iter_rows(values_only=True), self._keep(ws.title))
+
+    def field(self, sheet_name: str, key: str) -> Series:
+        """Return the {year: value} Series for the given sheet + field key."""
         sheet = self._sheets.get(sheet_name)
         if sheet is None:
             raise KeyError(
@@ -86,12 +282,103 @@ class MultiSheetLoader:
             )
         series = sheet.get(key)
         if series is None:
+            if self.projection is not None:
+                raise KeyError(
+                    f"Field '{key}' in sheet '{sheet_name}' was not loaded: "
+                    f"it is missing from the projection manifest"
+                )
             raise KeyError(
                 f"Field '{key}' not found in sheet '{sheet_name}'. "
                 f"Available: {list(sheet)}"
             )
+        if self._access is not None:
+            k = (sheet_name, key)
+            self._access[k] = self._access.get(k, 0) + 1
         return series
 
     @property
     def sheet_names(self) -> list[str]:
         return list(self._sheets.keys())
+
+    # ── Access tracing ───────────────────────────────────────────────────────
+
+    def projection_manifest(self) -> dict[str, list[str]]:
+        """{sheet_name: [field_key, ...]} of every field read so far, in sheet order."""
+        if self._access is None:
+            raise RuntimeError("Access tracing is off; create the loader with trace_access=True")
+        return {
+            sheet_name: used
+            for sheet_name, fields in self._sheets.items()
+            if (used := [k for k in fields if (sheet_name, k) in self._access])
+        }
+
+    def access_report(self) -> dict:
+        """Hit counts per (sheet, key), the fields never read, and the resulting manifest."""
+        manifest = self.projection_manifest()
+        sheets = {}
+        for sheet_name, fields in self._sheets.items():
+            sheets[sheet_name] = {
+                "hits":   {k: self._access[(sheet_name, k)]
+                           for k in fields if (sheet_name, k) in self._access},
+                "unused": [k for k in fields if (sheet_name, k) not in self._access],
+            }
+        return {
+            "file":       self.filepath,
+            "fields":     sum(len(fields) for fields in self._sheets.values()),
+            "used":       len(self._access),
+            "lookups":    sum(self._access.values()),
+            "sheets":     sheets,
+            "projection": manifest,
+        }
+
+    def write_access_report(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.access_report(), f, indent=2)
+
+    # ── Incremental updates ──────────────────────────────────────────────────
+
+    def apply(self, delta) -> set[str]:
+        """
+        Patch the store with a Delta and return the sheets it touched (every
+        sheet when the year axes change).  Each touched field gets a new
+        Series; the ones already handed out keep the values they were read
+        with, so results cached against an earlier patch_digest stay valid.
+        """
+        years = sorted(set(self.ALL_YEARS) | delta.years)
+        last_actual = self.HISTORICAL_YEARS[-1] if self.HISTORICAL_YEARS else None
+        if delta.actuals_through is not None:
+            if delta.actuals_through not in years or delta.actuals_through == years[-1]:
+                raise ValueError(
+                    f"actuals_through must be a year before the last one in {years}, "
+                    f"got {delta.actuals_through}"
+                )
+            last_actual = delta.actuals_through
+
+        with timings.span("apply", f"{len(delta)} cells"):
+            touched = set()
+            for sheet_name, fields in delta.cells.items():
+                sheet = self._sheets.setdefault(sheet_name, {})
+                for key, values in fields.items():
+                    series = sheet.get(key)
+                    patched = series.to_dict() if series is not None else {}
+                    for year, value in values.items():
+                        if value is None:
+                            patched.pop(year, None)
+                        else:
+                            patched[year] = value
+                    axis = series.axis if series is not None else year_axis(self.ALL_YEARS)
+                    sheet[key] = Series.from_dict(patched, axis)
+                touched.add(sheet_name)
+
+            actuals = [y for y in years if last_actual is not None and y <= last_actual]
+            if years != self.ALL_YEARS or actuals != self.HISTORICAL_YEARS:
+                # Instance attributes: the class-level axes are shared by every loader
+                self.ALL_YEARS = years
+                self.HISTORICAL_YEARS = actuals
+                self.PROJECTED_YEARS = years[len(actuals):]
+                touched.update(self._sheets)
+
+        self.revision += 1
+        self.patch_digest = hashlib.sha256(
+            f"{self.patch_digest}:{delta.digest()}".encode()).hexdigest()
+        return touched
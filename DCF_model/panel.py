@@ -0,0 +1,215 @@
+"""
+Cross-ticker panel of model fields for comparables analysis.
+
+Stacks the same fields from many models into one (companies × fields × years)
+array on a shared year axis (NaN where a company has no value), so peer
+statistics are single numpy reductions over the company axis instead of
+Python loops over models.
+
+Usage:
+    from DCF_model.panel import Panel
+    panel = Panel.from_models({"YPF": ypf, "PAM": pam, "VIST": vista})
+
+    margins = panel.values_of("ebitda_margin")        # (companies × years)
+    panel.median("ebitda_margin")                     # peer median per year
+    panel.rank("ev_ebitda", ascending=True)           # 1 = cheapest
+    panel.top("net_debt_to_ebitda", 2024, n=10)
+    panel.save("coverage.npz")
+"""
+
+import warnings
+
+import numpy as np
+
+from .multi_sheet_loader import ALL_YEARS
+
+_IS = "Income Statement"
+_BS = "Balance Sheet"
+_EQ = "Shareholders' Equity Schedule"
+
+# label → (sheet, field_key)
+DEFAULT_FIELDS: dict[str, tuple[str, str]] = {
+    "revenue":        (_IS, "revenue"),
+    "gross_profit":   (_IS, "gross_profit"),
+    "ebitda":         (_IS, "ebitda"),
+    "da":             (_IS, "da"),
+    "ebit":           (_IS, "ebit"),
+    "net_income":     (_IS, "net_income"),
+    "nopat":          (_IS, "nopat"),
+    "cash":           (_BS, "ca_cash"),
+    "st_loans":       (_BS, "cl_loans"),
+    "lt_loans":       (_BS, "ncl_loans"),
+    "total_assets":   (_BS, "total_assets"),
+    "total_equity":   (_BS, "eq_total"),
+    "shares":         (_EQ, "shares_ending"),
+    "share_price":    (_EQ, "share_price"),
+}
+
+
+def _nan_reduce(fn, x: np.ndarray, *args) -> np.ndarray:
+    """fn(x, *args, axis=0) without numpy's all-NaN slice warnings."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return fn(x, *args, axis=0)
+
+
+def _ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = num / den
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+
+# Metrics computed from the stored fields: name → f(panel) → (companies × years)
+DERIVED = {
+    "gross_margin":       lambda p: _ratio(p["gross_profit"], p["revenue"]),
+    "ebitda_margin":      lambda p: _ratio(p["ebitda"], p["revenue"]),
+    "ebit_margin":        lambda p: _ratio(p["ebit"], p["revenue"]),
+    "net_margin":         lambda p: _ratio(p["net_income"], p["revenue"]),
+    "roe":                lambda p: _ratio(p["net_income"], p["total_equity"]),
+    "debt":               lambda p: p["st_loans"] + p["lt_loans"],
+    "net_debt":           lambda p: p["st_loans"] + p["lt_loans"] - p["cash"],
+    "net_debt_to_ebitda": lambda p: _ratio(p.values_of("net_debt"), p["ebitda"]),
+    "market_cap":         lambda p: p["shares"] * p["share_price"],
+    "enterprise_value":   lambda p: p.values_of("market_cap") + p.values_of("net_debt"),
+    "ev_ebitda":          lambda p: _ratio(p.values_of("enterprise_value"), p["ebitda"]),
+}
+
+
+class Panel:
+    """
+    values[c, f, y] for companies c, field labels f and years y.
+
+    Queries take a field label, a DERIVED metric name or a ready
+    (companies × years) array, and reduce over the company axis.
+    """
+
+    def __init__(self, companies: list[str], fields: list[str], years: list[int],
+                 values: np.ndarray):
+        values = np.asarray(values, dtype=float)
+        if values.shape != (len(companies), len(fields), len(years)):
+            raise ValueError(
+                f"values has shape {values.shape}, expected "
+                f"({len(companies)}, {len(fields)}, {len(years)})"
+            )
+        self.companies = list(companies)
+        self.fields = list(fields)
+        self.years = list(years)
+        self.values = values
+        self._company_idx = {c: i for i, c in enumerate(self.companies)}
+        self._field_idx = {f: i for i, f in enumerate(self.fields)}
+        self._year_idx = {y: i for i, y in enumerate(self.years)}
+
+    @classmethod
+    def from_models(cls, models: dict, fields: dict[str, tuple[str, str]] | None = None
+                    ) -> "Panel":
+        """Stack {company: YPFModel (or loader)} on the union of their year axes."""
+        fields = DEFAULT_FIELDS if fields is None else fields
+        loaders = {c: getattr(m, "loader", m) for c, m in models.items()}
+        years = sorted({y for ld in loaders.values()
+                        for y in getattr(ld, "ALL_YEARS", ALL_YEARS)})
+
+        values = np.full((len(loaders), len(fields), len(years)), np.nan)
+        for c, loader in enumerate(loaders.values()):
+            for f, (sheet, key) in enumerate(fields.values()):
+                try:
+                    series = loader.field(sheet, key)
+                except KeyError:
+                    continue
+                values[c, f] = [series.get(y, np.nan) for y in years]
+        return cls(list(loaders), list(fields), years, values)
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def save(self, path: str):
+        """Write the panel as a compressed .npz archive."""
+        np.savez_compressed(path, values=self.values, companies=np.array(self.companies),
+                            fields=np.array(self.fields), years=np.array(self.years))
+
+    @classmethod
+    def load(cls, path: str) -> "Panel":
+        with np.load(path) as data:
+            return cls(data["companies"].tolist(), data["fields"].tolist(),
+                       data["years"].tolist(), data["values"])
+
+    # ── Access ───────────────────────────────────────────────────────────────
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        """Stored field as a (companies × years) view."""
+        try:
+            return self.values[:, self._field_idx[field], :]
+        except KeyError:
+            raise KeyError(f"Field '{field}' not in panel. Available: {self.fields}") from None
+
+    def values_of(self, metric) -> np.ndarray:
+        """Resolve a field label, DERIVED metric name or array to (companies × years)."""
+        if not isinstance(metric, str):
+            return np.asarray(metric, dtype=float)
+        if metric in self._field_idx:
+            return self[metric]
+        if metric in DERIVED:
+            return DERIVED[metric](self)
+        raise KeyError(
+            f"Unknown metric '{metric}'. "
+            f"Available: {self.fields + sorted(DERIVED)}"
+        )
+
+    def company(self, name: str) -> dict[str, dict[int, float]]:
+        """One company's stored fields as {label: {year: value}}."""
+        row = self.values[self._company_idx[name]]
+        return {f: dict(zip(self.years, row[i].tolist())) for i, f in enumerate(self.fields)}
+
+    def _year(self, year: int) -> int:
+        try:
+            return self._year_idx[year]
+        except KeyError:
+            raise KeyError(f"Year {year} not in panel ({self.years[0]}–{self.years[-1]})") from None
+
+    # ── Peer statistics (over the company axis) ──────────────────────────────
+
+    def median(self, metric) -> dict[int, float]:
+        return dict(zip(self.years, _nan_reduce(np.nanmedian, self.values_of(metric)).tolist()))
+
+    def percentile(self, metric, q: float) -> dict[int, float]:
+        """q-th percentile (0–100) across companies, per year."""
+        return dict(zip(self.years,
+                        _nan_reduce(np.nanpercentile, self.values_of(metric), q).tolist()))
+
+    def rank(self, metric, ascending: bool = False) -> np.ndarray:
+        """(companies × years) rank within each year, 1 = best; NaN stays NaN."""
+        x = self.values_of(metric)
+        missing = np.isnan(x)
+        key = np.where(missing, np.inf, x if ascending else -x)
+        order = np.argsort(key, axis=0, kind="stable")
+        ranks = np.empty_like(x)
+        np.put_along_axis(ranks, order,
+                          np.arange(1, x.shape[0] + 1, dtype=float)[:, None], axis=0)
+        ranks[missing] = np.nan
+        return ranks
+
+    def percentile_rank(self, metric) -> np.ndarray:
+        """(companies × years) share of valid peers each company is above, 0–1."""
+        ranks = self.rank(metric, ascending=True)
+        valid = (~np.isnan(ranks)).sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (ranks - 1) / (valid - 1)
+
+    def top(self, metric, year: int, n: int = 10, ascending: bool = False
+            ) -> list[tuple[str, float]]:
+        """The n best companies in one year as [(company, value)], NaN excluded."""
+        col = self.values_of(metric)[:, self._year(year)]
+        valid = np.flatnonzero(~np.isnan(col))
+        order = valid[np.argsort(col[valid] if ascending else -col[valid], kind="stable")]
+        return [(self.companies[i], float(col[i])) for i in order[:n]]
+
+    def screen(self, mask: np.ndarray, year: int) -> list[str]:
+        """Companies for which a boolean (companies × years) mask holds in `year`."""
+        return [self.companies[i] for i in np.flatnonzero(mask[:, self._year(year)])]
+
+    def __len__(self):
+        return len(self.companies)
+
+    def __repr__(self):
+        return (f"<Panel: {len(self.companies)} companies × {len(self.fields)} fields "
+                f"× {len(self.years)} years>")
+
@@ -0,0 +1,152 @@
+"""
+Scenario overlays on top of a loaded model.
+
+A Scenario wraps a base loader (MultiSheetLoader, or another Scenario) and
+answers field() from its own sparse overrides first, falling through to the
+base otherwise.  Only the series a scenario touches are copied, so hundreds of
+scenarios can share one parsed workbook, and building or switching a
+scenario costs O(overrides).  Overrides are Series like the base fields, so
+arithmetic and pct_change() work the same on a scenario model; each edit
+stores a new Series rather than changing the old one.
+
+Overrides replace the series the schedules read; values the workbook holds
+as precomputed results are not recalculated from them.
+
+Usage:
+    from DCF_model.scenario import Scenario
+    base = YPFModel("YPF_DCF.xlsx")
+
+    bear = Scenario(base, name="bear")
+    bear.set("Production Costs Expenses Schedule", "macro_oil_prices",
+             {2025: 55.0, 2026: 52.0})
+    bear.scale("Income Statement", "nopat", 0.9)     # projected years only
+    bear.model().income_statement.line_items["nopat"]
+"""
+
+from collections.abc import Mapping
+
+from .multi_sheet_loader import ALL_YEARS, HISTORICAL_YEARS, PROJECTED_YEARS
+from .series import Series
+
+
+class Scenario:
+    """
+    Copy-on-write view of a loader.  Duck-types the loader interface used by
+    the schedules (field() and the year axes), so YPFModel.from_loader works
+    on it directly; model() does that once and caches the result.
+    """
+
+    def __init__(self, base, name: str = "scenario",
+                 overrides: dict[tuple[str, str], Mapping[int, float]] | None = None):
+        self.base = getattr(base, "loader", base)
+        self.name = name
+        # {(sheet_name, field_key): full series}, touched series only
+        self._overrides: dict[tuple[str, str], Series] = {}
+        self._model = None
+        for (sheet_name, key), values in (overrides or {}).items():
+            self.set(sheet_name, key, values)
+
+    @classmethod
+    def from_spec(cls, base, spec: dict) -> "Scenario":
+        """
+        Build from a JSON-style spec:
+            {"name": "bear",
+             "overrides": {sheet: {key: {year: value} | value}}}
+        A bare value applies to every projected year.
+        """
+        scenario = cls(base, name=spec.get("name", "scenario"))
+        for sheet_name, fields in spec.get("overrides", {}).items():
+            for key, values in fields.items():
+                if isinstance(values, Mapping):
+                    values = {int(y): v for y, v in values.items()}
+                scenario.set(sheet_name, key, values)
+        return scenario
+
+    # ── Loader interface ─────────────────────────────────────────────────────
+
+    def field(self, sheet_name: str, key: str) -> Series:
+        series = self._overrides.get((sheet_name, key))
+        if series is not None:
+            return series
+        return self.base.field(sheet_name, key)
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return self.base.sheet_names
+
+    # The year axes follow the base, so a delta applied to it rolls them here too
+    @property
+    def HISTORICAL_YEARS(self) -> list[int]:
+        return getattr(self.base, "HISTORICAL_YEARS", HISTORICAL_YEARS)
+
+    @property
+    def PROJECTED_YEARS(self) -> list[int]:
+        return getattr(self.base, "PROJECTED_YEARS", PROJECTED_YEARS)
+
+    @property
+    def ALL_YEARS(self) -> list[int]:
+        return getattr(self.base, "ALL_YEARS", ALL_YEARS)
+
+    # ── Overrides ────────────────────────────────────────────────────────────
+
+    def _update(self, sheet_name: str, key: str, changes: Mapping[int, float]):
+        """Store the current series with `changes` applied as this scenario's override."""
+        series = self.field(sheet_name, key)
+        axis = series.axis if isinstance(series, Series) else None
+        self._overrides[(sheet_name, key)] = Series.from_dict({**series, **changes}, axis)
+        return self
+
+    def set(self, sheet_name: str, key: str, values: Mapping[int, float] | float):
+        """Override some years of a series (a bare value sets every projected year)."""
+        if not isinstance(values, Mapping):
+            values = dict.fromkeys(self.PROJECTED_YEARS, float(values))
+        return self._update(sheet_name, key, values)
+
+    def scale(self, sheet_name: str, key: str, factor: float,
+              years: list[int] | None = None):
+        """Multiply a series by factor over `years` (default: projected years)."""
+        series = self.field(sheet_name, key)
+        return self._update(sheet_name, key, {
+            y: series[y] * factor
+            for y in (self.PROJECTED_YEARS if years is None else years) if y in series
+        })
+
+    def shift(self, sheet_name: str, key: str, delta: float,
+              years: list[int] | None = None):
+        """Add delta to a series over `years` (default: projected years)."""
+        series = self.field(sheet_name, key)
+        return self._update(sheet_name, key, {
+            y: series[y] + delta
+            for y in (self.PROJECTED_YEARS if years is None else years) if y in series
+        })
+
+    def reset(self, sheet_name: str | None = None, key: str | None = None):
+        """Drop one override, or all of them, reverting to the base values."""
+        if sheet_name is None:
+            self._overrides.clear()
+        else:
+            self._overrides.pop((sheet_name, key), None)
+        return self
+
+    @property
+    def overrides(self) -> dict[tuple[str, str], Series]:
+        return dict(self._overrides)
+
+    # ── Models ───────────────────────────────────────────────────────────────
+
+    def child(self, name: str) -> "Scenario":
+        """A new scenario layered on this one (this scenario's overrides included)."""
+        return Scenario(self, name=name)
+
+    def model(self):
+        """
+        The YPFModel view of this scenario.  Schedules read through the overlay
+        on every access, so later overrides show up without rebuilding it.
+        """
+        if self._model is None:
+            from .ypf_model import YPFModel
+            self._model = YPFModel.from_loader(self)
+        return self._model
+
+    def __repr__(self):
+        return f"<Scenario: {self.name}, {len(self._overrides)} overridden series>"
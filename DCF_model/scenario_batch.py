@@ -0,0 +1,281 @@
+"""
+Evaluate many scenarios of one model together.
+
+run_scenarios() stacks the inputs of the DCF valuation for every scenario
+into (scenarios × years) arrays – the base series once, with only the rows a
+scenario overrides replaced – and computes the valuation outputs for all of
+them in a handful of numpy operations.  Field outputs are read through each
+scenario's overlay, and callable outputs (anything the array math can't
+express) are evaluated per scenario, chunked across a process pool.
+
+Results are stacked as values[scenario, output, year].  Single-number
+outputs (enterprise_value, price_per_share, …) sit in the valuation-year
+column (the last historical year); every other column is NaN.
+
+Usage:
+    from DCF_model.scenario_batch import run_scenarios
+    scenarios = [base.scenario(f"nopat {f:.0%}").scale(IS, "nopat", f)
+                 for f in (0.8, 0.9, 1.0, 1.1, 1.2)]
+    res = run_scenarios(base, scenarios,
+                        outputs=["free_cash_flow", "enterprise_value",
+                                 ("Income Statement", "ebitda")],
+                        wacc=0.11)
+    res.scalar("enterprise_value")          # one value per scenario
+    res.to_csv("scenarios.csv")             # scenario,output,year,value
+"""
+
+import csv
+import pickle
+from collections.abc import Mapping
+
+import numpy as np
+
+from .multi_sheet_loader import HISTORICAL_YEARS, PROJECTED_YEARS
+from .scenario import Scenario
+from .valuation import discounted_cash_flow, equity_bridge, free_cash_flow
+
+_IS   = "Income Statement"
+_CF   = "Cash Flow Statement"
+_BS   = "Balance Sheet"
+_DEBT = "Debt and Interest Schedule"
+_EQ   = "Shareholders' Equity Schedule"
+
+# Valuation inputs, read the same way DCFValuation reads them
+_INPUTS = {
+    "nopat":           (_IS, "nopat"),
+    "da":              (_IS, "da"),
+    "working_capital": (_CF, "working_capital"),
+    "capex":           (_CF, "capex"),
+    "debt":            (_DEBT, "totals_total_loans_revolver"),
+    "cash":            (_BS, "ca_cash"),
+    "shares":          (_EQ, "shares_ending"),
+}
+
+SERIES_OUTPUTS = ("nopat", "da", "working_capital", "capex",
+                  "free_cash_flow", "discount_factors", "pv_free_cash_flow")
+SCALAR_OUTPUTS = ("terminal_value", "enterprise_value", "net_debt",
+                  "equity_value", "shares_outstanding", "price_per_share")
+
+
+def _stack(loader, scenarios: list, sheet_name: str, key: str,
+           years: list[int], fill: float = 0.0) -> np.ndarray:
+    """(scenarios × years) array of one field; only overridden rows are rebuilt."""
+    base = loader.field(sheet_name, key)
+    out = np.tile(np.array([base.get(y, fill) for y in years], dtype=float),
+                  (len(scenarios), 1))
+    for i, scenario in enumerate(scenarios):
+        series = scenario.field(sheet_name, key)
+        if series is not base:
+            out[i] = [series.get(y, fill) for y in years]
+    return out
+
+
+def _valuation_arrays(loader, scenarios: list, years: list[int],
+                      wacc: np.ndarray, growth: np.ndarray) -> dict[str, np.ndarray]:
+    """Every built-in output as a (scenarios × years) array."""
+    x = {name: _stack(loader, scenarios, sheet, key, years)
+         for name, (sheet, key) in _INPUTS.items()}
+    n = len(scenarios)
+    year_idx = {y: i for i, y in enumerate(years)}
+    proj = np.array([year_idx[y] for y in getattr(loader, "PROJECTED_YEARS", PROJECTED_YEARS)])
+    v = year_idx[getattr(loader, "HISTORICAL_YEARS", HISTORICAL_YEARS)[-1]]
+
+    def on_axis(cols: np.ndarray, idx) -> np.ndarray:
+        full = np.full((n, len(years)), np.nan)
+        full[:, idx] = cols
+        return full
+
+    fcf = free_cash_flow(x["nopat"], x["da"], x["working_capital"], x["capex"])[:, proj]
+    dcf = discounted_cash_flow(fcf, wacc, growth)
+    bridge = equity_bridge(dcf["enterprise_value"], x["debt"][:, v], x["cash"][:, v],
+                           x["shares"][:, v])
+
+    out = {name: x[name] for name in ("nopat", "da", "working_capital", "capex")}
+    out["free_cash_flow"] = on_axis(fcf, proj)
+    out["discount_factors"] = on_axis(dcf["discount_factors"], proj)
+    out["pv_free_cash_flow"] = on_axis(dcf["pv_free_cash_flow"], proj)
+    for name, col in (("terminal_value", dcf["terminal_value"]),
+                      ("enterprise_value", dcf["enterprise_value"]),
+                      ("net_debt", bridge["net_debt"]),
+                      ("equity_value", bridge["equity_value"]),
+                      ("shares_outstanding", x["shares"][:, v]),
+                      ("price_per_share", bridge["price_per_share"])):
+        out[name] = on_axis(col[:, None], [v])
+    return out
+
+
+def _to_row(value, years: list[int], valuation_year: int) -> list[float]:
+    if isinstance(value, Mapping):
+        return [value.get(y, np.nan) for y in years]
+    return [value if y == valuation_year else np.nan for y in years]
+
+
+def _eval_callables(scenarios: list, funcs: list, years: list[int],
+                    valuation_year: int) -> list[list[list[float]]]:
+    """[scenario][func] rows for a list of scenarios."""
+    rows = []
+    for scenario in scenarios:
+        model = scenario.model()
+        rows.append([_to_row(f(model), years, valuation_year) for f in funcs])
+    return rows
+
+
+# ── Process pool ─────────────────────────────────────────────────────────────
+# Each worker receives the base loader and the callables once, through the
+# pool initializer; a chunk is then only (name, overrides) pairs.
+
+_worker: dict = {}
+
+
+def _init_worker(loader, funcs: list, years: list[int], valuation_year: int):
+    _worker.update(loader=loader, funcs=funcs, years=years, valuation_year=valuation_year)
+
+
+def _eval_chunk(chunk: list[tuple[str, dict]]) -> list[list[list[float]]]:
+    """Process-pool entry point: rebuild the chunk's scenarios on the worker's loader."""
+    scenarios = [Scenario(_worker["loader"], name, overrides) for name, overrides in chunk]
+    return _eval_callables(scenarios, _worker["funcs"], _worker["years"],
+                           _worker["valuation_year"])
+
+
+def _flat_overrides(scenario, loader) -> dict:
+    """Every override on the way from scenario down to loader, nearest layer winning."""
+    layers, layer = [], scenario
+    while layer is not loader:
+        if not isinstance(layer, Scenario):
+            raise ValueError(f"Scenario '{scenario.name}' is not built on the model "
+                             f"passed to run_scenarios")
+        layers.append(layer)
+        layer = layer.base
+    overrides = {}
+    for layer in reversed(layers):
+        overrides.update(layer.overrides)
+    return overrides
+
+
+def _check_picklable(funcs: list):
+    for f in funcs:
+        try:
+            pickle.dumps(f)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise ValueError(
+                f"Callable output {_label(f)} can't be sent to worker processes ({e}). "
+                f"Use a module-level function, or workers=1"
+            ) from None
+
+
+def _label(output) -> str:
+    if isinstance(output, str):
+        return output
+    if isinstance(output, tuple):
+        return f"{output[0]}:{output[1]}"
+    return getattr(output, "__name__", repr(output))
+
+
+class ScenarioResults:
+    """values[s, o, y] for scenario names s, output labels o and years y."""
+
+    def __init__(self, scenarios: list[str], outputs: list[str], years: list[int],
+                 values: np.ndarray, valuation_year: int):
+        self.scenarios = scenarios
+        self.outputs = outputs
+        self.years = years
+        self.values = values
+        self.valuation_year = valuation_year
+
+    def get(self, output: str) -> np.ndarray:
+        """(scenarios × years) for one output."""
+        try:
+            return self.values[:, self.outputs.index(output), :]
+        except ValueError:
+            raise KeyError(f"Output '{output}' not in results. Available: {self.outputs}") from None
+
+    def scalar(self, output: str) -> np.ndarray:
+        """One value per scenario: the valuation-year column of `output`."""
+        return self.get(output)[:, self.years.index(self.valuation_year)]
+
+    def scenario(self, name: str) -> dict[str, dict[int, float]]:
+        s = self.scenarios.index(name)
+        return {
+            o: {y: v for y, v in zip(self.years, self.values[s, i].tolist()) if v == v}
+            for i, o in enumerate(self.outputs)
+        }
+
+    def to_records(self) -> list[tuple[str, str, int, float]]:
+        """Tidy (scenario, output, year, value) rows, NaN cells dropped."""
+        s, o, y = np.nonzero(~np.isnan(self.values))
+        return [(self.scenarios[i], self.outputs[j], self.years[k], float(self.values[i, j, k]))
+                for i, j, k in zip(s.tolist(), o.tolist(), y.tolist())]
+
+    def to_csv(self, path: str):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["scenario", "output", "year", "value"])
+            writer.writerows(self.to_records())
+
+    def __repr__(self):
+        return (f"<ScenarioResults: {len(self.scenarios)} scenarios × "
+                f"{len(self.outputs)} outputs × {len(self.years)} years>")
+
+
+def run_scenarios(model, scenarios: list, outputs: list | None = None,
+                  wacc=0.10, terminal_growth=0.02, workers: int = 1,
+                  chunk_size: int = 256) -> ScenarioResults:
+    """
+    Evaluate scenarios (Scenario overlays of `model`) as one batch.
+
+    outputs    – built-in names (SERIES_OUTPUTS / SCALAR_OUTPUTS), (sheet, key)
+                 field tuples, or callables f(model) -> {year: value} | float.
+                 Defaults to free_cash_flow and the valuation bridge.
+    wacc, terminal_growth – a number, or one value per scenario.
+    workers    – process-pool size for callable outputs (1 = in process); with
+                 more than one, callables must be picklable (module-level).
+    """
+    loader = getattr(model, "loader", model)
+    years = list(loader.ALL_YEARS)
+    valuation_year = getattr(loader, "HISTORICAL_YEARS", HISTORICAL_YEARS)[-1]
+    if outputs is None:
+        outputs = ["free_cash_flow", *SCALAR_OUTPUTS]
+    for output in outputs:
+        if isinstance(output, str) and output not in SERIES_OUTPUTS + SCALAR_OUTPUTS:
+            raise ValueError(
+                f"Unsupported output: {output}. "
+                f"Built-in outputs: {list(SERIES_OUTPUTS + SCALAR_OUTPUTS)}"
+            )
+
+    n = len(scenarios)
+    wacc = np.broadcast_to(np.asarray(wacc, dtype=float), (n,))
+    growth = np.broadcast_to(np.asarray(terminal_growth, dtype=float), (n,))
+    if np.any(wacc <= growth):
+        raise ValueError("wacc must be greater than terminal_growth in every scenario")
+
+    values = np.full((n, len(outputs), len(years)), np.nan)
+    if n == 0:
+        return ScenarioResults([], [_label(o) for o in outputs], years, values, valuation_year)
+
+    if any(isinstance(o, str) for o in outputs):
+        arrays = _valuation_arrays(loader, scenarios, years, wacc, growth)
+    for j, output in enumerate(outputs):
+        if isinstance(output, str):
+            values[:, j] = arrays[output]
+        elif isinstance(output, tuple):
+            values[:, j] = _stack(loader, scenarios, output[0], output[1], years, np.nan)
+
+    callables = [(j, f) for j, f in enumerate(outputs) if callable(f)]
+    if callables:
+        idx, funcs = [j for j, _ in callables], [f for _, f in callables]
+        chunks = [scenarios[i:i + chunk_size] for i in range(0, n, chunk_size)]
+        if workers > 1 and len(chunks) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            _check_picklable(funcs)
+            payload = [[(sc.name, _flat_overrides(sc, loader)) for sc in chunk] for chunk in chunks]
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                     initializer=_init_worker,
+                                     initargs=(loader, funcs, years, valuation_year)) as pool:
+                rows = [r for chunk in pool.map(_eval_chunk, payload) for r in chunk]
+        else:
+            rows = _eval_callables(scenarios, funcs, years, valuation_year)
+        values[:, idx] = np.array(rows, dtype=float)
+
+    return ScenarioResults([s.name for s in scenarios], [_label(o) for o in outputs],
+                           years, values, valuation_year)
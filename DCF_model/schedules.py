@@ -5,7 +5,7 @@ Each class reads from its own sheet in the multi-sheet Excel workbook via
 self._field(key), where key matches a row label in that sheet.
 """
 
-from base_schedule import BaseSchedule
+from .base_schedule import BaseSchedule
 
 
 # ─────────────────────────────────────────────────────────
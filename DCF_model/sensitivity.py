@@ -0,0 +1,168 @@
+"""
+Sensitivity of the valuation to every input driver.
+
+tornado()    One-at-a-time bumps: each driver's projected path is bumped down
+             and up by `bump` (±10% by default) with every other driver at
+             base.  All 2 × drivers cases are stacked into one batch and
+             evaluated by DriverModel in a single call, then drivers are
+             ranked by the swing they cause in the chosen output.
+
+gradients()  Exact derivatives of the output with respect to every driver
+             in every projected year (plus wacc and terminal growth), from
+             one forward-mode pass with dual numbers.
+
+Usage:
+    from DCF_model.sensitivity import tornado, gradients
+    print(tornado(model, bump=0.10, output="price_per_share").format(top=15))
+
+    g = gradients(model)
+    g.by_year["macro.fx_rate"][2027]       # dEV / d(fx rate in 2027)
+    g.elasticity("pricing.ngl")            # % EV change per 1% on the whole path
+"""
+
+import numpy as np
+
+from .autodiff import Dual
+from .drivers import DriverModel
+
+OUTPUTS = ("enterprise_value", "equity_value", "price_per_share")
+
+
+class TornadoResult:
+    """Drivers ranked by |high − low| of the output, largest first."""
+
+    def __init__(self, output: str, bump: float, base_value: float, rows: list[dict]):
+        self.output = output
+        self.bump = bump
+        self.base_value = base_value
+        self.rows = rows
+
+    def format(self, top: int | None = None) -> str:
+        rows = self.rows if top is None else self.rows[:top]
+        width = max([len(r["driver"]) for r in rows] + [6])
+        lines = [
+            f"{self.output} sensitivity to ±{self.bump:.0%} bumps "
+            f"(base {self.base_value:,.2f})",
+            f"{'driver':<{width}} {'low':>14} {'high':>14} {'swing':>14}",
+        ]
+        for r in rows:
+            lines.append(f"{r['driver']:<{width}} {r['low']:>14,.2f} "
+                         f"{r['high']:>14,.2f} {r['swing']:>14,.2f}")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"<TornadoResult: {self.output}, {len(self.rows)} drivers>"
+
+
+def tornado(model, bump: float = 0.10, output: str = "enterprise_value",
+            wacc: float = 0.10, terminal_growth: float = 0.02,
+            drivers: list[str] | None = None) -> TornadoResult:
+    """
+    Bump each driver (labels from DriverModel, default all found in the model)
+    by ±bump of its own value and rank the drivers by the output swing.
+    `model` may also be a ready DriverModel.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"Unsupported output: {output}. Choose from {list(OUTPUTS)}")
+    dm = model if isinstance(model, DriverModel) else DriverModel(model, wacc, terminal_growth)
+    labels = [d.label for d in dm.drivers] if drivers is None else list(drivers)
+    unknown = [label for label in labels if label not in dm.base]
+    if unknown:
+        raise KeyError(f"Unknown drivers: {unknown}. Available: {list(dm.base)}")
+
+    # Rows 2k / 2k+1 are driver k bumped down / up
+    inputs = dm.stack(2 * len(labels))
+    for k, label in enumerate(labels):
+        inputs[label][2 * k] *= 1.0 - bump
+        inputs[label][2 * k + 1] *= 1.0 + bump
+    values = dm.evaluate(inputs)[output]
+    base_value = float(dm.evaluate()[output])
+
+    low, high = values[0::2], values[1::2]
+    swing = np.abs(high - low)
+    rows = [
+        {"driver": labels[k], "low": float(low[k]), "high": float(high[k]),
+         "swing": float(swing[k])}
+        for k in np.argsort(-swing, kind="stable")
+    ]
+    return TornadoResult(output, bump, base_value, rows)
+
+
+class GradientResult:
+    """
+    by_year   – {driver: {year: d output / d driver[year]}}
+    wacc, terminal_growth – d output / d rate
+    """
+
+    def __init__(self, output: str, base_value: float, base: dict[str, np.ndarray],
+                 years: list[int], grads: np.ndarray, labels: list[str],
+                 wacc: float, terminal_growth: float):
+        self.output = output
+        self.base_value = base_value
+        self.years = years
+        self.labels = labels
+        self._base = base
+        self._grads = grads   # (drivers × years)
+        self.by_year = {
+            label: dict(zip(years, grads[i].tolist())) for i, label in enumerate(labels)
+        }
+        self.wacc = wacc
+        self.terminal_growth = terminal_growth
+
+    def parallel(self, label: str) -> float:
+        """d output for a +1 shift of the driver in every projected year."""
+        return float(self._grads[self.labels.index(label)].sum())
+
+    def elasticity(self, label: str) -> float:
+        """% change in the output for a 1% change of the whole driver path."""
+        i = self.labels.index(label)
+        if not self.base_value:
+            return float("nan")
+        return float(self._grads[i] @ self._base[label] / self.base_value)
+
+    def format(self, top: int | None = None) -> str:
+        order = sorted(self.labels, key=lambda lb: -abs(self.elasticity(lb)))
+        order = order if top is None else order[:top]
+        width = max([len(lb) for lb in order] + [9])
+        lines = [
+            f"d {self.output} (base {self.base_value:,.2f})",
+            f"{'driver':<{width}} {'d/d(+1 all yrs)':>16} {'elasticity':>11}",
+        ]
+        for label in order:
+            lines.append(f"{label:<{width}} {self.parallel(label):>16,.4f} "
+                         f"{self.elasticity(label):>11.4f}")
+        lines.append(f"{'wacc':<{width}} {self.wacc:>16,.4f}")
+        lines.append(f"{'terminal_growth':<{width}} {self.terminal_growth:>16,.4f}")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"<GradientResult: d {self.output} w.r.t. {len(self.labels)} drivers>"
+
+
+def gradients(model, output: str = "enterprise_value", wacc: float = 0.10,
+              terminal_growth: float = 0.02, drivers: list[str] | None = None
+              ) -> GradientResult:
+    """
+    Derivatives of `output` with respect to every driver-year, in one
+    forward-mode pass: each driver-year element is its own tangent direction.
+    `model` may also be a ready DriverModel.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"Unsupported output: {output}. Choose from {list(OUTPUTS)}")
+    dm = model if isinstance(model, DriverModel) else DriverModel(model, wacc, terminal_growth)
+    labels = [d.label for d in dm.drivers] if drivers is None else list(drivers)
+    n_years = len(dm.years)
+    n = len(labels) * n_years
+    inputs = {label: Dual.seed(dm.base[label], n, k * n_years)
+              for k, label in enumerate(labels)}
+    out = dm.evaluate(inputs)[output]
+    grads = np.asarray(out.tan, dtype=float).reshape(len(labels), n_years)
+
+    # Rates enter only through the EV weights: differentiate those directly
+    fcf = dm.free_cash_flow()
+    d_w, d_g = dm.ev_weight_derivatives()
+    d_ev_w, d_ev_g = float(fcf @ d_w), float(fcf @ d_g)
+    scale = 1.0 / dm.shares if output == "price_per_share" and dm.shares else 1.0
+
+    return GradientResult(output, float(out.value), dm.base, dm.years, grads, labels,
+                          d_ev_w * scale, d_ev_g * scale)
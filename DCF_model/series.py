@@ -0,0 +1,225 @@
+"""
+Compact year series.
+
+Every field the loaders parse is a Series: a read-only {year: float}
+Mapping backed by one array('d') of floats, laid out along a YearAxis that
+all series with the same years share.  A missing year is a NaN slot, so a
+15-year series is one small object and a 120-byte buffer instead of a dict
+with 15 boxed floats, and isinstance(val, Series) identifies a series
+without scanning its keys.
+
+Arithmetic works on the whole buffer at once through NumPy and returns a
+new Series; a year missing from either operand is missing from the result:
+
+    fcf = nopat + da + wc + capex          # Series ± Series | scalar
+    margin = ebitda / revenue
+    growth = revenue.pct_change()
+
+Code that reads series as dicts (get(), [], items(), `in`, ==) keeps
+working; dict(series) or series.to_dict() gives a mutable copy.
+
+A Series is never changed after it is built, so one can be shared and
+cached freely.  Updates build a new one instead: MultiSheetLoader.apply()
+stores a patched copy of each field a delta touches, and Scenario edits
+store a new override.
+"""
+
+import operator
+from array import array
+from collections.abc import Mapping
+from numbers import Real
+
+_NAN = float("nan")
+
+
+class YearAxis:
+    """The years of a family of series, in order, plus year → slot index."""
+
+    __slots__ = ("years", "index")
+
+    def __init__(self, years: tuple[int, ...]):
+        self.years = years
+        self.index = {y: i for i, y in enumerate(years)}
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def __repr__(self):
+        span = f"{self.years[0]}-{self.years[-1]}" if self.years else "empty"
+        return f"<YearAxis: {len(self.years)} years, {span}>"
+
+
+# One shared axis per distinct tuple of years
+_AXES: dict[tuple[int, ...], YearAxis] = {}
+
+
+def year_axis(years) -> YearAxis:
+    """The shared YearAxis for these years (sorted, duplicates dropped)."""
+    key = tuple(sorted(set(years)))
+    axis = _AXES.get(key)
+    if axis is None:
+        axis = _AXES[key] = YearAxis(key)
+    return axis
+
+
+def _restore(years: tuple[int, ...], buf: array) -> "Series":
+    """Unpickle onto the receiving process's shared axis."""
+    return Series(year_axis(years), buf)
+
+
+class Series(Mapping):
+    """
+    Immutable {year: float} over a shared YearAxis.  buf holds one float
+    per axis year, NaN where the year has no value; it is not written after
+    __init__.
+    """
+
+    __slots__ = ("axis", "buf")
+
+    def __init__(self, axis: YearAxis, buf: array | None = None):
+        self.axis = axis
+        if buf is None:
+            buf = array("d", [_NAN]) * len(axis)
+        elif len(buf) != len(axis):
+            raise ValueError(f"{len(buf)} values for an axis of {len(axis)} years")
+        self.buf = buf
+
+    @classmethod
+    def from_dict(cls, data: Mapping, axis: YearAxis | None = None) -> "Series":
+        """Series of {year: value} on axis (default: data's own years)."""
+        if axis is None or not axis.index.keys() >= data.keys():
+            axis = year_axis(data.keys() if axis is None else (*axis.years, *data))
+        get = data.get
+        return cls(axis, array("d", [_NAN if (v := get(y)) is None else v
+                                     for y in axis.years]))
+
+    # ── Mapping interface ────────────────────────────────────────────────────
+
+    def __getitem__(self, year: int) -> float:
+        i = self.axis.index.get(year)
+        if i is not None:
+            v = self.buf[i]
+            if v == v:
+                return v
+        raise KeyError(year)
+
+    def get(self, year: int, default=None):
+        i = self.axis.index.get(year)
+        if i is None:
+            return default
+        v = self.buf[i]
+        return v if v == v else default
+
+    def __contains__(self, year) -> bool:
+        i = self.axis.index.get(year)
+        return i is not None and self.buf[i] == self.buf[i]
+
+    def __iter__(self):
+        return (y for y, v in zip(self.axis.years, self.buf) if v == v)
+
+    def __len__(self) -> int:
+        return sum(v == v for v in self.buf)
+
+    def __bool__(self) -> bool:
+        return any(v == v for v in self.buf)
+
+    # Lists rather than views: one pass over the buffer instead of a lookup per year
+    def items(self) -> list[tuple[int, float]]:
+        return [(y, v) for y, v in zip(self.axis.years, self.buf) if v == v]
+
+    def values(self) -> list[float]:
+        return [v for v in self.buf if v == v]
+
+    def to_dict(self) -> dict[int, float]:
+        return dict(self.items())
+
+    def to_numpy(self):
+        """Read-only float64 view of buf, one slot per axis year (NaN = missing)."""
+        import numpy as np
+
+        view = np.frombuffer(self.buf, dtype=float)
+        view.flags.writeable = False
+        return view
+
+    def reindex(self, axis: YearAxis) -> "Series":
+        """This series on another axis; years not on self are missing."""
+        if axis is self.axis:
+            return self
+        return Series(axis, array("d", [self.get(y, _NAN) for y in axis.years]))
+
+    # ── Arithmetic (whole-buffer, via NumPy) ─────────────────────────────────
+
+    def _binary(self, other, op, reflected: bool = False):
+        import numpy as np
+
+        axis = self.axis
+        if isinstance(other, Real):
+            b = float(other)
+        elif isinstance(other, Mapping):
+            if not isinstance(other, Series):
+                other = Series.from_dict(other, axis)
+            if other.axis is not axis:
+                axis = year_axis((*axis.years, *other.axis.years))
+            b = np.frombuffer(other.reindex(axis).buf)
+        else:
+            return NotImplemented
+        a = np.frombuffer(self.reindex(axis).buf)
+        if reflected:
+            a, b = b, a
+        if op is operator.truediv:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                out = a / b
+            out[~np.isfinite(out)] = np.nan   # x/0 is missing, not inf
+        else:
+            out = op(a, b)
+        return Series(axis, array("d", out.tobytes()))
+
+    def __add__(self, other):
+        return self._binary(other, operator.add)
+
+    def __radd__(self, other):
+        return self._binary(other, operator.add, reflected=True)
+
+    def __sub__(self, other):
+        return self._binary(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._binary(other, operator.sub, reflected=True)
+
+    def __mul__(self, other):
+        return self._binary(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._binary(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other):
+        return self._binary(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        return self._binary(other, operator.truediv, reflected=True)
+
+    def __neg__(self):
+        return self * -1.0
+
+    def pct_change(self) -> "Series":
+        """Change on the previous axis year, as a fraction (first year missing)."""
+        import numpy as np
+
+        a = self.to_numpy()
+        out = np.full(len(a), np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[1:] = a[1:] / a[:-1] - 1.0
+        out[~np.isfinite(out)] = np.nan
+        return Series(self.axis, array("d", out.tobytes()))
+
+    # ── Object protocol ──────────────────────────────────────────────────────
+
+    def __reduce__(self):
+        return _restore, (self.axis.years, self.buf)
+
+    def __sizeof__(self) -> int:
+        # The axis is shared, so only the buffer counts towards this series
+        return object.__sizeof__(self) + self.buf.__sizeof__()
+
+    def __repr__(self):
+        return f"<Series: {self.to_dict()}>"
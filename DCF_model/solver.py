@@ -0,0 +1,228 @@
+"""
+Goal seek: find the driver value that makes a valuation output hit a target.
+
+    "What oil price is implied by the current share price?"
+        goal_seek(model, target=28.5, output="price_per_share",
+                  vary="pricing.oil_and_consolidates", mode="scale")
+    "What WACC makes EV equal to market cap?"
+        goal_seek(model, target=market_cap, output="enterprise_value", vary="wacc")
+
+The unknown θ is a single number per problem:
+
+    mode="scale"  driver path = base path · θ         (θ = 1 is the base case)
+    mode="shift"  driver path = base path + θ
+    mode="level"  driver path = θ in every projected year
+    vary="wacc" / "terminal_growth"   the rate itself
+
+Each problem is bracketed first (the bracket is widened until the output
+crosses the target), then refined with Newton steps that fall back to
+bisection whenever a step would leave the bracket.  Derivatives are exact:
+dual numbers through DriverModel for driver paths, the analytic EV-weight
+derivatives for the rates.  Calibration and, for rates, the FCF path are
+computed once and reused across iterations.
+
+Many targets and/or many models are solved together: every iteration
+advances all unconverged problems at once, with one batched evaluation per
+model.
+"""
+
+import numpy as np
+
+from .autodiff import Dual
+from .drivers import DriverModel
+from .sensitivity import OUTPUTS
+
+MODES = ("scale", "shift", "level")
+RATES = ("wacc", "terminal_growth")
+
+
+class SolveResult:
+    """θ per problem plus convergence diagnostics; see implied_path()."""
+
+    def __init__(self, vary: str, mode: str, output: str, theta: np.ndarray,
+                 targets: np.ndarray, residual: np.ndarray, converged: np.ndarray,
+                 iterations: int, models: list[DriverModel], owner: np.ndarray):
+        self.vary = vary
+        self.mode = mode
+        self.output = output
+        self.theta = theta
+        self.targets = targets
+        self.residual = residual
+        self.converged = converged
+        self.iterations = iterations
+        self._models = models
+        self._owner = owner
+
+    def implied_path(self, i: int = 0) -> dict[int, float] | float:
+        """Solved driver path of problem i ({year: value}), or the solved rate."""
+        if self.vary in RATES:
+            return float(self.theta[i])
+        dm = self._models[self._owner[i]]
+        path = _path(dm.base[self.vary], self.mode, self.theta[i:i + 1])[0]
+        return dict(zip(dm.years, path.tolist()))
+
+    def __repr__(self):
+        return (f"<SolveResult: {self.vary} ({self.mode}) for {self.output}, "
+                f"{int(self.converged.sum())}/{len(self.theta)} converged>")
+
+
+def _path(base: np.ndarray, mode: str, theta: np.ndarray) -> np.ndarray:
+    t = theta[:, None]
+    if mode == "scale":
+        return base * t
+    if mode == "shift":
+        return base + t
+    return np.broadcast_to(t, (len(theta), len(base))).copy()
+
+
+def _default_bracket(vary: str, mode: str, dm: DriverModel) -> tuple[float, float]:
+    if vary == "wacc":
+        return dm.terminal_growth + 1e-4, 0.5
+    if vary == "terminal_growth":
+        return -0.2, dm.wacc - 1e-4
+    base = dm.base[vary]
+    if mode == "scale":
+        return 0.0, 2.0
+    spread = float(np.abs(base).max()) or 1.0
+    if mode == "shift":
+        return -spread, spread
+    return float(base.min()) - spread, float(base.max()) + spread
+
+
+def _limits(vary: str, dm: DriverModel) -> tuple[float, float]:
+    """Hard limits a bracket may not be widened past (the rates must keep wacc > g)."""
+    if vary == "wacc":
+        return dm.terminal_growth + 1e-9, np.inf
+    if vary == "terminal_growth":
+        return -np.inf, dm.wacc - 1e-9
+    return -np.inf, np.inf
+
+
+class _Problem:
+    """Evaluates f(θ) = output(θ) − target and f'(θ) for the problems of one model."""
+
+    def __init__(self, dm: DriverModel, vary: str, mode: str, output: str):
+        self.dm = dm
+        self.vary = vary
+        self.mode = mode
+        self.output = output
+        self.scale = (1.0 / dm.shares if dm.shares else np.nan) \
+            if output == "price_per_share" else 1.0
+        self._fcf = dm.free_cash_flow() if vary in RATES else None   # fixed for rates
+
+    def __call__(self, theta: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        dm = self.dm
+        if self.vary in RATES:
+            rates = {self.vary: theta}
+            ev = (self._fcf * dm.ev_weights(**rates)).sum(axis=-1)
+            d_w, d_g = dm.ev_weight_derivatives(**rates)
+            d_ev = (self._fcf * (d_w if self.vary == "wacc" else d_g)).sum(axis=-1)
+            value = ev if self.output == "enterprise_value" else ev - dm.net_debt
+            return value * self.scale, d_ev * self.scale
+
+        base = dm.base[self.vary]
+        value = _path(base, self.mode, theta)
+        tan = base if self.mode == "scale" else np.ones_like(base)
+        x = Dual(value, np.broadcast_to(tan, (1,) + value.shape))
+        out = dm.evaluate({self.vary: x})[self.output]
+        return out.value, out.tan[0]
+
+
+def goal_seek(model, target, output: str = "price_per_share",
+              vary: str = "pricing.oil_and_consolidates", mode: str = "scale",
+              bracket: tuple[float, float] | None = None,
+              wacc: float = 0.10, terminal_growth: float = 0.02,
+              tol: float = 1e-8, max_iter: int = 100, max_expand: int = 30
+              ) -> SolveResult:
+    """
+    Solve output(θ) = target.
+
+    model   – a YPFModel / loader / DriverModel, or a list of them (one
+              problem per model; target broadcasts against them)
+    target  – a number, or one per problem
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"Unsupported output: {output}. Choose from {list(OUTPUTS)}")
+    if mode not in MODES:
+        raise ValueError(f"Unsupported mode: {mode}. Choose from {list(MODES)}")
+
+    sources = model if isinstance(model, (list, tuple)) else [model]
+    models = [m if isinstance(m, DriverModel) else DriverModel(m, wacc, terminal_growth)
+              for m in sources]
+    if vary not in RATES:
+        for dm in models:
+            if vary not in dm.base:
+                raise KeyError(f"Unknown driver '{vary}'. Available: {list(dm.base)}")
+
+    targets = np.atleast_1d(np.asarray(target, dtype=float))
+    n = max(len(models), len(targets))
+    if len(models) not in (1, n) or len(targets) not in (1, n):
+        raise ValueError("model and target must have the same length (or length 1)")
+    targets = np.broadcast_to(targets, (n,)).copy()
+    owner = np.broadcast_to(np.arange(len(models)), (n,)) if len(models) > 1 \
+        else np.zeros(n, dtype=int)
+    problems = [_Problem(dm, vary, mode, output) for dm in models]
+    groups = [np.flatnonzero(owner == k) for k in range(len(models))]
+
+    def evaluate(theta: np.ndarray, idx: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        f, df = np.empty(len(idx)), np.empty(len(idx))
+        pos = {p: i for i, p in enumerate(idx)}
+        for k, members in enumerate(groups):
+            sel = np.intersect1d(members, idx, assume_unique=True)
+            if len(sel):
+                at = [pos[p] for p in sel]
+                f[at], df[at] = problems[k](theta[at])
+        return f - targets[idx], df
+
+    # ── Bracket ──
+    lo, hi = np.empty(n), np.empty(n)
+    floor, ceil = np.empty(n), np.empty(n)
+    for k, members in enumerate(groups):
+        lo[members], hi[members] = bracket or _default_bracket(vary, mode, models[k])
+        floor[members], ceil[members] = _limits(vary, models[k])
+    all_idx = np.arange(n)
+    f_lo, _ = evaluate(lo, all_idx)
+    f_hi, _ = evaluate(hi, all_idx)
+    for _ in range(max_expand):
+        open_ = np.flatnonzero(np.sign(f_lo) == np.sign(f_hi))
+        if not len(open_):
+            break
+        width = hi[open_] - lo[open_]
+        lo[open_] = np.maximum(lo[open_] - width, floor[open_])
+        hi[open_] = np.minimum(hi[open_] + width, ceil[open_])
+        f_lo[open_], _ = evaluate(lo[open_], open_)
+        f_hi[open_], _ = evaluate(hi[open_], open_)
+    bracketed = np.sign(f_lo) != np.sign(f_hi)
+
+    # ── Safeguarded Newton inside the bracket ──
+    theta = np.where(bracketed, 0.5 * (lo + hi), np.nan)
+    residual = np.full(n, np.nan)
+    converged = np.zeros(n, dtype=bool)
+    scale = np.maximum(1.0, np.abs(targets))
+    iterations = 0
+    active = np.flatnonzero(bracketed)
+    while len(active) and iterations < max_iter:
+        iterations += 1
+        f, df = evaluate(theta[active], active)
+        residual[active] = f
+        collapsed = hi[active] - lo[active] <= tol * np.maximum(1.0, np.abs(theta[active]))
+        # A bracket that collapses onto a large residual is a pole, not a root
+        hit = (np.abs(f) <= tol * scale[active]) | \
+              (collapsed & (np.abs(f) <= np.sqrt(tol) * scale[active]))
+        done = hit | collapsed
+        converged[active[hit]] = True
+        active, f, df = active[~done], f[~done], df[~done]
+
+        # Shrink the bracket around the root, then step
+        same_as_lo = np.sign(f) == np.sign(f_lo[active])
+        lo[active] = np.where(same_as_lo, theta[active], lo[active])
+        f_lo[active] = np.where(same_as_lo, f, f_lo[active])
+        hi[active] = np.where(same_as_lo, hi[active], theta[active])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = theta[active] - f / df
+        inside = np.isfinite(newton) & (newton > lo[active]) & (newton < hi[active])
+        theta[active] = np.where(inside, newton, 0.5 * (lo[active] + hi[active]))
+
+    return SolveResult(vary, mode, output, theta, targets, residual, converged,
+                       iterations, models, owner)
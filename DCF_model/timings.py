@@ -0,0 +1,140 @@
+"""
+Lightweight timing spans and counters for the model pipeline.
+
+Instrumentation is off unless a TimingCollector is active; span() then
+returns a shared no-op context manager and count() returns immediately, so
+the hooks left in the hot paths cost one global lookup each.
+
+Usage:
+    from DCF_model.timings import TimingCollector
+
+    with TimingCollector() as tc:
+        model = YPFModel("YPF_DCF.xlsx")
+        ExcelExporter(model, "out.xlsx").export()
+
+    print(tc.report())
+    tc.write_chrome_trace("trace.json")   # open in chrome://tracing / Perfetto
+"""
+
+import json
+import os
+import threading
+import time
+
+_active: "TimingCollector | None" = None
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("collector", "name", "detail", "start")
+
+    def __init__(self, collector: "TimingCollector", name: str, detail: str | None):
+        self.collector = collector
+        self.name = name
+        self.detail = detail
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.collector._record(self.name, self.detail, self.start, time.perf_counter_ns())
+        return False
+
+
+def span(name: str, detail: str | None = None):
+    """Time a block as `name` (optionally qualified by `detail`, e.g. a schedule)."""
+    if _active is None:
+        return _NULL_SPAN
+    return _Span(_active, name, detail)
+
+
+def count(name: str, n: int = 1):
+    """Add n to the named counter of the active collector, if any."""
+    if _active is not None:
+        _active.counters[name] = _active.counters.get(name, 0) + n
+
+
+class TimingCollector:
+    """
+    Records spans and counters while active (as a context manager, or between
+    start() and stop()).  Only one collector is active at a time.
+    """
+
+    def __init__(self):
+        # (name, detail, start_ns, end_ns, thread id)
+        self.spans: list[tuple[str, str | None, int, int, int]] = []
+        self.counters: dict[str, int] = {}
+        self._previous: "TimingCollector | None" = None
+
+    def start(self) -> "TimingCollector":
+        global _active
+        self._previous, _active = _active, self
+        return self
+
+    def stop(self):
+        global _active
+        _active = self._previous
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def _record(self, name: str, detail: str | None, start: int, end: int):
+        self.spans.append((name, detail, start, end, threading.get_ident()))
+
+    # ── Reporting ────────────────────────────────────────────────────────────
+
+    def totals(self) -> dict[str, tuple[int, float]]:
+        """Return {label: (calls, total_ms)} with label = "name [detail]"."""
+        out: dict[str, list] = {}
+        for name, detail, start, end, _ in self.spans:
+            label = f"{name} [{detail}]" if detail else name
+            entry = out.setdefault(label, [0, 0.0])
+            entry[0] += 1
+            entry[1] += (end - start) / 1e6
+        return {k: (calls, ms) for k, (calls, ms) in out.items()}
+
+    def report(self) -> str:
+        totals = sorted(self.totals().items(), key=lambda kv: kv[1][1], reverse=True)
+        width = max([len(label) for label, _ in totals] + [5])
+        lines = [f"{'span':<{width}} {'calls':>6} {'total ms':>10} {'mean ms':>9}"]
+        for label, (calls, ms) in totals:
+            lines.append(f"{label:<{width}} {calls:>6} {ms:>10.2f} {ms / calls:>9.3f}")
+        if self.counters:
+            lines.append("counters: " + ", ".join(
+                f"{k}={v:,}" for k, v in sorted(self.counters.items())))
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """Return the spans and final counter values in Chrome trace-event format."""
+        pid = os.getpid()
+        t0 = min((s[2] for s in self.spans), default=0)
+        events = [
+            {"name": f"{name} [{detail}]" if detail else name, "cat": name, "ph": "X",
+             "ts": (start - t0) / 1e3, "dur": (end - start) / 1e3, "pid": pid, "tid": tid}
+            for name, detail, start, end, tid in self.spans
+        ]
+        end_ts = max((e["ts"] + e["dur"] for e in events), default=0.0)
+        events += [{"name": k, "ph": "C", "ts": end_ts, "pid": pid, "args": {k: v}}
+                   for k, v in self.counters.items()]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
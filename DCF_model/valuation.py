@@ -0,0 +1,183 @@
+"""
+Discounted cash flow valuation on top of the YPF DCF Model schedules.
+
+Unlevered free cash flow is built from the projected years of the financial
+statements, using cash-flow-statement signs (outflows are negative):
+
+    FCF = NOPAT + D&A + working capital (CF) + capex (CF)
+
+Projected FCF is discounted at the WACC with a Gordon-growth terminal value,
+then bridged to equity with net debt and shares at the last historical year.
+
+The math itself lives in the module-level functions below, which take numbers
+or NumPy arrays with leading batch axes; DCFValuation, DriverModel and
+scenario_batch.run_scenarios all price through them.
+
+Usage:
+    from DCF_model import YPFModel, DCFValuation
+    val = DCFValuation(YPFModel("YPF_DCF.xlsx"), wacc=0.12, terminal_growth=0.02)
+    print(val.price_per_share)
+"""
+
+
+# ── DCF math (numbers or arrays (…, years)) ──────────────────────────────────
+
+def free_cash_flow(nopat, da, working_capital, capex):
+    """Unlevered FCF from cash-flow-statement signs (outflows negative)."""
+    return nopat + da + working_capital + capex
+
+
+def discount_factors(wacc, periods: int):
+    """End-of-year factors (1 + wacc)^-t, t = 1..periods, shaped (…, periods)."""
+    import numpy as np
+
+    t = np.arange(1, periods + 1)
+    return (1.0 + np.asarray(wacc, dtype=float)[..., None]) ** -t
+
+
+def terminal_multiple(wacc, terminal_growth):
+    """Gordon-growth terminal value per unit of last projected FCF."""
+    return (1.0 + terminal_growth) / (wacc - terminal_growth)
+
+
+def discounted_cash_flow(fcf, wacc, terminal_growth) -> dict:
+    """
+    Discount projected FCF (…, years) at wacc with a terminal value; wacc and
+    terminal_growth broadcast against the leading axes of fcf.
+    """
+    import numpy as np
+
+    fcf = np.asarray(fcf, dtype=float)
+    wacc = np.asarray(wacc, dtype=float)
+    df = discount_factors(wacc, fcf.shape[-1])
+    pv = fcf * df
+    tv = fcf[..., -1] * terminal_multiple(wacc, np.asarray(terminal_growth, dtype=float))
+    return {
+        "discount_factors":  df,
+        "pv_free_cash_flow": pv,
+        "terminal_value":    tv,
+        "enterprise_value":  pv.sum(axis=-1) + tv * df[..., -1],
+    }
+
+
+def equity_bridge(enterprise_value, debt, cash, shares) -> dict:
+    """EV → equity through net debt; price is NaN where there are no shares."""
+    import numpy as np
+
+    net_debt = np.asarray(debt, dtype=float) - cash
+    equity = enterprise_value - net_debt
+    shares = np.asarray(shares, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        price = np.where(shares != 0, equity / shares, np.nan)
+    return {"net_debt": net_debt, "equity_value": equity, "price_per_share": price}
+
+
+def _check_rates(wacc: float, terminal_growth: float):
+    # `not >` also rejects NaN
+    if not wacc > terminal_growth:
+        raise ValueError(
+            f"wacc ({wacc}) must be greater than terminal_growth ({terminal_growth})"
+        )
+
+
+class DCFValuation:
+    """
+    DCF valuation of a YPFModel.
+
+    Every output is a property derived from the model's schedules, so changing
+    wacc / terminal_growth on an instance re-prices it without reloading.
+    """
+
+    def __init__(self, model, wacc: float = 0.10, terminal_growth: float = 0.02):
+        _check_rates(wacc, terminal_growth)
+        self.model = model
+        self.wacc = wacc
+        self.terminal_growth = terminal_growth
+
+    @property
+    def projected_years(self) -> list[int]:
+        return self.model.loader.PROJECTED_YEARS
+
+    @property
+    def valuation_year(self) -> int:
+        return self.model.loader.HISTORICAL_YEARS[-1]
+
+    # ── Cash flows ───────────────────────────────────────────────────────────
+
+    @property
+    def free_cash_flow(self) -> dict[int, float]:
+        line_items = self.model.income_statement.line_items
+        nopat, da = line_items["nopat"], line_items["da"]
+        wc = self.model.cash_flow.operating["working_capital"]
+        capex = self.model.cash_flow.investing["capex"]
+        return {
+            y: free_cash_flow(nopat.get(y, 0.0), da.get(y, 0.0), wc.get(y, 0.0),
+                              capex.get(y, 0.0))
+            for y in self.projected_years
+        }
+
+    def _discounted(self) -> dict:
+        _check_rates(self.wacc, self.terminal_growth)   # they may have been changed since
+        return discounted_cash_flow(list(self.free_cash_flow.values()),
+                                    self.wacc, self.terminal_growth)
+
+    @property
+    def discount_factors(self) -> dict[int, float]:
+        """End-of-year discount factor for each projected year."""
+        years = self.projected_years
+        return dict(zip(years, discount_factors(self.wacc, len(years)).tolist()))
+
+    @property
+    def terminal_value(self) -> float:
+        return float(self._discounted()["terminal_value"])
+
+    # ── Enterprise → equity bridge ───────────────────────────────────────────
+
+    @property
+    def enterprise_value(self) -> float:
+        return float(self._discounted()["enterprise_value"])
+
+    def _debt_and_cash(self) -> tuple[float, float]:
+        y = self.valuation_year
+        debt = self.model.debt_and_interest.totals["total_loans_revolver"].get(y, 0.0)
+        cash = self.model.balance_sheet.current_assets["cash"].get(y, 0.0)
+        return debt, cash
+
+    def _bridge(self) -> dict:
+        return equity_bridge(self.enterprise_value, *self._debt_and_cash(),
+                             self.shares_outstanding)
+
+    @property
+    def net_debt(self) -> float:
+        debt, cash = self._debt_and_cash()
+        return debt - cash
+
+    @property
+    def equity_value(self) -> float:
+        return float(self._bridge()["equity_value"])
+
+    @property
+    def shares_outstanding(self) -> float:
+        return self.model.shareholders_equity.common_shares["ending"].get(self.valuation_year, 0.0)
+
+    @property
+    def price_per_share(self) -> float | None:
+        if not self.shares_outstanding:
+            return None
+        return float(self._bridge()["price_per_share"])
+
+    def summary(self) -> dict:
+        return {
+            "wacc":               self.wacc,
+            "terminal_growth":    self.terminal_growth,
+            "free_cash_flow":     self.free_cash_flow,
+            "terminal_value":     self.terminal_value,
+            "enterprise_value":   self.enterprise_value,
+            "net_debt":           self.net_debt,
+            "equity_value":       self.equity_value,
+            "shares_outstanding": self.shares_outstanding,
+            "price_per_share":    self.price_per_share,
+        }
+
+    def __repr__(self):
+        return f"<DCFValuation: wacc={self.wacc:.2%}, g={self.terminal_growth:.2%}>"
@@ -0,0 +1,212 @@
+"""
+Lightweight xlsx value reader for the YPF DCF Model.
+
+Reads cell values straight out of the workbook package without openpyxl:
+the archive is unzipped, the shared-strings table is resolved once, and each
+sheet's XML is stream-parsed row by row.  Only values are returned (the
+equivalent of openpyxl's data_only=True) – styles, formulas and number
+formats are never read, so date cells come back as their serial number.
+
+Usage:
+    with XlsxReader("model.xlsx") as reader:
+        for row, col, value in reader.iter_cells("Income Statement"):
+            ...
+"""
+
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Callable, Iterator
+
+_NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_DOC_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_ROW   = f"{_NS_MAIN}row"
+_CELL  = f"{_NS_MAIN}c"
+_VALUE = f"{_NS_MAIN}v"
+_TEXT  = f"{_NS_MAIN}t"
+_RUN   = f"{_NS_MAIN}r"
+_SI    = f"{_NS_MAIN}si"
+_IS    = f"{_NS_MAIN}is"
+_SHEET = f"{_NS_MAIN}sheet"
+_REL   = f"{_NS_PKG_REL}Relationship"
+
+_OFFICE_DOCUMENT = "/officeDocument"
+_SHARED_STRINGS  = "/sharedStrings"
+
+
+def _col_index(ref: str) -> int:
+    """Return the 1-indexed column of an A1-style cell reference ("AB12" → 28)."""
+    col = 0
+    for ch in ref:
+        if ch.isdigit():
+            break
+        col = col * 26 + (ord(ch) - 64)
+    return col
+
+
+def _cast_number(text: str) -> int | float:
+    """Cast a numeric cell the way openpyxl does: int unless it looks like a float."""
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def _rich_text(elem) -> str:
+    """Return the plain text of a <si> / <is> element (ignores phonetic runs)."""
+    t = elem.find(_TEXT)
+    if t is not None:
+        return t.text or ""
+    return "".join(rt.text or "" for rt in elem.iterfind(f"{_RUN}/{_TEXT}"))
+
+
+def _resolve(base_part: str, target: str) -> str:
+    """Resolve a relationship target relative to the part that declares it."""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base_part), target))
+
+
+def _rels_path(part: str) -> str:
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", f"{name}.rels")
+
+
+class XlsxReader:
+    """
+    Minimal read-only view of an .xlsx package.
+
+    Sheet names and part paths are resolved on construction; the shared-strings
+    table is loaded on the first sheet read and reused for every sheet after.
+    filepath may also be a binary file object (e.g. io.BytesIO of the file).
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._zip = zipfile.ZipFile(filepath)
+        self._shared_strings: list[str] | None = None
+        self._shared_strings_part: str | None = None
+        # {sheet_name: part path inside the archive}, in workbook order
+        self._sheet_parts: dict[str, str] = {}
+        self._read_workbook()
+
+    # ── Package structure ────────────────────────────────────────────────────
+
+    def _read_rels(self, part: str) -> dict[str, tuple[str, str]]:
+        """Return {rel_id: (type, resolved_target)} for a part's relationships."""
+        path = _rels_path(part)
+        if path not in self._zip.NameToInfo:
+            return {}
+        root = ET.fromstring(self._zip.read(path))
+        return {
+            rel.get("Id"): (rel.get("Type", ""), _resolve(part, rel.get("Target", "")))
+            for rel in root.iter(_REL)
+        }
+
+    def _read_workbook(self):
+        workbook_part = "xl/workbook.xml"
+        for rel_type, target in self._read_rels("").values():
+            if rel_type.endswith(_OFFICE_DOCUMENT):
+                workbook_part = target
+                break
+
+        rels = self._read_rels(workbook_part)
+        for rel_type, target in rels.values():
+            if rel_type.endswith(_SHARED_STRINGS):
+                self._shared_strings_part = target
+
+        root = ET.fromstring(self._zip.read(workbook_part))
+        for sheet in root.iter(_SHEET):
+            rel = rels.get(sheet.get(f"{_NS_DOC_REL}id"))
+            if rel is not None:
+                self._sheet_parts[sheet.get("name")] = rel[1]
+
+    def _load_shared_strings(self) -> list[str]:
+        if self._shared_strings is None:
+            strings = []
+            part = self._shared_strings_part
+            if part is not None and part in self._zip.NameToInfo:
+                with self._zip.open(part) as f:
+                    for _, elem in ET.iterparse(f):
+                        if elem.tag == _SI:
+                            strings.append(_rich_text(elem))
+                            elem.clear()
+            self._shared_strings = strings
+        return self._shared_strings
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return list(self._sheet_parts)
+
+    # ── Cell values ──────────────────────────────────────────────────────────
+
+    def _cell_value(self, cell, shared: list[str]):
+        kind = cell.get("t", "n")
+        if kind == "inlineStr":
+            is_ = cell.find(_IS)
+            return _rich_text(is_) if is_ is not None else None
+
+        v = cell.find(_VALUE)
+        if v is None or v.text is None:
+            return None
+        text = v.text
+        if kind == "n":
+            return _cast_number(text)
+        if kind == "s":
+            return shared[int(text)]
+        if kind == "b":
+            return text == "1"
+        if kind == "d":
+            return datetime.fromisoformat(text)
+        return text   # "str" (formula result) and "e" (error code)
+
+    def iter_cells(self, sheet_name: str,
+                   key_filter: Callable[[object], bool] | None = None
+                   ) -> Iterator[tuple[int, int, object]]:
+        """
+        Yield (row, col, value) for every non-empty cell of a sheet, in row-major
+        order.  Rows and columns are 1-indexed, matching openpyxl.
+
+        With key_filter, rows below the header whose column-A value is rejected
+        are skipped before their remaining cells are decoded.
+        """
+        part = self._sheet_parts.get(sheet_name)
+        if part is None:
+            raise KeyError(
+                f"Sheet '{sheet_name}' not found. "
+                f"Available: {self.sheetnames}"
+            )
+        shared = self._load_shared_strings()
+
+        row_idx = 0
+        with self._zip.open(part) as f:
+            for _, elem in ET.iterparse(f):
+                if elem.tag != _ROW:
+                    continue
+                r = elem.get("r")
+                row_idx = int(r) if r else row_idx + 1
+                col_idx = 0
+                for cell in elem.iter(_CELL):
+                    ref = cell.get("r")
+                    col_idx = _col_index(ref) if ref else col_idx + 1
+                    value = self._cell_value(cell, shared)
+                    if value is None:
+                        continue
+                    if key_filter is not None and row_idx > 1 and col_idx == 1 \
+                            and not key_filter(value):
+                        break
+                    yield row_idx, col_idx, value
+                elem.clear()
+
+    # ── Lifecycle ────────────────────────────────────────────────────────────
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
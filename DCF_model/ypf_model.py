@@ -1,11 +1,12 @@
 """
 YPF DCF Model – Top-level orchestrator.
 
-Instantiate with a path to the Model sheet data (CSV or Excel).
+Instantiate with a path to the model data: a multi-sheet Excel workbook
+(one sheet per schedule) or a CSV export of the Model sheet.
 Provides access to every schedule as a named attribute.
 
 Usage:
-    from ypf_model import YPFModel
+    from DCF_model import YPFModel
     model = YPFModel("YPF_DCF.xlsx")
 
     # Access any schedule
@@ -14,10 +15,17 @@ Usage:
 
     # Get a full summary dict of every schedule
     full = model.summary()
+
+    # Patch in a new actual year without reloading (see delta.py)
+    model.apply(read_delta("data/YPF_2025Q4.json"))
 """
 
-from data_loader import DataLoader
-from schedules import (
+import os
+
+from . import timings
+from .data_loader import DataLoader
+from .multi_sheet_loader import MultiSheetLoader
+from .schedules import (
     OilRevenueSchedule,
     CrudeProductsRevenueSchedule,
     OtherProductsRevenueSchedule,
@@ -39,11 +47,32 @@ class YPFModel:
     """
     Master model object for the YPF DCF.
     
-    Loads data once via DataLoader and exposes each schedule as a property.
+    Loads data once – Excel workbooks via MultiSheetLoader, CSV files via
+    DataLoader – and exposes each schedule as a property.  engine is passed
+    through to the loader ("openpyxl" or "xml"), and so is data (the file's
+    bytes, when they have already been read); further keyword options
+    (workers, projection, trace_access) go to MultiSheetLoader.
     """
 
-    def __init__(self, filepath: str):
-        self.loader = DataLoader(filepath)
+    def __init__(self, filepath: str, engine: str = "openpyxl", **loader_options):
+        ext = os.path.splitext(filepath)[1].lower()
+        if ext in ('.xlsx', '.xlsm'):
+            self.loader = MultiSheetLoader(filepath, engine=engine, **loader_options)
+        else:
+            self.loader = DataLoader(filepath, engine=engine, data=loader_options.get("data"))
+        self._init_schedules()
+
+    @classmethod
+    def from_loader(cls, loader) -> "YPFModel":
+        """Build a model around an already-loaded loader (anything with .field())."""
+        model = cls.__new__(cls)
+        model.loader = loader
+        model._init_schedules()
+        return model
+
+    def _init_schedules(self):
+        # SCHEDULE_NAMEs whose data changed since the caller last cleared this
+        self.dirty: set[str] = set()
 
         # ── Revenue schedules ──
         self.oil_revenue = OilRevenueSchedule(self.loader)
@@ -87,9 +116,35 @@ class YPFModel:
             self.shareholders_equity,
         ]
 
+    def scenario(self, name: str = "scenario"):
+        """A copy-on-write Scenario overlay sharing this model's loaded data."""
+        from .scenario import Scenario
+        return Scenario(self, name=name)
+
+    def apply(self, delta) -> list[str]:
+        """
+        Patch the loaded data in place with a Delta (or its JSON spec) and
+        return the names of the schedules it touched, which are also added to
+        self.dirty.  The loader must support apply() (MultiSheetLoader does).
+        """
+        from .delta import Delta
+
+        if not hasattr(self.loader, "apply"):
+            raise TypeError(f"{type(self.loader).__name__} cannot be patched in place")
+        if not isinstance(delta, Delta):
+            delta = Delta.from_spec(delta)
+        sheets = self.loader.apply(delta)
+        touched = [s.SCHEDULE_NAME for s in self.all_schedules if s.SHEET_NAME in sheets]
+        self.dirty.update(touched)
+        return touched
+
     def summary(self) -> dict:
         """Return the full model as a nested dict (every schedule's summary)."""
-        return {s.SCHEDULE_NAME: s.summary() for s in self.all_schedules}
+        out = {}
+        for s in self.all_schedules:
+            with timings.span("summary", s.SCHEDULE_NAME):
+                out[s.SCHEDULE_NAME] = s.summary()
+        return out
 
     def __repr__(self):
         return f"<YPFModel: {len(self.all_schedules)} schedules loaded>"
@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the DCF model pipeline.
+
+Usage (from repo root):
+    python -m benchmarks.run --companies 5 --fields 200 --years 15
+"""
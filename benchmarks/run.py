@@ -0,0 +1,199 @@
+"""
+Time the load, model and export stages on synthetic data.
+
+Usage (from repo root):
+    python -m benchmarks.run [--companies 5] [--fields 200] [--years 15]
+                             [--repeat 3] [--engine xml] [--compare OLD.json]
+
+Stages (each timed separately, median of --repeat runs per company):
+    load_multi   MultiSheetLoader on a multi-sheet workbook
+    load_csv     DataLoader on a Model-sheet CSV
+    summary      YPFModel.summary() over all 14 schedules
+    export       ExcelExporter.export()
+
+Memory per stage is the peak Python heap of one extra, untimed call traced
+with tracemalloc from a fresh start, so it belongs to that stage alone
+(tracing would distort the timings).  The process's peak RSS – which
+includes generating the inputs – is reported once, for the whole run.
+
+Results are printed and written to benchmarks/results/<timestamp>_<commit>.json.
+Pass a previous result file with --compare to print the ratio per stage.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime, timezone
+
+from DCF_model.data_loader import DataLoader
+from DCF_model.multi_sheet_loader import MultiSheetLoader
+from DCF_model.ypf_model import YPFModel
+from excel_export.exporter import ExcelExporter, _flatten
+
+from .synthetic import write_model_csv, write_workbook
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def _peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _peak_alloc_mb(fn) -> float:
+    """Peak Python heap allocated during one fn() call, traced from zero."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def _time(fn, repeat: int) -> tuple[float, object]:
+    """Return (median seconds, last result) over `repeat` calls of fn()."""
+    times, result = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times), result
+
+
+class _Stage:
+    def __init__(self, unit: str):
+        self.unit = unit
+        self.seconds = 0.0
+        self.units = 0
+        self.peak_alloc_mb = 0.0
+
+    def add(self, seconds: float, units: int, fn):
+        self.seconds += seconds
+        self.units += units
+        self.peak_alloc_mb = max(self.peak_alloc_mb, _peak_alloc_mb(fn))
+
+    def to_dict(self, companies: int) -> dict:
+        return {
+            "seconds":              self.seconds,
+            "seconds_per_company":  self.seconds / companies,
+            f"{self.unit}_per_s":   self.units / self.seconds if self.seconds else None,
+            "peak_alloc_mb":        self.peak_alloc_mb,
+        }
+
+
+def run(companies: int, fields: int | None, years: int, repeat: int,
+        engine: str, workdir: str) -> dict:
+    stages = {
+        "load_multi": _Stage("cells"),
+        "load_csv":   _Stage("cells"),
+        "summary":    _Stage("schedules"),
+        "export":     _Stage("rows"),
+    }
+    for c in range(companies):
+        xlsx = os.path.join(workdir, f"C{c}_historicals.xlsx")
+        csv_path = os.path.join(workdir, f"C{c}_model.csv")
+        out = os.path.join(workdir, f"C{c}_DCF.xlsx")
+        xlsx_cells = write_workbook(xlsx, fields, years, seed=c)
+        csv_cells = write_model_csv(csv_path, fields or 500, years, seed=c)
+
+        load_multi = lambda: MultiSheetLoader(xlsx, engine=engine)
+        sec, loader = _time(load_multi, repeat)
+        stages["load_multi"].add(sec, xlsx_cells, load_multi)
+
+        load_csv = lambda: DataLoader(csv_path)
+        sec, _ = _time(load_csv, repeat)
+        stages["load_csv"].add(sec, csv_cells, load_csv)
+
+        model = YPFModel.from_loader(loader)
+        sec, summary = _time(model.summary, repeat)
+        stages["summary"].add(sec, len(summary), model.summary)
+
+        exporter = ExcelExporter(model, out)
+        sec, _ = _time(exporter.export, repeat)
+        rows = sum(1 for s in summary.values() for *_, series in _flatten(s) if series)
+        stages["export"].add(sec, rows, exporter.export)
+
+    return {
+        "commit":      _git_commit(),
+        "timestamp":   datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python":      platform.python_version(),
+        "platform":    platform.platform(),
+        "params":      {"companies": companies, "fields": fields, "years": years,
+                        "repeat": repeat, "engine": engine},
+        "stages":      {name: s.to_dict(companies) for name, s in stages.items()},
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _print_report(result: dict, baseline: dict | None = None):
+    p = result["params"]
+    print(f"commit {result['commit']}  companies={p['companies']} fields={p['fields']} "
+          f"years={p['years']} repeat={p['repeat']} engine={p['engine']}")
+    print(f"{'stage':<12}{'total s':>10}{'s/company':>12}{'throughput':>20}{'peak MB':>9}"
+          + (f"{'vs base':>10}" if baseline else ""))
+    for name, s in result["stages"].items():
+        rate_key = next(k for k in s if k.endswith("_per_s"))
+        rate = f"{s[rate_key]:,.0f} {rate_key[:-6]}/s" if s[rate_key] else "-"
+        line = (f"{name:<12}{s['seconds']:>10.3f}{s['seconds_per_company']:>12.4f}"
+                f"{rate:>20}{s['peak_alloc_mb']:>9.1f}")
+        base = (baseline or {}).get("stages", {}).get(name)
+        if base:
+            line += f"{s['seconds'] / base['seconds']:>9.2f}x"
+        print(line)
+    print(f"peak RSS: {result['peak_rss_mb']:.1f} MB")
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="DCF pipeline benchmarks")
+    parser.add_argument("--companies", type=int, default=3)
+    parser.add_argument("--fields", type=int, default=None,
+                        help="rows per sheet (default: only the schedules' own fields)")
+    parser.add_argument("--years", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--engine", choices=("openpyxl", "xml"), default="openpyxl")
+    parser.add_argument("--out", default=RESULTS_DIR, help="directory for the JSON result")
+    parser.add_argument("--compare", help="previous result JSON to compare against")
+    args = parser.parse_args(argv)
+
+    # The generated workbook reproduces the schedules' >31-char sheet name
+    warnings.filterwarnings("ignore", message="Title is more than 31 characters")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        result = run(args.companies, args.fields, args.years, args.repeat,
+                     args.engine, workdir)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    _print_report(result, baseline)
+
+    os.makedirs(args.out, exist_ok=True)
+    stamp = result["timestamp"].replace(":", "").replace("-", "")
+    path = os.path.join(args.out, f"{stamp}_{result['commit']}.json")
+    with open(path, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"Saved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Synthetic inputs shaped like the real model data.
+
+- Multi-sheet workbooks: one sheet per schedule with exactly the field keys
+  the schedule classes read (discovered by running each schedule's summary()
+  against a recording loader), optionally padded with filler rows.
+- Model-sheet CSVs in the row/column layout DataLoader expects
+  (labels in col C, 2020 in col H = 8).
+"""
+
+import csv
+import random
+import warnings
+
+import openpyxl
+
+from DCF_model.ypf_model import YPFModel
+from DCF_model.data_loader import DataLoader
+
+
+class _SchemaRecorder:
+    """Stand-in loader that records every (sheet, key) a schedule asks for."""
+
+    HISTORICAL_YEARS = DataLoader.HISTORICAL_YEARS
+    PROJECTED_YEARS  = DataLoader.PROJECTED_YEARS
+    ALL_YEARS        = DataLoader.ALL_YEARS
+
+    def __init__(self):
+        self.fields: dict[str, dict[str, None]] = {}
+
+    def field(self, sheet_name: str, key: str) -> dict[int, float]:
+        self.fields.setdefault(sheet_name, {})[key] = None
+        return {}
+
+
+def schedule_schema() -> dict[str, list[str]]:
+    """Return {sheet_name: [field_key, ...]} for every schedule in YPFModel."""
+    recorder = _SchemaRecorder()
+    for schedule in YPFModel.from_loader(recorder).all_schedules:
+        schedule.summary()
+    return {sheet: list(keys) for sheet, keys in recorder.fields.items()}
+
+
+def years_axis(n_years: int, first_year: int = 2020) -> list[int]:
+    return list(range(first_year, first_year + n_years))
+
+
+def write_workbook(path: str, fields: int | None = None, n_years: int = 15,
+                   seed: int = 0) -> int:
+    """
+    Write a multi-sheet workbook for MultiSheetLoader and return its cell count.
+
+    fields – rows per sheet; sheets are padded with filler rows up to this
+             count (never fewer than the schedule's own keys).
+    """
+    rnd = random.Random(seed)
+    years = years_axis(n_years)
+    # openpyxl rather than xlsxwriter: one SHEET_NAME exceeds Excel's 31-char
+    # limit, which xlsxwriter refuses and openpyxl only warns about
+    wb = openpyxl.Workbook(write_only=True)
+    cells = 0
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        for sheet_name, keys in schedule_schema().items():
+            n_fields = max(len(keys), fields or 0)
+            keys = keys + [f"filler_{i}" for i in range(n_fields - len(keys))]
+            ws = wb.create_sheet(sheet_name)
+            ws.append(["field", *years])
+            for key in keys:
+                ws.append([key, *(rnd.uniform(-1000.0, 1000.0) for _ in years)])
+            cells += n_fields * n_years
+        wb.save(path)
+    return cells
+
+
+def write_model_csv(path: str, fields: int = 500, n_years: int = 15, seed: int = 0) -> int:
+    """Write a Model-sheet CSV for DataLoader and return its numeric cell count."""
+    rnd = random.Random(seed)
+    first_col = DataLoader.YEAR_TO_COL[DataLoader.ALL_YEARS[0]]   # col H
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow([""] * (first_col - 1) + years_axis(n_years))
+        for i in range(fields):
+            row = ["", "", f"line item {i}", "", "", "", ""]
+            row += [f"{rnd.uniform(-1000.0, 1000.0):.4f}" for _ in range(n_years)]
+            w.writerow(row)
+    return fields * n_years
@@ -0,0 +1,247 @@
+"""
+Output backends: the same model rows as a styled workbook or as plain data.
+
+Every backend writes one output file.  add(model, ticker) appends a model,
+close() finishes the file; a backend is also a context manager.  The data
+backends write one row per data line of _flatten(schedule.summary()) – the
+rows the workbook shows – with a fixed schema:
+
+    ticker, schedule, path, label, depth, 2020, 2021, …, 2034
+
+path is the dotted key path inside the schedule summary ("line_items.revenue"),
+a stable id for machine consumers; missing years are null.  Any number of
+tickers can go into one data file, in a single pass.
+
+    xlsx      ExcelExporter – one model per file (styled workbook)
+    parquet   pyarrow, one row group per `batch_rows` rows
+    arrow     Arrow IPC file format (Feather v2), same batching
+    csv       header + rows, missing years empty
+    jsonl     one JSON object per row, missing years null
+
+Parquet and Arrow need pyarrow, which is imported only when they are used.
+
+Usage:
+    from excel_export.backends import open_backend
+    with open_backend("models.parquet") as out:
+        for ticker, model in models.items():
+            out.add(model, ticker)
+"""
+
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+
+from .exporter import ALL_YEARS, _walk, check_timeline
+
+COLUMNS = ("ticker", "schedule", "path", "label", "depth") + tuple(str(y) for y in ALL_YEARS)
+
+
+def model_rows(model) -> list[tuple]:
+    """
+    (schedule, path, label, depth, [value per year]) for every data row of
+    the model.  Missing and NaN years are None, so every backend writes them
+    as its own null without another pass over the values.
+    """
+    check_timeline(model)
+    rows = []
+    for schedule in model.all_schedules:
+        name = schedule.SCHEDULE_NAME
+        for path, label, series in _walk(schedule.summary()):
+            if series is not None:
+                values = [None if v is None or v != v else v for v in map(series.get, ALL_YEARS)]
+                rows.append((name, ".".join(path), label, len(path) - 1, values))
+    return rows
+
+
+class Backend(ABC):
+    """One output file: add() models, then close()."""
+
+    extension = ""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows = 0
+        self.models = 0
+
+    def add(self, model, ticker: str = ""):
+        self.add_rows(ticker, model_rows(model))
+
+    @abstractmethod
+    def add_rows(self, ticker: str, rows: list[tuple]):
+        """Append rows already built by model_rows() (e.g. in a worker process)."""
+
+    def close(self) -> str:
+        return self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self.path}, {self.models} models, {self.rows} rows>"
+
+
+class ExcelBackend(Backend):
+    """The styled workbook (ExcelExporter); holds exactly one model."""
+
+    extension = "xlsx"
+
+    def __init__(self, path: str, **exporter_options):
+        super().__init__(path)
+        self.options = exporter_options   # sensitivity, layout, workers, …
+
+    def add(self, model, ticker: str = ""):
+        from .exporter import ExcelExporter
+
+        if self.models:
+            raise ValueError("The xlsx backend writes one model per file")
+        ExcelExporter(model, self.path, **self.options).export()
+        self.models = 1
+
+    def add_rows(self, ticker: str, rows: list[tuple]):
+        raise ValueError("The xlsx backend needs the model itself, not its rows")
+
+
+class CsvBackend(Backend):
+    extension = "csv"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(COLUMNS)
+
+    def add_rows(self, ticker: str, rows: list[tuple]):
+        # csv writes None as an empty field
+        self._writer.writerows((ticker, schedule, path, label, depth, *values)
+                               for schedule, path, label, depth, values in rows)
+        self.rows += len(rows)
+        self.models += 1
+
+    def close(self) -> str:
+        self._file.close()
+        return self.path
+
+
+class JsonLinesBackend(Backend):
+    extension = "jsonl"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = open(path, "w")
+
+    def add_rows(self, ticker: str, rows: list[tuple]):
+        dumps, years = json.dumps, COLUMNS[5:]
+        self._file.writelines(
+            dumps({"ticker": ticker, "schedule": schedule, "path": path, "label": label,
+                   "depth": depth, **dict(zip(years, values))}) + "\n"
+            for schedule, path, label, depth, values in rows
+        )
+        self.rows += len(rows)
+        self.models += 1
+
+    def close(self) -> str:
+        self._file.close()
+        return self.path
+
+
+class _ArrowBackend(Backend):
+    """Buffers rows column-wise and writes a batch every `batch_rows` rows."""
+
+    def __init__(self, path: str, batch_rows: int = 65536):
+        super().__init__(path)
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(f"pyarrow is required to write {self.extension} files") from None
+        self._pa = pa
+        self.schema = pa.schema(
+            [("ticker", pa.string()), ("schedule", pa.string()), ("path", pa.string()),
+             ("label", pa.string()), ("depth", pa.int8())]
+            + [(name, pa.float64()) for name in COLUMNS[5:]]
+        )
+        self.batch_rows = batch_rows
+        self._writer = self._open()
+        self._reset()
+
+    @abstractmethod
+    def _open(self):
+        """The pyarrow writer for self.path and self.schema."""
+
+    def _reset(self):
+        self._tickers, self._text, self._values = [], [], []
+
+    def add_rows(self, ticker: str, rows: list[tuple]):
+        self._tickers.append((ticker, len(rows)))
+        self._text.extend(row[:4] for row in rows)
+        self._values.extend(row[4] for row in rows)
+        self.rows += len(rows)
+        self.models += 1
+        if len(self._values) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self):
+        import numpy as np
+
+        if not self._values:
+            return
+        pa = self._pa
+        schedule, path, label, depth = zip(*self._text)
+        values = np.array(self._values, dtype=float)   # None → NaN
+        columns = [
+            pa.array([t for t, n in self._tickers for _ in range(n)], pa.string()),
+            pa.array(schedule, pa.string()),
+            pa.array(path, pa.string()),
+            pa.array(label, pa.string()),
+            pa.array(depth, pa.int8()),
+        ] + [pa.array(values[:, j], pa.float64(), from_pandas=True)   # NaN → null
+             for j in range(values.shape[1])]
+        self._write(pa.record_batch(columns, schema=self.schema))
+        self._reset()
+
+    def _write(self, batch):
+        self._writer.write_batch(batch)
+
+    def close(self) -> str:
+        self._flush()
+        self._writer.close()
+        return self.path
+
+
+class ParquetBackend(_ArrowBackend):
+    extension = "parquet"
+
+    def _open(self):
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(self.path, self.schema, compression="zstd")
+
+    def _write(self, batch):
+        self._writer.write_batch(batch, row_group_size=self.batch_rows)
+
+
+class ArrowBackend(_ArrowBackend):
+    extension = "arrow"
+
+    def _open(self):
+        return self._pa.ipc.new_file(self.path, self.schema)
+
+
+BACKENDS = {
+    "xlsx":    ExcelBackend,
+    "parquet": ParquetBackend,
+    "arrow":   ArrowBackend,
+    "csv":     CsvBackend,
+    "jsonl":   JsonLinesBackend,
+}
+
+
+def open_backend(path: str, fmt: str | None = None, **options) -> Backend:
+    """Backend for fmt (default: from the file extension) writing to path."""
+    fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in BACKENDS:
+        raise ValueError(f"Unsupported format: {fmt}. Choose from {list(BACKENDS)}")
+    return BACKENDS[fmt](path, **options)
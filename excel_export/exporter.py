@@ -7,9 +7,44 @@ Replicates the layout of the source YPF DCF.xlsx "Model" sheet:
 - Year headers formatted as "2020A" (historical) and "2025E" (projected)
 - Historical data cells (2020-2024) rendered in blue font
 - Column structure mirrors the source: A-G are spacers/labels, H-V are data
+- Optional sensitivity block after the schedules: tornado table + bar chart
+
+Two layouts:
+    layout="single"   every schedule stacked in one "Model" sheet (the source layout)
+    layout="sheets"   a "Summary" sheet plus one sheet per schedule.  The summary
+                      links to every sheet, pulls key lines from them with
+                      cross-sheet formulas and carries a live DCF valuation on
+                      top of those lines; each schedule sheet links back.
+
+Each sheet is first generated into a _SheetBuffer (no workbook involved), so
+the schedules can be generated concurrently (workers > 1) and then written
+into the workbook in row order.  The sheets layout streams every sheet with
+xlsxwriter's constant_memory mode.
+
+The static part of a schedule sheet (header block, labels, borders, row
+heights and positions) is compiled once per schedule and summary structure
+into a _LayoutTemplate and reused by later exports in the process, which
+then only add the numbers.
+
+With processes > 1 the sheet XML itself is rendered in worker processes –
+one chunk per schedule – and zipped into a skeleton workbook written by
+xlsxwriter (see parts.py), so the serial part of an export is the skeleton
+and the final zip.
 """
 
+import io
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
 import xlsxwriter
+from xlsxwriter.utility import quote_sheetname, xl_rowcol_to_cell
+
+from DCF_model import timings
+from DCF_model.series import Series
+
+from .parts import assemble, render
+from .styles import LABEL_STYLES, NUMBER_STYLE, NUM_FORMATS, SECTION_STYLES, STYLES, S
 
 COMPANY_NAME  = "Yacimientos Petrolíferos Fiscales S.A."
 COMPANY_SHORT = "YPF"   # used for the output filename
@@ -32,12 +67,76 @@ COL_DATA_END = 21  # V: year 2034        (width 13.0)
 _N_HIST     = len([y for y in ALL_YEARS if y in HIST_YEARS])
 COL_PROJ_0  = COL_DATA_0 + _N_HIST  # col M (index 12)
 
+# Number format key → style id for each year column (blue for historical years)
+YEAR_STYLES = {
+    key: tuple(NUMBER_STYLE[y in HIST_YEARS][key] for y in ALL_YEARS) for key in NUM_FORMATS
+}
+
+
+def _year_segments() -> list[tuple[int, int, bool]]:
+    """(start, end, is_hist) for each run of ALL_YEARS with the same historical flag."""
+    segments, start = [], 0
+    for i in range(1, N_YEARS + 1):
+        if i == N_YEARS or (ALL_YEARS[i] in HIST_YEARS) != (ALL_YEARS[start] in HIST_YEARS):
+            segments.append((start, i, ALL_YEARS[start] in HIST_YEARS))
+            start = i
+    return segments
+
+
+# Data rows are written as one write_row per segment (historical, projected)
+YEAR_SEGMENTS = _year_segments()
+SEGMENT_STYLES = {key: {h: NUMBER_STYLE[h][key] for h in (True, False)} for key in NUM_FORMATS}
+
+
+SUMMARY_SHEET     = "Summary"
+SENSITIVITY_SHEET = "Sensitivity"
+LAYOUTS           = ("single", "sheets")
+
+# Summary-sheet key lines: (label, model attribute, key path in its summary())
+KEY_LINES = (
+    ("Revenue",            "income_statement",    ("line_items", "revenue")),
+    ("EBITDA",             "income_statement",    ("line_items", "ebitda")),
+    ("Net Income",         "income_statement",    ("line_items", "net_income")),
+    ("NOPAT",              "income_statement",    ("line_items", "nopat")),
+    ("D&A",                "income_statement",    ("line_items", "da")),
+    ("Working Capital",    "cash_flow",           ("operating", "working_capital")),
+    ("Capex",              "cash_flow",           ("investing", "capex")),
+    ("Cash",               "balance_sheet",       ("current_assets", "cash")),
+    ("Total Debt",         "debt_and_interest",   ("totals", "total_loans_revolver")),
+    ("Shares Outstanding", "shareholders_equity", ("common_shares", "ending")),
+)
+
+
+def check_timeline(model):
+    """
+    Raise ValueError if the model has years outside ALL_YEARS (e.g. a delta
+    added a year column): every layout writes the fixed 15-year timeline.
+    """
+    loader = getattr(model, "loader", model)
+    outside = sorted(set(getattr(loader, "ALL_YEARS", ALL_YEARS)) - set(ALL_YEARS))
+    if outside:
+        raise ValueError(f"Years {outside} are outside the export timeline "
+                         f"{ALL_YEARS[0]}-{ALL_YEARS[-1]}")
+
 
 def _is_series(val) -> bool:
-    """Return True if val is a {year: float} series dict."""
+    """Return True if val is a non-empty Series or plain {year: float} dict."""
+    if type(val) is Series:
+        return bool(val)
     return isinstance(val, dict) and bool(val) and all(isinstance(k, int) for k in val)
 
 
+def _walk(data: dict, path: tuple = ()):
+    """Like _flatten, but yields (key path, label, series_or_None)."""
+    for key, val in data.items():
+        label = key.replace("_", " ").title()
+        if _is_series(val):
+            yield path + (key,), label, val
+        elif isinstance(val, (dict, Series)):
+            yield path + (key,), label, None
+            yield from _walk(val, path + (key,))
+
+
 def _flatten(data: dict, depth: int = 0):
     """
     Recursively yield (depth, label, series_or_None) from a nested summary dict.
@@ -45,13 +144,102 @@ def _flatten(data: dict, depth: int = 0):
     Yields (depth, label, None)         – intermediate dicts  → section header row
     Yields (depth, label, {year: val})  – leaf year-series    → data row
     """
-    for key, val in data.items():
-        label = key.replace("_", " ").title()
-        if _is_series(val):
-            yield depth, label, val
-        elif isinstance(val, dict):
-            yield depth, label, None
-            yield from _flatten(val, depth + 1)
+    for path, label, series in _walk(data):
+        yield depth + len(path) - 1, label, series
+
+
+def sheet_name(schedule) -> str:
+    """Worksheet name for a schedule (Excel: at most 31 chars, none of []:*?/\\)."""
+    name = re.sub(r"[\[\]:*?/\\]", "", schedule.SCHEDULE_NAME)
+    if len(name) > 31:
+        name = name.removesuffix(" Schedule")
+    return name[:31]
+
+
+def _ref(sheet: str, row: int, col: int, absolute: bool = False) -> str:
+    return f"{quote_sheetname(sheet)}!{xl_rowcol_to_cell(row, col, absolute, absolute)}"
+
+
+class _SheetBuffer:
+    """
+    The cells of one worksheet, recorded without a workbook so sheets can be
+    generated concurrently and written out afterwards (in row order).
+
+    Cells are (col, kind, value, style, extra): style is a STYLES id and kind
+    one of "str" | "num" | "blank" | "formula" (extra = cached value) |
+    "url" (extra = text) | "row" (value = a list written from col onwards
+    with one write_row call; None entries are formatted blanks).
+    """
+
+    __slots__ = ("name", "rows", "heights", "refs", "n_rows", "cells")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rows: dict[int, list[tuple]] = {}
+        self.heights: dict[int, float] = {}
+        self.refs: dict[tuple, int] = {}   # summary key path → data row
+        self.n_rows = 0
+        self.cells = 0
+
+    def put(self, row: int, col: int, kind: str, value, style: int, extra=None):
+        self.rows.setdefault(row, []).append((col, kind, value, style, extra))
+
+    def height(self, row: int, height: float):
+        self.heights[row] = height
+
+    def blanks(self, row: int, col_start: int, col_end: int, style: int):
+        if col_end >= col_start:
+            self.put(row, col_start, "row", [None] * (col_end - col_start + 1), style)
+
+    def values(self, row: int, col: int, values: list, styles: dict[bool, int]) -> int:
+        """
+        Write a full year vector from col: one run per year segment, split
+        further only at missing (None) values.  Returns the cells written.
+        """
+        cells = self.rows.setdefault(row, [])
+        written = 0
+        for start, end, is_hist in YEAR_SEGMENTS:
+            style = styles[is_hist]
+            segment = values[start:end]
+            if None not in segment:
+                cells.append((col + start, "row", segment, style, None))
+                written += end - start
+                continue
+            run = start
+            for i in range(start, end + 1):
+                if i == end or values[i] is None:
+                    if i > run:
+                        cells.append((col + run, "row", values[run:i], style, None))
+                        written += i - run
+                    run = i + 1
+        return written
+
+    def center_across(self, row: int, col_start: int, col_end: int, text, style: int):
+        """Text in col_start and blanks through col_end, all in one center_across style."""
+        self.put(row, col_start, "str", text, style)
+        self.blanks(row, col_start + 1, col_end, style)
+
+    def emit(self, ws, fmts: list, offset: int = 0):
+        """Write the buffer into ws (fmts from STYLES.materialize), shifted down by offset rows."""
+        write_row, write_number, write_string = ws.write_row, ws.write_number, ws.write_string
+        heights, rows = self.heights, self.rows
+        for row in sorted(rows.keys() | heights.keys()):
+            r = row + offset
+            if row in heights:
+                ws.set_row(r, heights[row])
+            for col, kind, value, style, extra in rows.get(row, ()):
+                if kind == "row":
+                    write_row(r, col, value, fmts[style])
+                elif kind == "num":
+                    write_number(r, col, value, fmts[style])
+                elif kind == "str":
+                    write_string(r, col, value, fmts[style])
+                elif kind == "blank":
+                    ws.write_blank(r, col, None, fmts[style])
+                elif kind == "formula":
+                    ws.write_formula(r, col, value, fmts[style], extra)
+                else:
+                    ws.write_url(r, col, value, fmts[style], extra)
 
 
 def _center_across(ws, row: int, col_start: int, col_end: int, text, fmt):
@@ -60,112 +248,220 @@ def _center_across(ws, row: int, col_start: int, col_end: int, text, fmt):
     center_across format.  This is the only way to make center_across span
     reliably all the way to col_end in xlsxwriter (mirrors old_code technique).
     """
-    ws.write(row, col_start, text, fmt)
-    for c in range(col_start + 1, col_end + 1):
-        ws.write_blank(row, c, None, fmt)
+    ws.write_row(row, col_start, [text] + [None] * (col_end - col_start), fmt)
 
 
-def _num_fmt_key(label: str, series: dict) -> str:
+def _label_fmt_keys(label: str) -> tuple[str | None, str]:
     """
-    Return one of "int" | "dec" | "pct" based on label keywords and value range.
+    The label-keyword half of _num_fmt_key: (format the label forces, or None;
+    format to use when the values don't look like ratios).
     """
     lo = label.lower()
     if any(x in lo for x in ("margin", "growth", "yield", "roe", "return on", "rate")):
-        return "pct"
-    vals = [v for v in series.values() if isinstance(v, (int, float))]
-    if vals and all(-2.5 <= v <= 2.5 for v in vals):
-        return "pct"
+        return "pct", "pct"
     if any(x in lo for x in ("pricing", "price", "$/", "per boe", "per bbl")):
-        return "dec"
-    return "int"
+        return None, "dec"
+    return None, "int"
 
 
-class ExcelExporter:
-    """Exports a YPFModel to a single-sheet formatted Excel file."""
+def _range_fmt_key(series: dict, fallback: str) -> str:
+    """"pct" if every numeric value lies in [-2.5, 2.5], else fallback."""
+    numeric = False
+    for v in series.values():
+        if isinstance(v, (int, float)):
+            if not -2.5 <= v <= 2.5:
+                return fallback
+            numeric = True
+    return "pct" if numeric else fallback
 
-    _C_HIST_FONT = "#0000FF"   # blue – historical hard-coded input cells
-    _C_FONT      = "Calibri"
 
-    def __init__(self, model, output_path: str):
-        self.model = model
-        self.output_path = output_path
+def _num_fmt_key(label: str, series: dict) -> str:
+    """
+    Return one of "int" | "dec" | "pct" based on label keywords and value range.
+    """
+    forced, fallback = _label_fmt_keys(label)
+    return forced or _range_fmt_key(series, fallback)
 
-    def export(self) -> str:
-        wb = xlsxwriter.Workbook(self.output_path)
-        ws = wb.add_worksheet("Model")
-        ws.hide_gridlines(2)
 
-        fmts = self._make_formats(wb)
-        self._setup_columns(ws)
+class _LayoutTemplate:
+    """
+    The static part of one schedule sheet – header block, section and label
+    cells, closing border, row heights and the row of every data line –
+    compiled once per (schedule, sheet, summary structure, timeline).
+    fill() copies it and adds only the numbers.
+
+    sections  (parent, key, keys) for every section dict of the summary, the
+              root first; a summary matches if every section has the same keys
+    lines     (row, parent section, key, forced format, fallback format)
+    """
+
+    __slots__ = ("static", "sections", "lines")
+
+    def __init__(self, static: _SheetBuffer, sections: tuple, lines: tuple):
+        self.static = static
+        self.sections = sections
+        self.lines = lines
+
+    def _match(self, summary: dict) -> list[dict] | None:
+        nodes = []
+        for parent, key, keys in self.sections:
+            node = summary if parent < 0 else nodes[parent][key]
+            if not isinstance(node, (dict, Series)) or tuple(node) != keys:
+                return None
+            nodes.append(node)
+        return nodes
+
+    def fill(self, summary: dict) -> _SheetBuffer | None:
+        """A buffer with summary's numbers, or None if summary has another structure."""
+        nodes = self._match(summary)
+        if nodes is None:
+            return None
+        static = self.static
+        buf = _SheetBuffer(static.name)
+        buf.rows = {row: list(cells) for row, cells in static.rows.items()}
+        buf.heights = dict(static.heights)
+        buf.refs = dict(static.refs)
+        buf.n_rows = static.n_rows
+        for row, parent, key, forced, fallback in self.lines:
+            series = nodes[parent][key]
+            # Its parent's keys matched, so checking one year key is enough
+            if type(series) is Series:
+                if not series:
+                    return None
+            elif not isinstance(series, dict) or type(next(iter(series), None)) is not int:
+                return None
+            styles = SEGMENT_STYLES[forced or _range_fmt_key(series, fallback)]
+            buf.cells += buf.values(row, COL_DATA_0, list(map(series.get, ALL_YEARS)), styles)
+        return buf
+
+    def __repr__(self):
+        return (f"<_LayoutTemplate: {self.static.name}, {len(self.lines)} lines, "
+                f"{self.static.n_rows} rows>")
+
+
+# Compiled templates, (schedule, sheet, back_link, timeline) → the last few
+# summary structures seen for it
+_TEMPLATES: dict[tuple, list[_LayoutTemplate]] = {}
+_TEMPLATES_PER_KEY = 4
+TIMELINE = tuple(ALL_YEARS)
 
-        row = 0
-        for schedule in self.model.all_schedules:
-            row = self._write_schedule(ws, fmts, schedule, row)
 
-        wb.close()
+class ExcelExporter:
+    """Exports a YPFModel to a formatted Excel file (one sheet, or a sheet per schedule)."""
+
+    def __init__(self, model, output_path: str, sensitivity=None,
+                 layout: str = "single", workers: int = 1, processes: int = 1,
+                 wacc: float = 0.10, terminal_growth: float = 0.02):
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unsupported layout: {layout}. Choose from {list(LAYOUTS)}")
+        self.model = model
+        self.output_path = output_path
+        self.sensitivity = sensitivity   # optional DCF_model.sensitivity.TornadoResult
+        self.layout = layout
+        self.workers = workers           # threads generating the schedule buffers
+        self.processes = processes       # processes rendering the sheet XML (> 1: parts.py)
+        self.wacc = wacc                 # summary-sheet valuation inputs (sheets layout)
+        self.terminal_growth = terminal_growth
+
+    def export(self) -> str:
+        check_timeline(self.model)
+        schedules = self.model.all_schedules
+        links = self.layout == "sheets"
+        build = lambda s: self._schedule_buffer(s, sheet_name(s), back_link=links)
+        if self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                buffers = list(pool.map(build, schedules))
+        else:
+            buffers = [build(s) for s in schedules]
+        timings.count("cells_written", sum(b.cells for b in buffers))
+        if self.processes > 1:
+            return self._export_parts(schedules, buffers)
+
+        options = {"constant_memory": True} if links else {}
+        wb = xlsxwriter.Workbook(self.output_path, options)
+        fmts = STYLES.materialize(wb)
+        if links:
+            self._write_sheets(wb, fmts, schedules, buffers)
+        else:
+            ws = self._add_sheet(wb, "Model")
+            row = 0
+            for schedule, buf in zip(schedules, buffers):
+                with timings.span("write_schedule", schedule.SCHEDULE_NAME):
+                    buf.emit(ws, fmts, row)
+                row += buf.n_rows
+            if self.sensitivity is not None:
+                row = self._write_sensitivity(wb, ws, fmts, self.sensitivity, row)
+
+        with timings.span("workbook_close"):
+            wb.close()
         return self.output_path
 
-    # ── Format factory ──────────────────────────────────────────────────────
-
-    def _make_formats(self, wb) -> dict:
-        base = {"font_name": self._C_FONT, "font_size": 11}
-        f = {}
-
-        # Company name – Calibri 18, bold, center-across
-        f["company"] = wb.add_format({
-            **base, "font_size": 18, "bold": True,
-            "align": "center_across", "valign": "vcenter",
-        })
-
-        # Schedule title – Calibri 14, bold, center-across
-        f["sched"] = wb.add_format({
-            **base, "font_size": 14, "bold": True,
-            "align": "center_across", "valign": "vcenter",
-        })
-
-        # Separator row – medium bottom border (written as blanks)
-        f["sep"] = wb.add_format({"bottom": 2})
-
-        # Closing border row at the bottom of each schedule (B:V)
-        f["end"] = wb.add_format({"bottom": 1})
-
-        # "Projected" label above year headers
-        f["proj_hdr"] = wb.add_format({**base, "bold": True, "align": "center_across"})
-
-        # Year headers: 2020A (historical) and 2025E (projected)
-        f["yr_hist"] = wb.add_format({
-            **base, "bold": True, "align": "center",
-            "num_format": '0"A"',
-        })
-        f["yr_proj"] = wb.add_format({
-            **base, "bold": True, "align": "center",
-            "num_format": '0"E"', "bottom": 1,
-        })
-
-        # Section header labels (bold, no fill, two indent depths)
-        f["sec0"] = wb.add_format({**base, "bold": True, "indent": 1})
-        f["sec1"] = wb.add_format({**base, "bold": True, "indent": 2})
-
-        # Data labels (regular, four indent depths)
-        for i in range(4):
-            f[f"lbl{i}"] = wb.add_format({**base, "indent": i + 1})
-
-        # Numeric cells for three number formats × two font colours
-        _NUM_FMTS = {
-            "int": '#,##0_);(#,##0);-_)',
-            "dec": '#,##0.0_);(#,##0.0);-_)',
-            "pct": '0.0%;(0.0%)',
-        }
-        for key, num_fmt in _NUM_FMTS.items():
-            f[f"hist_{key}"] = wb.add_format({
-                **base, "num_format": num_fmt, "align": "right",
-                "font_color": self._C_HIST_FONT,
-            })
-            f[f"proj_{key}"] = wb.add_format({
-                **base, "num_format": num_fmt, "align": "right",
-            })
-
-        return f
+    def _add_sheet(self, wb, name: str):
+        ws = wb.add_worksheet(name)
+        ws.hide_gridlines(2)
+        self._setup_columns(ws)
+        return ws
+
+    def _write_sheets(self, wb, fmts, schedules, buffers):
+        summary = self._summary_buffer(dict(zip((s.SCHEDULE_NAME for s in schedules), buffers)))
+        with timings.span("write_schedule", SUMMARY_SHEET):
+            summary.emit(self._add_sheet(wb, SUMMARY_SHEET), fmts)
+        for schedule, buf in zip(schedules, buffers):
+            with timings.span("write_schedule", schedule.SCHEDULE_NAME):
+                buf.emit(self._add_sheet(wb, buf.name), fmts)
+        if self.sensitivity is not None:
+            self._sensitivity_sheet(wb, fmts)
+
+    def _sensitivity_sheet(self, wb, fmts):
+        ws = self._add_sheet(wb, SENSITIVITY_SHEET)
+        ws.write_url(0, COL_LABEL, f"internal:{SUMMARY_SHEET}!A1", fmts[S["link"]],
+                     "« Summary")
+        self._write_sensitivity(wb, ws, fmts, self.sensitivity, 0)
+
+    def _export_parts(self, schedules, buffers) -> str:
+        """
+        Render the sheet XML in worker processes and splice it into a skeleton
+        workbook (every sheet, the styles and the sensitivity block, no
+        schedule cells) written by xlsxwriter.
+        """
+        skeleton = io.BytesIO()
+        wb = xlsxwriter.Workbook(skeleton, {"in_memory": True})
+        fmts = STYLES.materialize(wb)
+        if self.layout == "sheets":
+            summary = self._summary_buffer(
+                dict(zip((s.SCHEDULE_NAME for s in schedules), buffers)))
+            buffers = [summary] + buffers
+            sheets = [self._add_sheet(wb, buf.name) for buf in buffers]
+            chunks = [(i, buf, 0) for i, buf in enumerate(buffers)]
+            if self.sensitivity is not None:
+                self._sensitivity_sheet(wb, fmts)
+        else:
+            sheets = [self._add_sheet(wb, "Model")]
+            chunks, row = [], 0
+            for buf in buffers:
+                chunks.append((0, buf, row))
+                row += buf.n_rows
+            if self.sensitivity is not None:
+                self._write_sensitivity(wb, sheets[0], fmts, self.sensitivity, row)
+
+        # Use every style once (row 1 of the first sheet, replaced by its rendered
+        # part) so styles.xml holds them all, then read back their xf indices
+        for style, fmt in enumerate(fmts):
+            sheets[0].write_blank(0, style, None, fmt)
+        with timings.span("workbook_close", "skeleton"):
+            wb.close()
+        xf = [fmt._get_xf_index() for fmt in fmts]
+
+        with timings.span("render_parts"):
+            with ProcessPoolExecutor(max_workers=self.processes) as pool:
+                rendered = list(pool.map(render, [buf for _, buf, _ in chunks], repeat(xf),
+                                         [offset for _, _, offset in chunks],
+                                         repeat(self.layout == "sheets")))
+        parts: dict[int, list[tuple]] = {}
+        for (sheet, _, _), part in zip(chunks, rendered):
+            parts.setdefault(sheet, []).append(part)
+        with timings.span("assemble"):
+            return assemble(skeleton.getvalue(), parts, self.output_path)
 
     # ── Column widths ────────────────────────────────────────────────────────
 
@@ -181,75 +477,265 @@ class ExcelExporter:
 
     # ── Schedule writer ──────────────────────────────────────────────────────
 
-    def _write_schedule(self, ws, fmts, schedule, start_row: int) -> int:
-        row = start_row
+    def _schedule_buffer(self, schedule, name: str, back_link: bool = False) -> _SheetBuffer:
+        with timings.span("summary", schedule.SCHEDULE_NAME):
+            summary = schedule.summary()
+        key = (schedule.SCHEDULE_NAME, name, back_link, TIMELINE)
+        templates = _TEMPLATES.setdefault(key, [])
+        for template in templates:
+            buf = template.fill(summary)
+            if buf is not None:
+                return buf
+        template = self._compile_template(schedule.SCHEDULE_NAME, name, back_link, summary)
+        timings.count("layout_templates_compiled")
+        templates.insert(0, template)
+        del templates[_TEMPLATES_PER_KEY:]
+        return template.fill(summary)
+
+    def _compile_template(self, title: str, name: str, back_link: bool,
+                          summary: dict) -> _LayoutTemplate:
+        buf = _SheetBuffer(name)
+        row = 0
 
-        # ① Spacer row (blank, 12.75 pt)
-        ws.set_row(row, 12.75)
+        # ① Spacer row (blank, 12.75 pt) – holds the link back to the summary
+        buf.height(row, 12.75)
+        if back_link:
+            buf.put(row, COL_LABEL, "url", f"internal:{SUMMARY_SHEET}!A1", S["link"], "« Summary")
         row += 1
 
         # ② Company title row (18 pt tall)
-        _center_across(ws, row, COL_LABEL, COL_DATA_END, COMPANY_NAME, fmts["company"])
-        ws.set_row(row, 23.25)
+        buf.center_across(row, COL_LABEL, COL_DATA_END, COMPANY_NAME, S["company"])
+        buf.height(row, 23.25)
         row += 1
 
         # ③ Schedule title row (18.75 pt tall)
-        _center_across(ws, row, COL_LABEL, COL_DATA_END, schedule.SCHEDULE_NAME, fmts["sched"])
-        ws.set_row(row, 18.75)
+        buf.center_across(row, COL_LABEL, COL_DATA_END, title, S["sched"])
+        buf.height(row, 18.75)
         row += 1
 
         # ④ Separator row – 3 pt, medium bottom border across label + data cols
-        ws.set_row(row, 3)
-        for c in range(COL_LABEL, COL_DATA_END + 1):
-            ws.write_blank(row, c, None, fmts["sep"])
+        buf.height(row, 3)
+        buf.blanks(row, COL_LABEL, COL_DATA_END, S["sep"])
         row += 1
 
+        row = self._year_header(buf, row)
+
+        # ⑧ Data rows: labels now, the numbers in fill()
+        nodes, index = [summary], {(): 0}
+        sections, lines = [(-1, None, tuple(summary))], []
+        for path, label, series in _walk(summary):
+            depth = len(path) - 1
+            parent = index[path[:-1]]
+            buf.height(row, 12.75)
+            if series is None:
+                # Section header row
+                buf.put(row, COL_LABEL, "str", label, SECTION_STYLES[min(depth, 1)])
+                node = nodes[parent][path[-1]]
+                index[path] = len(nodes)
+                nodes.append(node)
+                sections.append((parent, path[-1], tuple(node)))
+            else:
+                # Data row
+                buf.put(row, COL_LABEL, "str", label, LABEL_STYLES[min(depth, 3)])
+                buf.refs[path] = row
+                lines.append((row, parent, path[-1]) + _label_fmt_keys(label))
+            row += 1
+
+        # Closing border row – medium bottom border from col B to col V
+        buf.height(row, 12.75)
+        buf.blanks(row, COL_B, COL_DATA_END, S["end"])
+        row += 1
+
+        # Extra empty row between schedules
+        buf.height(row, 12.75)
+        buf.n_rows = row + 1
+        return _LayoutTemplate(buf, tuple(sections), tuple(lines))
+
+    @staticmethod
+    def _year_header(buf: _SheetBuffer, row: int) -> int:
         # ⑤ "Projected" label above the projected year headers
-        ws.set_row(row, 12.75)
-        _center_across(ws, row, COL_PROJ_0, COL_DATA_END, "Projected", fmts["proj_hdr"])
+        buf.height(row, 12.75)
+        buf.center_across(row, COL_PROJ_0, COL_DATA_END, "Projected", S["proj_hdr"])
         row += 1
 
         # ⑥ Year header row
-        ws.set_row(row, 12.75)
-        for i, year in enumerate(ALL_YEARS):
-            key = "yr_hist" if year in HIST_YEARS else "yr_proj"
-            ws.write_number(row, COL_DATA_0 + i, year, fmts[key])
+        buf.height(row, 12.75)
+        buf.values(row, COL_DATA_0, ALL_YEARS, {True: S["yr_hist"], False: S["yr_proj"]})
         row += 1
 
         # ⑦ Empty spacer row before data
-        ws.set_row(row, 12.75)
+        buf.height(row, 12.75)
+        return row + 1
+
+    # ── Summary sheet (sheets layout) ────────────────────────────────────────
+
+    def _summary_buffer(self, sheets: dict[str, _SheetBuffer]) -> _SheetBuffer:
+        """
+        Contents with links to every sheet, key lines pulled from the schedule
+        sheets by formula, and a DCF valuation computed from those key lines.
+        """
+        from DCF_model.valuation import DCFValuation
+
+        buf = _SheetBuffer(SUMMARY_SHEET)
+        buf.center_across(1, COL_LABEL, COL_DATA_END, COMPANY_NAME, S["company"])
+        buf.height(1, 23.25)
+        buf.center_across(2, COL_LABEL, COL_DATA_END, "Summary", S["sched"])
+        buf.height(2, 18.75)
+        buf.height(3, 3)
+        buf.blanks(3, COL_LABEL, COL_DATA_END, S["sep"])
+        row = self._year_header(buf, 4)
+
+        # Contents
+        buf.put(row, COL_LABEL, "str", "Contents", S["sec0"])
+        row += 1
+        names = [(title, b.name) for title, b in sheets.items()]
+        if self.sensitivity is not None:
+            names.append(("Sensitivity", SENSITIVITY_SHEET))
+        for title, name in names:
+            buf.put(row, COL_LABEL, "url", f"internal:{quote_sheetname(name)}!A1", S["link0"],
+                    title)
+            row += 1
         row += 1
 
-        # ⑧ Data rows
-        for depth, label, series in _flatten(schedule.summary()):
-            ws.set_row(row, 12.75)
-            if series is None:
-                # Section header row
-                d = min(depth, 1)
-                ws.write(row, COL_LABEL, label, fmts[f"sec{d}"])
-            else:
-                # Data row
-                d = min(depth, 3)
-                ws.write(row, COL_LABEL, label, fmts[f"lbl{d}"])
-                fmt_key = _num_fmt_key(label, series)
-                for i, year in enumerate(ALL_YEARS):
-                    v = series.get(year)
-                    if v is not None and isinstance(v, (int, float)):
-                        prefix = "hist" if year in HIST_YEARS else "proj"
-                        ws.write_number(
-                            row, COL_DATA_0 + i, float(v),
-                            fmts[f"{prefix}_{fmt_key}"],
-                        )
+        # Key lines: one formula per year pointing at the schedule sheet's cell
+        buf.put(row, COL_LABEL, "str", "Key Lines", S["sec0"])
+        row += 1
+        key_rows = {}
+        for label, attr, path in KEY_LINES:
+            schedule = getattr(self.model, attr)
+            source = sheets[schedule.SCHEDULE_NAME]
+            series = schedule.summary()
+            for key in path:
+                series = series[key]
+            key_rows[label] = row
+            src_row = source.refs.get(path)
+            if src_row is None:   # empty series – nothing to link to
+                buf.put(row, COL_LABEL, "str", label, S["lbl0"])
+                row += 1
+                continue
+            buf.put(row, COL_LABEL, "url",
+                    f"internal:{_ref(source.name, src_row, COL_LABEL)}", S["link0"], label)
+            styles = YEAR_STYLES[_num_fmt_key(label, series)]
+            for i, year in enumerate(ALL_YEARS):
+                buf.put(row, COL_DATA_0 + i, "formula",
+                        f"={_ref(source.name, src_row, COL_DATA_0 + i)}",
+                        styles[i], series.get(year, 0.0))
             row += 1
+        row += 1
 
-        # Closing border row – medium bottom border from col B to col V
-        ws.set_row(row, 12.75)
-        for c in range(COL_B, COL_DATA_END + 1):
-            ws.write_blank(row, c, None, fmts["end"])
+        # Valuation
+        val = DCFValuation(self.model, self.wacc, self.terminal_growth)
+        self._valuation_block(buf, row, val, key_rows)
+        return buf
+
+    def _valuation_block(self, buf: _SheetBuffer, row: int, val, key_rows: dict[str, int]):
+        """Live DCF: WACC and growth are input cells, everything else is a formula."""
+        cell = lambda label, col: xl_rowcol_to_cell(key_rows[label], col)
+        proj_cols = [COL_DATA_0 + ALL_YEARS.index(y) for y in val.projected_years]
+        v_col = COL_DATA_0 + ALL_YEARS.index(val.valuation_year)
+
+        buf.put(row, COL_LABEL, "str", "DCF Valuation", S["sec0"])
+        row += 1
+        wacc_cell = xl_rowcol_to_cell(row, COL_DATA_0, True, True)
+        buf.put(row, COL_LABEL, "str", "WACC", S["lbl0"])
+        buf.put(row, COL_DATA_0, "num", val.wacc, S["hist_pct"])
+        row += 1
+        g_cell = xl_rowcol_to_cell(row, COL_DATA_0, True, True)
+        buf.put(row, COL_LABEL, "str", "Terminal Growth", S["lbl0"])
+        buf.put(row, COL_DATA_0, "num", val.terminal_growth, S["hist_pct"])
         row += 1
 
-        # Extra empty row between schedules
-        ws.set_row(row, 12.75)
+        fcf, df = val.free_cash_flow, val.discount_factors
+        fcf_row, df_row, pv_row = row, row + 1, row + 2
+        buf.put(fcf_row, COL_LABEL, "str", "Free Cash Flow", S["lbl0"])
+        buf.put(df_row, COL_LABEL, "str", "Discount Factor", S["lbl0"])
+        buf.put(pv_row, COL_LABEL, "str", "PV of Free Cash Flow", S["lbl0"])
+        for t, (year, col) in enumerate(zip(val.projected_years, proj_cols), start=1):
+            parts = "+".join(cell(k, col) for k in ("NOPAT", "D&A", "Working Capital", "Capex"))
+            buf.put(fcf_row, col, "formula", f"={parts}", S["proj_int"], fcf[year])
+            buf.put(df_row, col, "formula", f"=1/(1+{wacc_cell})^{t}", S["proj_pct"], df[year])
+            buf.put(pv_row, col, "formula",
+                    f"={xl_rowcol_to_cell(fcf_row, col)}*{xl_rowcol_to_cell(df_row, col)}",
+                    S["proj_int"], fcf[year] * df[year])
+        row += 4
+
+        last = proj_cols[-1]
+        first_pv, last_pv = xl_rowcol_to_cell(pv_row, proj_cols[0]), xl_rowcol_to_cell(pv_row, last)
+        price = val.price_per_share
+        at = lambda r: xl_rowcol_to_cell(r, COL_DATA_0)
+        lines = (
+            ("Terminal Value",
+             f"={xl_rowcol_to_cell(fcf_row, last)}*(1+{g_cell})/({wacc_cell}-{g_cell})",
+             val.terminal_value, S["proj_int"]),
+            ("Enterprise Value",
+             f"=SUM({first_pv}:{last_pv})+{at(row)}*{xl_rowcol_to_cell(df_row, last)}",
+             val.enterprise_value, S["proj_int"]),
+            ("Net Debt", f"={cell('Total Debt', v_col)}-{cell('Cash', v_col)}",
+             val.net_debt, S["proj_int"]),
+            ("Equity Value", f"={at(row + 1)}-{at(row + 2)}", val.equity_value, S["proj_int"]),
+            ("Shares Outstanding", f"={cell('Shares Outstanding', v_col)}",
+             val.shares_outstanding, S["proj_int"]),
+            ("Price per Share", f'=IF({at(row + 4)}=0,"",{at(row + 3)}/{at(row + 4)})',
+             "" if price is None else price, S["proj_dec"]),
+        )
+        for label, formula, value, style in lines:
+            buf.put(row, COL_LABEL, "str", label,
+                    S["sec0"] if label == "Price per Share" else S["lbl0"])
+            buf.put(row, COL_DATA_0, "formula", formula, style, value)
+            row += 1
+        buf.n_rows = row
+
+    # ── Sensitivity writer ───────────────────────────────────────────────────
+
+    def _write_sensitivity(self, wb, ws, fmts, result, start_row: int) -> int:
+        """Tornado table (driver, low, high, swing, Δ vs base) plus a bar chart."""
+        row = start_row + 1
+        title = (f"Sensitivity: {result.output.replace('_', ' ').title()} "
+                 f"(±{result.bump:.0%} per driver)")
+        _center_across(ws, row, COL_LABEL, COL_DATA_END, COMPANY_NAME, fmts[S["company"]])
+        ws.set_row(row, 23.25)
+        row += 1
+        _center_across(ws, row, COL_LABEL, COL_DATA_END, title, fmts[S["sched"]])
+        ws.set_row(row, 18.75)
+        row += 1
+        ws.set_row(row, 3)
+        ws.write_row(row, COL_LABEL, [None] * (COL_DATA_END - COL_LABEL + 1), fmts[S["sep"]])
+        row += 2
+
+        headers = ("Low", "High", "Swing", "Δ Low", "Δ High")
+        ws.write(row, COL_LABEL, f"Base: {result.base_value:,.2f}", fmts[S["sec0"]])
+        for i, text in enumerate(headers):
+            ws.write(row, COL_DATA_0 + i, text, fmts[S["col_hdr"]])
         row += 1
 
-        return row
+        first = row
+        for r in result.rows:
+            ws.set_row(row, 12.75)
+            ws.write(row, COL_LABEL, r["driver"], fmts[S["lbl0"]])
+            values = (r["low"], r["high"], r["swing"],
+                      r["low"] - result.base_value, r["high"] - result.base_value)
+            for i, v in enumerate(values):
+                if v == v:   # skip NaN
+                    ws.write_number(row, COL_DATA_0 + i, v, fmts[S["proj_dec"]])
+            row += 1
+        last = row - 1
+
+        if result.rows:
+            chart = wb.add_chart({"type": "bar"})
+            for i, name in ((3, "Low"), (4, "High")):
+                chart.add_series({
+                    "name":       name,
+                    "categories": [ws.name, first, COL_LABEL, last, COL_LABEL],
+                    "values":     [ws.name, first, COL_DATA_0 + i, last, COL_DATA_0 + i],
+                    "gap":        40,
+                    "overlap":    100,
+                })
+            chart.set_title({"name": title})
+            chart.set_y_axis({"reverse": True})   # largest swing on top
+            chart.set_legend({"position": "bottom"})
+            chart.set_size({"width": 720, "height": max(300, 18 * len(result.rows))})
+            ws.insert_chart(first, COL_DATA_0 + len(headers) + 1, chart)
+
+        # Closing border row
+        ws.write_row(row, COL_B, [None] * (COL_DATA_END - COL_B + 1), fmts[S["end"]])
+        return row + 2
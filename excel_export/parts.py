@@ -0,0 +1,205 @@
+"""
+Sheet parts rendered outside xlsxwriter, so one workbook can be written by
+several processes.
+
+An .xlsx file is a zip of XML parts; nearly all of the bytes – and of the
+time xlsxwriter spends in close() – are the <sheetData> rows of the
+worksheets.  Those depend only on the cells and on each style's index in
+the shared styles.xml, so they can be rendered anywhere:
+
+    1. xlsxwriter writes a skeleton workbook: every sheet (columns, views),
+       styles.xml with every STYLES entry, the sensitivity block and chart,
+       but no schedule cells.  Interning the styles into row 1 of the first
+       sheet pins their xf indices; render() turns a style id into one.
+    2. render() turns a _SheetBuffer (or a row-offset chunk of a sheet) into
+       <row> XML plus its <hyperlinks> – in worker processes.
+    3. assemble() splices the rendered rows into the skeleton's sheet parts
+       and zips the package.
+
+Strings are written inline (as in xlsxwriter's constant_memory mode), so
+workers need no shared-string table; only the skeleton's own cells (the
+sensitivity block) use sharedStrings.xml.
+
+Steps 1 and 3 rely on xlsxwriter internals (Format._get_xf_index() and the
+layout of its sheet XML), so pyproject pins xlsxwriter below 3.3 and
+tests/test_parts.py checks the output cell for cell against a plain export.
+
+Usage:
+    xf = [fmt._get_xf_index() for fmt in fmts]          # after skeleton close
+    rows = [render(buf, xf, offset) for buf, offset in chunks]
+    assemble(skeleton_bytes, {0: rows}, "out.xlsx")     # sheet index → chunks
+"""
+
+import io
+import re
+import zipfile
+
+from xlsxwriter.utility import xl_col_to_name, xl_rowcol_to_cell
+
+_COLS = [xl_col_to_name(c) for c in range(256)]
+
+_ROW_XML    = re.compile(r'<row r="(\d+)"[^>]*?(?:/>|>.*?</row>)', re.S)
+_SHEET_DATA = re.compile(r"<sheetData/>|<sheetData>(.*?)</sheetData>", re.S)
+_DIMENSION  = re.compile(r'<dimension ref="([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?"/>')
+_HYPERLINKS = re.compile(r"<hyperlinks>(.*?)</hyperlinks>", re.S)
+
+
+def _text(s: str) -> str:
+    if "&" in s or "<" in s or ">" in s:
+        s = s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return s
+
+
+def _attr(s: str) -> str:
+    return _text(s).replace('"', "&quot;")
+
+
+def _string(s: str, xf: int) -> str:
+    space = ' xml:space="preserve"' if s[:1].isspace() or s[-1:].isspace() else ""
+    return f' s="{xf}" t="inlineStr"><is><t{space}>{_text(s)}</t></is></c>'
+
+
+def _value(v, xf: int) -> str:
+    """Cell XML after the r attribute for one write_row() entry, as xlsxwriter writes it."""
+    if v is None or v == "":
+        return f' s="{xf}"/>'
+    if isinstance(v, str):
+        return _string(v, xf)
+    return f' s="{xf}"><v>{v:.16G}</v></c>'
+
+
+def _formula(formula: str, cached, xf: int) -> str:
+    formula = formula[1:] if formula.startswith("=") else formula
+    if isinstance(cached, bool):
+        kind, cached = ' t="b"', int(cached)
+    elif isinstance(cached, str):
+        kind = ' t="str"' if cached else ""
+    else:
+        kind, cached = "", 0 if cached is None else cached
+    return f' s="{xf}"{kind}><f>{_text(formula)}</f><v>{_text(str(cached))}</v></c>'
+
+
+def render(buf, xf: list[int], offset: int = 0,
+           constant_memory: bool = False) -> tuple[str, str, tuple | None]:
+    """
+    (rows XML, hyperlinks XML, extent) for buf shifted down by offset rows.
+    xf maps a STYLES id to its cell-format index in the skeleton's styles.xml;
+    extent is (first row, first col, last row, last col), or None if empty.
+    constant_memory matches a sheet xlsxwriter writes in that mode, which
+    drops the height of a row without cells (except the sheet's first row).
+    """
+    out, links = [], []
+    heights, rows = buf.heights, buf.rows
+    first_col, last_col = 1 << 14, -1
+    order = sorted(rows.keys() | heights.keys())
+    for row in order:
+        r = row + offset + 1
+        # Later writes to a cell replace earlier ones, as in xlsxwriter
+        cells = {}
+        for col, kind, value, style, extra in rows.get(row, ()):
+            s = xf[style]
+            if kind == "row":
+                for c, v in enumerate(value, col):
+                    cells[c] = _value(v, s)
+            elif kind == "num":
+                cells[col] = f' s="{s}"><v>{value:.16G}</v></c>'
+            elif kind == "str":
+                cells[col] = _value(value, s)
+            elif kind == "blank":
+                cells[col] = f' s="{s}"/>'
+            elif kind == "formula":
+                cells[col] = _formula(value, extra, s)
+            else:
+                cells[col] = _string(extra, s)
+                links.append(f'<hyperlink ref="{xl_rowcol_to_cell(r - 1, col)}" '
+                             f'location="{_attr(value.removeprefix("internal:"))}" '
+                             f'display="{_attr(extra)}"/>')
+
+        height = heights.get(row)
+        tag = f'<row r="{r}" ht="{height:g}" customHeight="1"' if height is not None \
+            else f'<row r="{r}"'
+        if not cells:
+            if not constant_memory or r == 1:
+                out.append(tag + "/>")
+            continue
+        cols = sorted(cells)
+        first_col, last_col = min(first_col, cols[0]), max(last_col, cols[-1])
+        out.append(tag + ">" + "".join(f'<c r="{_COLS[c]}{r}"{cells[c]}' for c in cols)
+                   + "</row>")
+
+    extent = None
+    if order:
+        if offset == 0 and order[0] in heights:
+            first_col = 0   # xlsxwriter's set_row() on a sheet without cells yet counts col A
+        extent = (order[0] + offset, first_col if last_col >= 0 else 0,
+                  order[-1] + offset, max(last_col, 0))
+    return "".join(out), "".join(links), extent
+
+
+def _union(a: tuple | None, b: tuple | None) -> tuple | None:
+    if a is None or b is None:
+        return a or b
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _col_index(name: str) -> int:
+    n = 0
+    for ch in name:
+        n = n * 26 + ord(ch) - 64
+    return n - 1
+
+
+def splice(sheet_xml: str, chunks: list[tuple]) -> str:
+    """
+    Replace the skeleton's row 1 (the style anchors) with the rendered chunks,
+    keeping any rows the skeleton wrote itself after them.
+    """
+    rows = "".join(c[0] for c in chunks)
+    links = "".join(c[1] for c in chunks)
+    extent = None
+    for chunk in chunks:
+        extent = _union(extent, chunk[2])
+
+    data = _SHEET_DATA.search(sheet_xml)
+    kept = "".join(m.group(0) for m in _ROW_XML.finditer(data.group(1) or "")
+                   if m.group(1) != "1")
+    if kept:
+        dim = _DIMENSION.search(sheet_xml)
+        c0, r0, c1, r1 = dim.group(1), dim.group(2), dim.group(3) or dim.group(1), \
+            dim.group(4) or dim.group(2)
+        extent = _union(extent, (int(r0) - 1, _col_index(c0), int(r1) - 1, _col_index(c1)))
+    xml = sheet_xml[:data.start()] + f"<sheetData>{rows}{kept}</sheetData>" \
+        + sheet_xml[data.end():]
+
+    if extent is not None:
+        ref = xl_rowcol_to_cell(extent[0], extent[1])
+        if extent[2:] != extent[:2]:
+            ref += ":" + xl_rowcol_to_cell(extent[2], extent[3])
+        xml = _DIMENSION.sub(f'<dimension ref="{ref}"/>', xml, count=1)
+
+    if links:
+        existing = _HYPERLINKS.search(xml)
+        if existing:
+            xml = xml[:existing.start(1)] + links + xml[existing.start(1):]
+        else:
+            # <hyperlinks> precedes <printOptions> / <pageMargins> in the schema
+            at = min(i for i in (xml.find("<printOptions"), xml.find("<pageMargins"),
+                                 xml.find("</worksheet>")) if i >= 0)
+            xml = xml[:at] + f"<hyperlinks>{links}</hyperlinks>" + xml[at:]
+    return xml
+
+
+def assemble(skeleton: bytes, parts: dict[int, list[tuple]], output_path: str) -> str:
+    """
+    Write the skeleton package to output_path with the rendered chunks
+    (render() results, in row order) spliced into sheet index → chunks.
+    """
+    names = {f"xl/worksheets/sheet{i + 1}.xml": chunks for i, chunks in parts.items()}
+    with zipfile.ZipFile(io.BytesIO(skeleton)) as src, \
+            zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename in names:
+                data = splice(data.decode("utf-8"), names[info.filename]).encode("utf-8")
+            dst.writestr(info, data, compress_type=zipfile.ZIP_DEFLATED)
+    return output_path
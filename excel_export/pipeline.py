@@ -0,0 +1,206 @@
+"""
+Pipelined batch export: many tickers through read → parse → render → write,
+with every stage busy at once.
+
+    read     asyncio – the data file's bytes, on a thread
+    parse    process pool – bytes → loader (the loaders' data= path)
+    render   process pool – loader → model → workbook bytes (or backend rows)
+    write    asyncio – the output file, on a thread
+
+Stages are joined by bounded queues (`queue` items each): a stage that runs
+ahead blocks on a full queue instead of piling up work, so memory stays
+bounded and throughput tends towards the slowest stage rather than the sum
+of all of them.  The model is built inside render – it is cheap to build
+from a parsed loader, and shipping it between processes is not.
+
+A ticker that fails in any stage is reported and dropped; the others go on.
+
+Usage:
+    from excel_export.pipeline import export_all
+    export_all(["YPF", "PAM"], data_dir="data", out_dir="finished_models", workers=4)
+
+    dcf batch [TICKER ...] [--out-dir DIR] [--workers N] [--queue N]
+"""
+
+import asyncio
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .run import DATA_DIR, OUTPUT_DIR, find_data_file, list_tickers, output_path
+
+_DONE = object()   # end-of-stream marker passed down the queues
+
+
+class Stage:
+    """
+    fn(key, payload) run on executor (None: the event loop's thread pool) by
+    `concurrency` tasks at a time.
+    """
+
+    __slots__ = ("name", "fn", "executor", "concurrency", "busy", "items")
+
+    def __init__(self, name: str, fn, executor=None, concurrency: int = 1):
+        self.name = name
+        self.fn = fn
+        self.executor = executor
+        self.concurrency = concurrency
+        self.busy = 0.0    # seconds spent running fn (not waiting for the executor)
+        self.items = 0
+
+    def __repr__(self):
+        return f"<Stage: {self.name}, {self.items} items, {self.busy:.2f}s busy>"
+
+
+# ── Stage functions (module-level so they pickle) ────────────────────────────
+
+def _read(ticker: str, data_file: str) -> tuple[str, bytes]:
+    with open(data_file, "rb") as f:
+        return data_file, f.read()
+
+
+def _parse(ticker: str, source: tuple[str, bytes], engine: str):
+    from DCF_model.ypf_model import YPFModel
+
+    data_file, data = source
+    return YPFModel(data_file, engine=engine, data=data).loader
+
+
+def _render(ticker: str, loader, fmt: str, layout: str, tornado_bump: float | None):
+    """Workbook bytes for xlsx, backend rows for the data formats."""
+    from DCF_model.ypf_model import YPFModel
+
+    model = YPFModel.from_loader(loader)
+    if fmt != "xlsx":
+        from .backends import model_rows
+        return model_rows(model)
+
+    from .exporter import ExcelExporter
+
+    sensitivity = None
+    if tornado_bump:
+        from DCF_model.sensitivity import tornado
+        sensitivity = tornado(model, bump=tornado_bump)
+    out = io.BytesIO()
+    ExcelExporter(model, out, sensitivity, layout=layout).export()
+    return out.getvalue()
+
+
+def _write(ticker: str, rendered, fmt: str, out_dir: str) -> str:
+    path = output_path(ticker, out_dir, fmt)
+    if fmt == "xlsx":
+        with open(path, "wb") as f:
+            f.write(rendered)
+    else:
+        from .backends import open_backend
+        with open_backend(path, fmt) as backend:
+            backend.add_rows(ticker, rendered)
+    return path
+
+
+# ── Pipeline ─────────────────────────────────────────────────────────────────
+
+def _timed(fn, key: str, payload):
+    """Runs in the executor, so the time excludes waiting for a free worker."""
+    start = time.perf_counter()
+    return fn(key, payload), time.perf_counter() - start
+
+
+async def _worker(stage: Stage, inbox: asyncio.Queue, outbox: asyncio.Queue | None,
+                  failures: dict[str, str], results: dict[str, object]):
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await inbox.get()
+        if item is _DONE:
+            await inbox.put(_DONE)   # for this stage's other tasks
+            return
+        ticker, payload = item
+        try:
+            result, seconds = await loop.run_in_executor(stage.executor, _timed, stage.fn,
+                                                         ticker, payload)
+        except Exception as exc:
+            failures[ticker] = f"{stage.name}: {type(exc).__name__}: {exc}"
+            continue
+        stage.busy += seconds
+        stage.items += 1
+        if outbox is None:
+            results[ticker] = result
+        else:
+            await outbox.put((ticker, result))
+
+
+async def _run_stage(stage: Stage, inbox: asyncio.Queue, outbox: asyncio.Queue | None,
+                     failures: dict[str, str], results: dict[str, object]):
+    await asyncio.gather(*(_worker(stage, inbox, outbox, failures, results)
+                           for _ in range(stage.concurrency)))
+    if outbox is not None:
+        await outbox.put(_DONE)
+
+
+async def run_pipeline(items: list[tuple[str, object]], stages: list[Stage],
+                       queue: int = 4) -> tuple[dict[str, object], dict[str, str]]:
+    """
+    Push (key, payload) items through the stages, each stage's result becoming
+    the next stage's payload.  Returns ({key: last stage's result}, {key: error}).
+    """
+    queues = [asyncio.Queue(maxsize=queue) for _ in stages]
+    failures: dict[str, str] = {}
+    results: dict[str, object] = {}
+    runners = [
+        asyncio.create_task(_run_stage(stage, queues[i],
+                                       queues[i + 1] if i + 1 < len(stages) else None,
+                                       failures, results))
+        for i, stage in enumerate(stages)
+    ]
+    for item in items:
+        await queues[0].put(item)
+    await queues[0].put(_DONE)
+    await asyncio.gather(*runners)
+    return results, failures
+
+
+def export_all(tickers: list[str] | None = None, data_dir: str = DATA_DIR,
+               out_dir: str = OUTPUT_DIR, fmt: str = "xlsx", engine: str = "openpyxl",
+               layout: str = "single", tornado_bump: float | None = None,
+               workers: int | None = None, queue: int = 4) -> dict[str, str]:
+    """
+    Export every ticker (default: all in data_dir) to its own file in out_dir.
+    Parsing and rendering run on `workers` processes (default: one per CPU).
+    Returns {ticker: output file} for the tickers that succeeded.
+    """
+    from .backends import BACKENDS
+
+    if fmt not in BACKENDS:
+        raise ValueError(f"Unsupported format: {fmt}. Choose from {list(BACKENDS)}")
+    tickers = list_tickers(data_dir) if not tickers else tickers
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        stages = [
+            Stage("read",   _read, concurrency=2),
+            Stage("parse",  partial(_parse, engine=engine), pool, workers),
+            Stage("render", partial(_render, fmt=fmt, layout=layout,
+                                    tornado_bump=tornado_bump), pool, workers),
+            Stage("write",  partial(_write, fmt=fmt, out_dir=out_dir), concurrency=2),
+        ]
+
+        items, failures = [], {}
+        for t in tickers:
+            try:
+                items.append((t, find_data_file(t, data_dir)))
+            except FileNotFoundError as exc:
+                failures[t] = f"read: {exc}"
+        start = time.perf_counter()
+        results, failed = asyncio.run(run_pipeline(items, stages, queue))
+    failures.update(failed)
+
+    wall = time.perf_counter() - start
+    busy = ", ".join(f"{s.name} {s.busy:.2f}s" for s in stages)
+    print(f"{len(results)} models -> {out_dir} in {wall:.2f}s (stage time: {busy})")
+    for ticker, error in sorted(failures.items()):
+        print(f"  {ticker}: {error}", file=sys.stderr)
+    return {t: results[t] for t in tickers if t in results}
@@ -3,58 +3,179 @@
 Export a DCF model to a formatted Excel file.
 
 Usage (from repo root):
-    python excel_export/run.py <ticker>
+    python -m excel_export.run <ticker>
+    dcf export <ticker>
 
 Looks for data/<ticker>_historicals.csv or data/<ticker>_historicals.xlsx.
-Output is saved to finished_models/<ticker>_DCF.xlsx.
+Output is saved to finished_models/<ticker>_DCF.xlsx (or .parquet, .csv, …
+with another backend; see excel_export.backends).  dump() writes many
+tickers into one data file.
 """
 
 import sys
 import os
+import re
 
 _HERE = os.path.dirname(os.path.abspath(__file__))
 _ROOT = os.path.join(_HERE, "..")
 
-sys.path.insert(0, os.path.join(_ROOT, "DCF_model"))
-sys.path.insert(0, _HERE)
+DATA_DIR   = os.path.join(_ROOT, "data")
+OUTPUT_DIR = os.path.join(_ROOT, "finished_models")
 
-from ypf_model import YPFModel
-from exporter import ExcelExporter
 
+DATA_FILE = re.compile(r"^(?P<ticker>[^~.][^/]*)_historicals\.(csv|xlsx)$")
 
-def find_data_file(ticker: str) -> str:
-    data_dir = os.path.join(_ROOT, "data")
+
+def list_tickers(data_dir: str = DATA_DIR) -> list[str]:
+    """Every ticker with a historicals file in data_dir, sorted."""
+    names = (DATA_FILE.match(name) for name in os.listdir(data_dir))
+    return sorted({m.group("ticker") for m in names if m})
+
+
+def find_data_file(ticker: str, data_dir: str = DATA_DIR) -> str:
     for ext in ("csv", "xlsx"):
         path = os.path.join(data_dir, f"{ticker}_historicals.{ext}")
         if os.path.exists(path):
             return path
     raise FileNotFoundError(
-        f"No data file found for '{ticker}' in data/. "
+        f"No data file found for '{ticker}' in {data_dir}. "
         f"Expected {ticker}_historicals.csv or {ticker}_historicals.xlsx"
     )
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python excel_export/run.py <ticker>")
-        sys.exit(1)
-
-    ticker = sys.argv[1]
-    data_file = find_data_file(ticker)
-
-    out_dir = os.path.join(_ROOT, "finished_models")
+def output_path(ticker: str, out_dir: str = OUTPUT_DIR, fmt: str = "xlsx") -> str:
+    return os.path.join(out_dir, f"{ticker}_DCF.{fmt}")
+
+
+# Formats dump() can write: the workbook holds one model per file
+DATA_FORMATS = ("parquet", "arrow", "csv", "jsonl")
+
+
+def check_export_options(fmt: str, tornado_bump: float | None = None, layout: str = "single",
+                         workers: int = 1, processes: int = 1):
+    """Raise ValueError if workbook-only options are given with a data format."""
+    if fmt == "xlsx":
+        return
+    given = [name for name, value, default in (("tornado", tornado_bump, None),
+                                               ("layout", layout, "single"),
+                                               ("workers", workers, 1),
+                                               ("processes", processes, 1))
+             if value != default]
+    if given:
+        raise ValueError(f"Options {given} only apply to the xlsx format, not {fmt}")
+
+
+def dump_format(output: str, fmt: str | None = None) -> str:
+    """The data format dump() writes output in (default: from its extension)."""
+    fmt = fmt or os.path.splitext(output)[1].lstrip(".").lower()
+    if fmt == "xlsx":
+        raise ValueError("dump writes data formats only; use export or batch for workbooks. "
+                         f"Choose from {list(DATA_FORMATS)}")
+    if fmt not in DATA_FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}. Choose from {list(DATA_FORMATS)}")
+    return fmt
+
+
+def _report_integrity(model):
+    from DCF_model.integrity import check_integrity
+
+    report = check_integrity(model)
+    status = "ok" if report.ok else f"{len(report.violations)} violation(s)"
+    print(f"Integrity:    {status} ({len(report.identities)} identities)")
+    details = report.format(limit=10)
+    if details:
+        print(details)
+
+
+def export(ticker: str, data_dir: str = DATA_DIR, out_dir: str = OUTPUT_DIR,
+           engine: str = "openpyxl", tornado_bump: float | None = None,
+           layout: str = "single", workers: int = 1, processes: int = 1,
+           fmt: str = "xlsx", deltas: list[str] | None = None, **loader_options):
+    """
+    Build the model for one ticker, write its formatted workbook and return the
+    model.  With tornado_bump, a ±bump driver sensitivity block is appended.
+    layout="sheets" writes a summary sheet plus one sheet per schedule;
+    processes > 1 renders the sheets' XML in a process pool.
+    fmt picks another output backend (parquet, arrow, csv, jsonl) instead; the
+    workbook options above are then rejected with a ValueError.
+    deltas are delta files (see DCF_model.delta) patched into the data, in order.
+    """
+    # Imported here so callers that only need the paths above stay light
+    from DCF_model.ypf_model import YPFModel
+    from .backends import open_backend
+
+    check_export_options(fmt, tornado_bump, layout, workers, processes)
+    data_file = find_data_file(ticker, data_dir)
     os.makedirs(out_dir, exist_ok=True)
-    output_file = os.path.join(out_dir, f"{ticker}_DCF.xlsx")
+    output_file = output_path(ticker, out_dir, fmt)
 
     print(f"Ticker:       {ticker}")
     print(f"Data file:    {data_file}")
     print(f"Exporting to: {output_file} ...")
 
-    model = YPFModel(data_file)
+    model = YPFModel(data_file, engine=engine, **loader_options)
+    for path in deltas or ():
+        from DCF_model.delta import read_delta
+        delta = read_delta(path, engine)
+        touched = model.apply(delta)
+        print(f"Applied:      {path} ({len(delta)} cells, {len(touched)} schedules)")
     print(model)
-
-    ExcelExporter(model, output_file).export()
+    _report_integrity(model)
+
+    sensitivity = None
+    if tornado_bump:
+        from DCF_model.sensitivity import tornado
+        sensitivity = tornado(model, bump=tornado_bump)
+    options = {"sensitivity": sensitivity, "layout": layout, "workers": workers,
+               "processes": processes} if fmt == "xlsx" else {}
+    with open_backend(output_file, fmt, **options) as backend:
+        backend.add(model, ticker)
     print("Done.")
+    return model
+
+
+def _model_rows(ticker: str, data_file: str, engine: str) -> tuple[str, list[tuple]]:
+    """Process-pool entry point: load one ticker and flatten it to backend rows."""
+    from DCF_model.ypf_model import YPFModel
+    from .backends import model_rows
+
+    return ticker, model_rows(YPFModel(data_file, engine=engine))
+
+
+def dump(tickers: list[str] | None, output: str, data_dir: str = DATA_DIR,
+         fmt: str | None = None, engine: str = "openpyxl", workers: int = 1) -> str:
+    """
+    Write the model rows of many tickers (default: all in data_dir) into one
+    data file (parquet, arrow, csv or jsonl; default from output's extension).
+    Models are loaded on `workers` processes and streamed into the file in
+    ticker order.
+    """
+    from .backends import open_backend
+
+    fmt = dump_format(output, fmt)
+    tickers = list_tickers(data_dir) if not tickers else tickers
+    files = [find_data_file(t, data_dir) for t in tickers]
+    with open_backend(output, fmt) as backend:
+        if workers > 1 and len(tickers) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(_model_rows, tickers, files, [engine] * len(tickers),
+                                   chunksize=max(1, len(tickers) // (workers * 4)))
+                for ticker, rows in results:
+                    backend.add_rows(ticker, rows)
+        else:
+            for ticker, data_file in zip(tickers, files):
+                backend.add_rows(*_model_rows(ticker, data_file, engine))
+    print(f"{backend.models} models, {backend.rows} rows -> {output}")
+    return output
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python -m excel_export.run <ticker>")
+        sys.exit(1)
+
+    export(sys.argv[1])
 
 
 if __name__ == "__main__":
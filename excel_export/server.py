@@ -0,0 +1,321 @@
+"""
+Long-running model server.
+
+Keeps loaded YPFModel instances in a memory-bounded LRU cache and answers
+requests over a small local HTTP API, so repeated questions about the same
+ticker skip interpreter start-up, imports and workbook parsing.
+
+Usage (from repo root):
+    dcf serve [--port 8765 | --socket /tmp/dcf.sock]
+
+Endpoints (GET unless noted, JSON responses):
+    /summary/<ticker>                       full model.summary()
+    /valuation/<ticker>?wacc=&terminal_growth=
+    /export/<ticker>                        writes finished_models/<ticker>_DCF.xlsx
+    /stats                                  cache hits / misses / memory
+    POST /patch/<ticker>                    body: a delta spec (see DCF_model/delta.py)
+
+Workbook parsing and Excel export run in a process pool.  Each cache entry
+remembers the mtime and size of its data file and is reloaded when the file
+changes on disk – which also drops any deltas patched into it.
+
+With a ResultCache (dcf serve --cache-dir), summaries and valuations are
+looked up by content before any model is loaded, so results computed by an
+earlier run or by another server sharing the directory cost no parsing.
+Cache reads run on threads, and writes (with their periodic prune) finish
+after the response has been sent.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from DCF_model.cache import ResultCache, file_digest, result_key
+from DCF_model.delta import Delta
+from DCF_model.series import Series
+from DCF_model.valuation import DCFValuation
+from .run import DATA_DIR, OUTPUT_DIR, find_data_file, output_path
+
+
+# ── Process-pool entry points (module-level so they pickle) ──────────────────
+
+def _load_model(data_file: str, engine: str):
+    from DCF_model.ypf_model import YPFModel
+    return YPFModel(data_file, engine=engine)
+
+
+def _export_model(model, output_file: str) -> str:
+    from .exporter import ExcelExporter
+    return ExcelExporter(model, output_file).export()
+
+
+def _jsonable(obj):
+    """json.dumps fallback: a Series is written as the {year: value} dict it stands for."""
+    if isinstance(obj, Series):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _report_store_error(future):
+    if not future.cancelled() and future.exception() is not None:
+        e = future.exception()
+        print(f"Result cache write failed: {type(e).__name__}: {e}", file=sys.stderr, flush=True)
+
+
+def _estimate_bytes(obj) -> int:
+    """Rough deep size of the nested dicts / lists / scalars held by a loader."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += _estimate_bytes(k) + _estimate_bytes(v)
+    elif isinstance(obj, (list, tuple)):
+        for v in obj:
+            size += _estimate_bytes(v)
+    return size
+
+
+def _file_stamp(path: str) -> tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+# ── Cache ────────────────────────────────────────────────────────────────────
+
+class _Entry:
+    """One cached model plus the data-file stamp it was loaded from."""
+
+    def __init__(self, model, data_file: str, stamp: tuple[int, int], nbytes: int):
+        self.model = model
+        self.data_file = data_file
+        self.stamp = stamp
+        self.nbytes = nbytes
+        self.summary_json: bytes | None = None   # encoded once, on first request
+
+
+class ModelCache:
+    """
+    LRU cache of loaded models, bounded by the estimated size of their data.
+
+    get() returns a cached model when its data file is unchanged, otherwise it
+    loads (or reloads) it in the process pool.  Concurrent requests for the
+    same ticker share a single load.
+    """
+
+    def __init__(self, pool, data_dir: str = DATA_DIR, engine: str = "openpyxl",
+                 max_bytes: int = 512 * 1024 * 1024):
+        self.pool = pool
+        self.data_dir = data_dir
+        self.engine = engine
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "reloads": 0, "evictions": 0}
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._loading: dict[str, asyncio.Future] = {}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(e.nbytes for e in self._entries.values())
+
+    async def get(self, ticker: str) -> _Entry:
+        data_file = find_data_file(ticker, self.data_dir)
+        stamp = _file_stamp(data_file)
+
+        entry = self._entries.get(ticker)
+        if entry is not None and entry.data_file == data_file and entry.stamp == stamp:
+            self._entries.move_to_end(ticker)
+            self.stats["hits"] += 1
+            return entry
+
+        if ticker in self._loading:
+            return await asyncio.shield(self._loading[ticker])
+
+        if entry is not None:
+            self.stats["reloads"] += 1
+            del self._entries[ticker]
+        self.stats["misses"] += 1
+
+        task = asyncio.ensure_future(self._load(ticker, data_file, stamp))
+        self._loading[ticker] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._loading.pop(ticker, None)
+
+    async def _load(self, ticker: str, data_file: str, stamp: tuple[int, int]) -> _Entry:
+        loop = asyncio.get_running_loop()
+        model = await loop.run_in_executor(self.pool, _load_model, data_file, self.engine)
+        entry = _Entry(model, data_file, stamp, _estimate_bytes(model.loader.__dict__))
+        self._entries[ticker] = entry
+        self._evict()
+        return entry
+
+    async def apply(self, ticker: str, delta) -> dict:
+        """Patch the cached model in place with a Delta; only its encoded summary goes stale."""
+        entry = await self.get(ticker)
+        touched = entry.model.apply(delta)
+        entry.model.dirty.clear()
+        entry.summary_json = None
+        entry.nbytes += _estimate_bytes(delta.cells)
+        self._evict()
+        return {"ticker": ticker, "schedules": touched, "revision": entry.model.loader.revision}
+
+    def source(self, ticker: str, data_file: str):
+        """
+        What results for ticker are keyed on (see DCF_model.cache): the cached
+        loader once deltas were applied to it, otherwise the data file.
+        """
+        entry = self._entries.get(ticker)
+        if entry is not None and entry.data_file == data_file \
+                and getattr(entry.model.loader, "patch_digest", None) is not None \
+                and entry.stamp == _file_stamp(data_file):
+            return entry.model.loader
+        return data_file
+
+    def _evict(self):
+        # Drop least-recently-used entries, always keeping the newest one
+        total = self.nbytes
+        while total > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            total -= entry.nbytes
+            self.stats["evictions"] += 1
+
+    def info(self) -> dict:
+        return {
+            "entries":   list(self._entries),
+            "bytes":     self.nbytes,
+            "max_bytes": self.max_bytes,
+            **self.stats,
+        }
+
+
+# ── HTTP front end ───────────────────────────────────────────────────────────
+
+class ModelServer:
+    """Minimal asyncio HTTP/1.1 server over TCP or a Unix socket."""
+
+    def __init__(self, data_dir: str = DATA_DIR, out_dir: str = OUTPUT_DIR,
+                 engine: str = "openpyxl", max_bytes: int = 512 * 1024 * 1024,
+                 workers: int | None = None, results: ResultCache | None = None):
+        self.out_dir = out_dir
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.cache = ModelCache(self.pool, data_dir, engine, max_bytes)
+        self.results = results
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765,
+                    socket_path: str | None = None):
+        if socket_path:
+            server = await asyncio.start_unix_server(self._handle, path=socket_path)
+            where = socket_path
+        else:
+            server = await asyncio.start_server(self._handle, host, port)
+            where = f"http://{host}:{port}"
+        print(f"Serving models from {self.cache.data_dir} on {where}", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+
+    # ── Routing ──
+
+    async def _route(self, path: str, query: dict, body: bytes | None = None) -> bytes | dict:
+        parts = [p for p in path.split("/") if p]
+        if parts == ["stats"]:
+            info = self.cache.info()
+            if self.results is not None:
+                info["results"] = self.results.info()
+            return info
+        if len(parts) != 2 or parts[0] not in ("summary", "valuation", "export", "patch"):
+            raise LookupError(f"Unknown endpoint: {path}")
+
+        action, ticker = parts
+        if action == "patch":
+            if body is None:
+                raise ValueError(f"POST a delta spec to {path}")
+            return await self.cache.apply(ticker, Delta.from_spec(json.loads(body)))
+
+        loop = asyncio.get_running_loop()
+        key = None
+        if action == "valuation":
+            rates = {"wacc": 0.10, "terminal_growth": 0.02}
+            rates.update((k, float(v[0])) for k, v in query.items() if k in rates)
+        if self.results is not None and action != "export":
+            # Hashing the data file and reading the cache directories block, so
+            # both run on threads; with the digest known the key is just a stat
+            data_file = find_data_file(ticker, self.cache.data_dir)
+            await loop.run_in_executor(None, file_digest, data_file)
+            source = self.cache.source(ticker, data_file)
+            patches = getattr(source, "patch_digest", None)
+            if action == "summary":     # cached as the response bytes, not the dict
+                key = result_key("summary.json", source)
+            else:
+                key = result_key("valuation", source, **rates)
+            cached = await loop.run_in_executor(None, self.results.get, key)
+            if cached is not None:
+                return cached
+
+        entry = await self.cache.get(ticker)
+
+        if action == "summary":
+            if entry.summary_json is None:
+                entry.summary_json = json.dumps(entry.model.summary(), default=_jsonable).encode()
+            body = entry.summary_json
+        elif action == "valuation":
+            body = DCFValuation(entry.model, **rates).summary()
+        if action != "export":
+            # Not if a patch landed while we waited: body no longer belongs to key
+            if key is not None and self.cache.source(ticker, data_file) == source \
+                    and getattr(source, "patch_digest", None) == patches:
+                self._store(key, body)
+            return body
+
+        if action == "export":
+            os.makedirs(self.out_dir, exist_ok=True)
+            out = await loop.run_in_executor(
+                self.pool, _export_model, entry.model, output_path(ticker, self.out_dir))
+            return {"ticker": ticker, "output": out}
+
+    def _store(self, key: str, value):
+        """
+        Write a result to the cache on a thread without waiting for it, so the
+        response never waits on the directories or on a prune.
+        """
+        future = asyncio.get_running_loop().run_in_executor(None, self.results.put, key, value)
+        future.add_done_callback(_report_store_error)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            length = 0
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":   # the only header used
+                    length = int(value)
+            if len(request_line) < 2:
+                return
+            payload = await reader.readexactly(length) if request_line[0] == "POST" else None
+            url = urlsplit(request_line[1])
+            try:
+                body = await self._route(url.path, parse_qs(url.query), payload)
+                status = "200 OK"
+            except (LookupError, FileNotFoundError) as e:
+                body, status = {"error": str(e)}, "404 Not Found"
+            except ValueError as e:
+                body, status = {"error": str(e)}, "400 Bad Request"
+            except Exception as e:   # keep the daemon alive on model errors
+                body, status = {"error": f"{type(e).__name__}: {e}"}, "500 Internal Server Error"
+
+            if not isinstance(body, bytes):
+                body = json.dumps(body, default=_jsonable).encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
@@ -0,0 +1,120 @@
+"""
+Cell styles for the exporter, interned once per process.
+
+xlsxwriter Format objects belong to one workbook, so they can't be shared
+between exports.  What can be shared is everything that decides them: the
+StyleRegistry interns each distinct property set once and hands out a small
+integer id, and the lookup tables below map (is_hist, number format) to ids
+up front.  Per export, materialize() creates exactly one Format per interned
+style and returns them as a list indexed by id – cell writes then cost a
+list index, with no dict building or string keys per cell.
+
+Usage:
+    from excel_export.styles import STYLES, S, NUMBER_STYLE
+    fmts = STYLES.materialize(wb)
+    ws.write_number(row, col, 1.5, fmts[NUMBER_STYLE[True]["dec"]])
+    ws.write(row, col, "Revenue", fmts[S["lbl0"]])
+
+    # Per-schedule styling: intern more styles before the workbook is created
+    bold_red = STYLES.intern({**BASE, "bold": True, "font_color": "#C00000"})
+"""
+
+FONT_NAME       = "Calibri"
+HIST_FONT_COLOR = "#0000FF"   # blue – historical hard-coded input cells
+BASE            = {"font_name": FONT_NAME, "font_size": 11}
+
+# Three number formats, each in a historical (blue) and a projected variant
+NUM_FORMATS = {
+    "int": '#,##0_);(#,##0);-_)',
+    "dec": '#,##0.0_);(#,##0.0);-_)',
+    "pct": '0.0%;(0.0%)',
+}
+
+
+class StyleRegistry:
+    """Interns format property dicts; equal properties always get the same id."""
+
+    def __init__(self):
+        self._ids: dict[tuple, int] = {}
+        self._props: list[dict] = []
+        self.names: dict[str, int] = {}
+
+    def intern(self, props: dict, name: str | None = None) -> int:
+        key = tuple(sorted(props.items()))
+        style_id = self._ids.get(key)
+        if style_id is None:
+            style_id = self._ids[key] = len(self._props)
+            self._props.append(dict(props))
+        if name is not None:
+            self.names[name] = style_id
+        return style_id
+
+    def materialize(self, wb) -> list:
+        """One Format per interned style in wb, indexed by style id."""
+        return [wb.add_format(props) for props in self._props]
+
+    def __len__(self):
+        return len(self._props)
+
+    def __repr__(self):
+        return f"<StyleRegistry: {len(self._props)} styles, {len(self.names)} named>"
+
+
+def _default_registry() -> StyleRegistry:
+    reg = StyleRegistry()
+
+    # Company name – Calibri 18, bold, center-across
+    reg.intern({**BASE, "font_size": 18, "bold": True,
+                "align": "center_across", "valign": "vcenter"}, "company")
+
+    # Schedule title – Calibri 14, bold, center-across
+    reg.intern({**BASE, "font_size": 14, "bold": True,
+                "align": "center_across", "valign": "vcenter"}, "sched")
+
+    # Separator row – medium bottom border (written as blanks)
+    reg.intern({"bottom": 2}, "sep")
+
+    # Closing border row at the bottom of each schedule (B:V)
+    reg.intern({"bottom": 1}, "end")
+
+    # "Projected" label above year headers
+    reg.intern({**BASE, "bold": True, "align": "center_across"}, "proj_hdr")
+
+    # Year headers: 2020A (historical) and 2025E (projected)
+    reg.intern({**BASE, "bold": True, "align": "center", "num_format": '0"A"'}, "yr_hist")
+    reg.intern({**BASE, "bold": True, "align": "center", "num_format": '0"E"',
+                "bottom": 1}, "yr_proj")
+
+    # Internal hyperlinks (sheet index, back-links)
+    reg.intern({**BASE, "font_color": HIST_FONT_COLOR, "underline": 1}, "link")
+    reg.intern({**BASE, "font_color": HIST_FONT_COLOR, "underline": 1, "indent": 1}, "link0")
+
+    # Sensitivity table column headers
+    reg.intern({**BASE, "bold": True, "align": "right", "bottom": 1}, "col_hdr")
+
+    # Section header labels (bold, no fill, two indent depths)
+    for i in range(2):
+        reg.intern({**BASE, "bold": True, "indent": i + 1}, f"sec{i}")
+
+    # Data labels (regular, four indent depths)
+    for i in range(4):
+        reg.intern({**BASE, "indent": i + 1}, f"lbl{i}")
+
+    # Numeric cells for three number formats × two font colours
+    for key, num_fmt in NUM_FORMATS.items():
+        cell = {**BASE, "num_format": num_fmt, "align": "right"}
+        reg.intern({**cell, "font_color": HIST_FONT_COLOR}, f"hist_{key}")
+        reg.intern(cell, f"proj_{key}")
+    return reg
+
+
+STYLES = _default_registry()
+S = STYLES.names
+
+# (is_hist, number format key) → style id, and the label styles by depth
+NUMBER_STYLE = {
+    is_hist: {key: S[f"{'hist' if is_hist else 'proj'}_{key}"] for key in NUM_FORMATS}
+    for is_hist in (True, False)
+}
+SECTION_STYLES = (S["sec0"], S["sec1"])
+LABEL_STYLES   = tuple(S[f"lbl{i}"] for i in range(4))
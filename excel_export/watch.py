@@ -0,0 +1,208 @@
+"""
+Watch data/ and rebuild finished models when their historicals change.
+
+Usage (from repo root):
+    dcf watch [--debounce 2] [--workers 2] [--poll]
+
+Changes are picked up with inotify on Linux (via ctypes, no extra
+dependency) or by polling file stamps elsewhere.  Bursts of saves to the
+same file are debounced, a ticker that changes again while it is being
+rebuilt is queued once more rather than once per save, and at most
+`workers` rebuilds run at a time.  Each workbook is written to a temporary
+file and renamed into place, so finished_models/ never holds a half-written
+export.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .run import DATA_DIR, DATA_FILE as _DATA_FILE, OUTPUT_DIR, find_data_file, output_path
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO    = 0x00000080
+_IN_NONBLOCK    = os.O_NONBLOCK
+_EVENT_HEADER   = struct.Struct("iIII")   # wd, mask, cookie, len
+
+
+def _ticker_of(filename: str) -> str | None:
+    m = _DATA_FILE.match(filename)
+    return m.group("ticker") if m else None
+
+
+def _rebuild(ticker: str, data_file: str, out_dir: str, engine: str) -> str:
+    """Process-pool entry point: load one ticker and export it atomically."""
+    from DCF_model.ypf_model import YPFModel
+    from .exporter import ExcelExporter
+
+    final = output_path(ticker, out_dir)
+    tmp = os.path.join(out_dir, f".{ticker}_DCF.tmp.xlsx")
+    model = YPFModel(data_file, engine=engine)
+    try:
+        ExcelExporter(model, tmp).export()
+    except BaseException:
+        # A failed rebuild must not leave its partial workbook behind
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, final)
+    return final
+
+
+# ── Change sources ───────────────────────────────────────────────────────────
+
+class _InotifyWatcher:
+    """Reports files in a directory that were written or moved into it."""
+
+    def __init__(self, directory: str):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = libc.inotify_add_watch(self._fd, os.fsencode(directory),
+                                    _IN_CLOSE_WRITE | _IN_MOVED_TO)
+        if wd < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout: float) -> set[str]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        buf = os.read(self._fd, 64 * 1024)
+        names, offset = set(), 0
+        while offset < len(buf):
+            _, _, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            names.add(os.fsdecode(buf[offset:offset + length].rstrip(b"\0")))
+            offset += length
+        return names
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _PollingWatcher:
+    """Fallback: compares (mtime, size) of every file on each call."""
+
+    def __init__(self, directory: str, interval: float = 1.0):
+        self.directory = directory
+        self.interval = interval
+        self._stamps = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        stamps = {}
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if e.is_file():
+                    st = e.stat()
+                    stamps[e.name] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def wait(self, timeout: float) -> set[str]:
+        time.sleep(min(timeout, self.interval))
+        stamps = self._scan()
+        changed = {n for n, s in stamps.items() if self._stamps.get(n) != s}
+        self._stamps = stamps
+        return changed
+
+    def close(self):
+        pass
+
+
+# ── Rebuild scheduler ────────────────────────────────────────────────────────
+
+class AutoRebuilder:
+    """
+    Debounces data-file changes per ticker and rebuilds them in a bounded pool.
+
+    pending  – {ticker: time of last change}; a ticker is rebuilt once it has
+               been quiet for `debounce` seconds and is not already running.
+    running  – {ticker: future}; a change arriving meanwhile simply lands in
+               pending again, so it is rebuilt exactly once more.
+    """
+
+    def __init__(self, data_dir: str = DATA_DIR, out_dir: str = OUTPUT_DIR,
+                 engine: str = "openpyxl", debounce: float = 2.0, workers: int = 2,
+                 poll: bool = False, poll_interval: float = 1.0):
+        self.data_dir = data_dir
+        self.out_dir = out_dir
+        self.engine = engine
+        self.debounce = debounce
+        self.workers = workers
+        self.pending: dict[str, float] = {}
+        self.running: dict = {}
+
+        self.watcher = None
+        if not poll:
+            try:
+                self.watcher = _InotifyWatcher(data_dir)
+            except (OSError, AttributeError, TypeError):
+                self.watcher = None   # not Linux, or inotify unavailable
+        if self.watcher is None:
+            self.watcher = _PollingWatcher(data_dir, poll_interval)
+
+    def stale_tickers(self) -> list[str]:
+        """Tickers whose finished model is missing or older than their data."""
+        stale = []
+        for name in sorted(os.listdir(self.data_dir)):
+            ticker = _ticker_of(name)
+            if ticker is None:
+                continue
+            out = output_path(ticker, self.out_dir)
+            data_mtime = os.path.getmtime(os.path.join(self.data_dir, name))
+            if not os.path.exists(out) or os.path.getmtime(out) < data_mtime:
+                stale.append(ticker)
+        return stale
+
+    def _collect(self):
+        for ticker, fut in list(self.running.items()):
+            if not fut.done():
+                continue
+            del self.running[ticker]
+            try:
+                print(f"[watch] rebuilt {ticker} -> {fut.result()}", flush=True)
+            except Exception as e:
+                print(f"[watch] {ticker} failed: {type(e).__name__}: {e}", flush=True)
+
+    def _dispatch(self, pool, now: float):
+        for ticker, changed_at in sorted(self.pending.items(), key=lambda kv: kv[1]):
+            if len(self.running) >= self.workers:
+                break
+            if ticker in self.running or now - changed_at < self.debounce:
+                continue
+            del self.pending[ticker]
+            try:
+                data_file = find_data_file(ticker, self.data_dir)
+            except FileNotFoundError:
+                continue   # file was deleted or renamed away
+            self.running[ticker] = pool.submit(
+                _rebuild, ticker, data_file, self.out_dir, self.engine)
+
+    def run(self, rebuild_stale: bool = True):
+        os.makedirs(self.out_dir, exist_ok=True)
+        print(f"[watch] watching {self.data_dir} "
+              f"({type(self.watcher).__name__.strip('_')})", flush=True)
+        if rebuild_stale:
+            start = time.monotonic() - self.debounce
+            self.pending.update({t: start for t in self.stale_tickers()})
+
+        tick = min(self.debounce / 2, 0.5) or 0.1
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            try:
+                while True:
+                    changed = self.watcher.wait(tick)
+                    now = time.monotonic()
+                    for name in changed:
+                        ticker = _ticker_of(name)
+                        if ticker is not None:
+                            self.pending[ticker] = now
+                    self._collect()
+                    self._dispatch(pool, now)
+            finally:
+                self.watcher.close()
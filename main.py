@@ -1,6 +1,378 @@
-def main():
-    print("Hello from dcf-excel!")
+"""
+Command-line entry point for the DCF model (installed as `dcf`).
+
+Usage:
+    dcf export <ticker> [--data-dir DIR] [--out-dir DIR] [--engine xml] [--tornado BUMP]
+                        [--layout sheets] [--workers N] [--processes N]
+                        [--format parquet|arrow|csv|jsonl] [--delta FILE ...]
+    dcf dump [TICKER ...] --out PATH [--format parquet] [--workers N]   (default: all tickers)
+    dcf batch [TICKER ...] [--out-dir DIR] [--format csv] [--layout sheets] [--tornado BUMP]
+                        [--workers N] [--queue N]          (one file per ticker, pipelined)
+    dcf show <ticker>   [--data-dir DIR] [--engine xml]
+                        [--field-report PATH] [--projection PATH]  (export, show, check)
+    dcf tornado <ticker> [--bump 0.1] [--output price_per_share] [--top N] [--gradients]
+    dcf solve <ticker>  --target X [--output price_per_share] [--vary DRIVER|wacc]
+                        [--mode scale|shift|level]
+    dcf check <ticker>  [--data-dir DIR] [--abs-tol X] [--rel-tol X]
+    dcf serve [--port N | --socket PATH] [--max-memory-mb N] [--workers N]
+              [--cache-dir DIR] [--shared-cache DIR] [--cache-ttl SECONDS]
+    dcf watch [--debounce SECONDS] [--workers N] [--poll]
+
+    --profile-startup   report how long the imports for the command took
+    --timings           report per-stage timings and counters on stderr
+    --trace PATH        also write the timings as a Chrome trace JSON file
+
+Only argparse is imported up front.  openpyxl, xlsxwriter and the model
+package are imported inside the command that needs them, so short
+invocations don't pay for dependencies they never touch.
+"""
+
+import argparse
+import sys
+import time
+
+# excel_export.backends.BACKENDS, repeated here so the parser stays import-free
+BACKEND_FORMATS = ("xlsx", "parquet", "arrow", "csv", "jsonl")
+
+
+class _ImportTimer:
+    """Times a block of lazy imports and lists the top-level packages it loaded."""
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+
+    def __enter__(self):
+        if self.enabled:
+            self._before = set(sys.modules)
+            self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.enabled and exc[0] is None:
+            elapsed = (time.perf_counter() - self._t0) * 1000
+            loaded = sorted({m.split(".")[0] for m in set(sys.modules) - self._before})
+            print(f"[startup] imports: {elapsed:.1f} ms "
+                  f"({len(loaded)} packages: {', '.join(loaded)})", file=sys.stderr)
+
+
+def _loader_options(args) -> dict:
+    options = {}
+    if args.projection:
+        from DCF_model.multi_sheet_loader import read_projection
+        options["projection"] = read_projection(args.projection)
+    if args.field_report:
+        options["trace_access"] = True
+    return options
+
+
+def _write_field_report(args, model):
+    if args.field_report:
+        model.loader.write_access_report(args.field_report)
+        print(f"Field access report: {args.field_report}", file=sys.stderr)
+
+
+def _usage_error(command: str, error: Exception) -> int:
+    print(f"dcf {command}: error: {error}", file=sys.stderr)
+    return 2
+
+
+def _cmd_export(args) -> int:
+    with _ImportTimer(args.profile_startup):
+        from excel_export.run import check_export_options, export
+        import DCF_model.ypf_model, excel_export.exporter  # noqa: F401 – timed here, used by export()
+    try:
+        check_export_options(args.format, args.tornado, args.layout, args.workers,
+                             args.processes)
+    except ValueError as e:
+        return _usage_error("export", e)
+    model = export(args.ticker, args.data_dir, args.out_dir, engine=args.engine,
+                   tornado_bump=args.tornado, layout=args.layout, workers=args.workers,
+                   processes=args.processes, fmt=args.format, deltas=args.delta,
+                   **_loader_options(args))
+    _write_field_report(args, model)
+    return 0
+
+
+def _cmd_dump(args) -> int:
+    with _ImportTimer(args.profile_startup):
+        from excel_export.run import dump, dump_format
+    try:
+        fmt = dump_format(args.out, args.format)
+    except ValueError as e:
+        return _usage_error("dump", e)
+    dump(args.tickers, args.out, args.data_dir, fmt=fmt, engine=args.engine,
+         workers=args.workers)
+    return 0
+
+
+def _cmd_batch(args) -> int:
+    with _ImportTimer(args.profile_startup):
+        from excel_export.pipeline import export_all
+        from excel_export.run import list_tickers
+    tickers = args.tickers or list_tickers(args.data_dir)
+    written = export_all(tickers, args.data_dir, args.out_dir, fmt=args.format,
+                         engine=args.engine, layout=args.layout, tornado_bump=args.tornado,
+                         workers=args.workers, queue=args.queue)
+    return 0 if len(written) == len(set(tickers)) else 1
+
+
+def _cmd_show(args) -> int:
+    with _ImportTimer(args.profile_startup):
+        from excel_export.run import find_data_file
+        from DCF_model.ypf_model import YPFModel
+        from DCF_model.demo import show
+    data_file = find_data_file(args.ticker, args.data_dir)
+    print(f"Loading model from: {data_file}")
+    model = YPFModel(data_file, engine=args.engine, **_loader_options(args))
+    show(model)
+    _write_field_report(args, model)
+    return 0
+
+
+def _cmd_tornado(args) -> int:
+    with _ImportTimer(args.profile_startup):
+        from excel_export.run import find_data_file
+        from DCF_model.ypf_model import YPFModel
+        from DCF_model.sensitivity import gradients, tornado
+    data_file = find_data_file(args.ticker, args.data_dir)
+    model = YPFModel(data_file, engine=args.engine, **_loader_options(args))
+    if args.gradients:
+        result = gradients(model, output=args.output,
+                           wacc=args.wacc, terminal_growth=args.terminal_growth)
+    else:
+        result = tornado(model, bump=args.bump, output=args.output,
+                         wacc=args.wacc, terminal_growth=args.terminal_growth)
+    print(result.format(top=args.top))
+    _write_field_report(args, model)
+    return 0
+
+
+def _cmd_solve(args) -> int:
+    with _ImportTimer(args.profile_startup):
+        from excel_export.run import find_data_file
+        from DCF_model.ypf_model import YPFModel
+        from DCF_model.solver import goal_seek
+    data_file = find_data_file(args.ticker, args.data_dir)
+    model = YPFModel(data_file, engine=args.engine, **_loader_options(args))
+    result = goal_seek(model, args.target, output=args.output, vary=args.vary,
+                       mode=args.mode, wacc=args.wacc,
+                       terminal_growth=args.terminal_growth)
+    _write_field_report(args, model)
+    if not result.converged[0]:
+        print(f"No {args.vary} found that gives {args.output} = {args.target:,.2f}",
+              file=sys.stderr)
+        return 1
+    implied = result.implied_path(0)
+    if isinstance(implied, float):
+        print(f"{args.vary} = {implied:.6f}")
+    else:
+        print(f"{args.vary} ({args.mode}) θ = {result.theta[0]:.6f}")
+        for year, value in implied.items():
+            print(f"  {year}  {value:,.4f}")
+    return 0
+
+
+def _cmd_check(args) -> int:
+    with _ImportTimer(args.profile_startup):
+        from excel_export.run import find_data_file
+        from DCF_model.ypf_model import YPFModel
+        from DCF_model.integrity import check_integrity
+    data_file = find_data_file(args.ticker, args.data_dir)
+    model = YPFModel(data_file, engine=args.engine, **_loader_options(args))
+    report = check_integrity(model, abs_tol=args.abs_tol, rel_tol=args.rel_tol)
+    summary = report.summary()
+    print(f"{data_file}: {summary['identities']} identities, "
+          f"{summary['evaluated']} year checks, {len(summary['violations'])} violations")
+    details = report.format()
+    if details:
+        print(details)
+    _write_field_report(args, model)
+    return 0 if report.ok else 1
+
+
+def _cmd_serve(args) -> int:
+    with _ImportTimer(args.profile_startup):
+        import asyncio
+        from excel_export.server import ModelServer
+        from DCF_model.cache import ResultCache
+    results = None
+    if args.cache_dir or args.shared_cache:
+        results = ResultCache(args.cache_dir, args.shared_cache, ttl=args.cache_ttl)
+    server = ModelServer(args.data_dir, args.out_dir, engine=args.engine,
+                         max_bytes=args.max_memory_mb * 1024 * 1024, workers=args.workers,
+                         results=results)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.socket))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _cmd_watch(args) -> int:
+    with _ImportTimer(args.profile_startup):
+        from excel_export.watch import AutoRebuilder
+    rebuilder = AutoRebuilder(args.data_dir, args.out_dir, engine=args.engine,
+                              debounce=args.debounce, workers=args.workers,
+                              poll=args.poll, poll_interval=args.interval)
+    try:
+        rebuilder.run(rebuild_stale=not args.no_initial)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    # Paths are relative to the working directory (the repo root in a checkout)
+    parser = argparse.ArgumentParser(prog="dcf", description="Automated DCF model")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="report import time for the command on stderr")
+    parser.add_argument("--timings", action="store_true",
+                        help="report per-stage timings and counters on stderr")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="write per-stage timings as Chrome trace JSON")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("ticker")
+    common.add_argument("--data-dir", default="data",
+                        help="directory holding <ticker>_historicals.{csv,xlsx}")
+    common.add_argument("--engine", choices=("openpyxl", "xml"), default="openpyxl",
+                        help="xlsx reader: openpyxl or the built-in XML reader")
+    common.add_argument("--field-report", metavar="PATH",
+                        help="trace field lookups and write hit counts + projection manifest")
+    common.add_argument("--projection", metavar="PATH",
+                        help="only parse the fields listed in this manifest or field report")
+
+    p = sub.add_parser("export", parents=[common], help="write finished_models/<ticker>_DCF.xlsx")
+    p.add_argument("--out-dir", default="finished_models")
+    p.add_argument("--tornado", type=float, metavar="BUMP",
+                   help="append a ±BUMP (e.g. 0.1) driver sensitivity block")
+    p.add_argument("--layout", choices=("single", "sheets"), default="single",
+                   help="one Model sheet, or a summary sheet plus one sheet per schedule")
+    p.add_argument("--workers", type=int, default=1,
+                   help="generate the schedule sheets on N threads")
+    p.add_argument("--processes", type=int, default=1,
+                   help="render the sheet XML on N processes (one chunk per schedule)")
+    p.add_argument("--format", choices=BACKEND_FORMATS, default="xlsx",
+                   help="styled workbook, or plain model rows for machine consumers")
+    p.add_argument("--delta", action="append", metavar="FILE",
+                   help="patch the loaded data with a delta (.json, .csv or .xlsx) "
+                        "before exporting; repeatable, applied in order")
+    p.set_defaults(func=_cmd_export)
+
+    p = sub.add_parser("dump", help="write many tickers' model rows into one data file")
+    p.add_argument("tickers", nargs="*", help="default: every ticker in --data-dir")
+    p.add_argument("--out", required=True, help="output file, e.g. models.parquet")
+    p.add_argument("--format", choices=BACKEND_FORMATS[1:],
+                   help="default: from the --out extension")
+    p.add_argument("--data-dir", default="data")
+    p.add_argument("--engine", choices=("openpyxl", "xml"), default="openpyxl")
+    p.add_argument("--workers", type=int, default=1, help="load models on N processes")
+    p.set_defaults(func=_cmd_dump)
+
+    p = sub.add_parser("batch", help="export many tickers, one file each, as a pipeline")
+    p.add_argument("tickers", nargs="*", help="default: every ticker in --data-dir")
+    p.add_argument("--data-dir", default="data")
+    p.add_argument("--out-dir", default="finished_models")
+    p.add_argument("--engine", choices=("openpyxl", "xml"), default="openpyxl")
+    p.add_argument("--format", choices=BACKEND_FORMATS, default="xlsx")
+    p.add_argument("--layout", choices=("single", "sheets"), default="single")
+    p.add_argument("--tornado", type=float, metavar="BUMP",
+                   help="append a ±BUMP driver sensitivity block")
+    p.add_argument("--workers", type=int,
+                   help="processes for parsing and rendering (default: one per CPU)")
+    p.add_argument("--queue", type=int, default=4,
+                   help="items buffered between stages before a stage waits")
+    p.set_defaults(func=_cmd_batch)
+
+    p = sub.add_parser("show", parents=[common], help="print key model outputs")
+    p.set_defaults(func=_cmd_show)
+
+    p = sub.add_parser("tornado", parents=[common], help="rank drivers by valuation impact")
+    p.add_argument("--bump", type=float, default=0.10, help="relative bump (default 0.10)")
+    p.add_argument("--output", default="enterprise_value",
+                   choices=("enterprise_value", "equity_value", "price_per_share"))
+    p.add_argument("--wacc", type=float, default=0.10)
+    p.add_argument("--terminal-growth", type=float, default=0.02)
+    p.add_argument("--top", type=int, help="only show the N largest swings")
+    p.add_argument("--gradients", action="store_true",
+                   help="print exact derivatives and elasticities instead of bump swings")
+    p.set_defaults(func=_cmd_tornado)
+
+    p = sub.add_parser("solve", parents=[common],
+                       help="find the driver value or rate implied by a target")
+    p.add_argument("--target", type=float, required=True)
+    p.add_argument("--output", default="price_per_share",
+                   choices=("enterprise_value", "equity_value", "price_per_share"))
+    p.add_argument("--vary", default="pricing.oil_and_consolidates",
+                   help="driver label (see `dcf tornado`), wacc or terminal_growth")
+    p.add_argument("--mode", choices=("scale", "shift", "level"), default="scale",
+                   help="how the driver path moves: ×θ, +θ or =θ in every year")
+    p.add_argument("--wacc", type=float, default=0.10)
+    p.add_argument("--terminal-growth", type=float, default=0.02)
+    p.set_defaults(func=_cmd_solve)
+
+    p = sub.add_parser("check", parents=[common], help="verify accounting identities")
+    p.add_argument("--abs-tol", type=float, default=0.5,
+                   help="absolute tolerance per identity and year")
+    p.add_argument("--rel-tol", type=float, default=1e-4,
+                   help="tolerance relative to the sum of the terms' magnitudes")
+    p.set_defaults(func=_cmd_check)
+
+    p = sub.add_parser("serve", help="run the local model server")
+    p.add_argument("--data-dir", default="data")
+    p.add_argument("--out-dir", default="finished_models")
+    p.add_argument("--engine", choices=("openpyxl", "xml"), default="openpyxl")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--socket", help="listen on a Unix socket instead of TCP")
+    p.add_argument("--max-memory-mb", type=int, default=512,
+                   help="evict least-recently-used models above this size")
+    p.add_argument("--workers", type=int, help="process-pool size (default: one per CPU)")
+    p.add_argument("--cache-dir", metavar="DIR",
+                   help="keep summaries and valuations by content hash in DIR")
+    p.add_argument("--shared-cache", metavar="DIR",
+                   help="second result-cache directory shared with other machines")
+    p.add_argument("--cache-ttl", type=float, metavar="SECONDS",
+                   help="cached results expire this long after they were computed")
+    p.set_defaults(func=_cmd_serve)
+
+    p = sub.add_parser("watch", help="rebuild finished models when data/ changes")
+    p.add_argument("--data-dir", default="data")
+    p.add_argument("--out-dir", default="finished_models")
+    p.add_argument("--engine", choices=("openpyxl", "xml"), default="openpyxl")
+    p.add_argument("--debounce", type=float, default=2.0,
+                   help="seconds a file must be quiet before it is rebuilt")
+    p.add_argument("--workers", type=int, default=2, help="max concurrent rebuilds")
+    p.add_argument("--poll", action="store_true", help="poll instead of using inotify")
+    p.add_argument("--interval", type=float, default=1.0, help="polling interval in seconds")
+    p.add_argument("--no-initial", action="store_true",
+                   help="don't rebuild models that are already stale at start-up")
+    p.set_defaults(func=_cmd_watch)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    t0 = time.perf_counter()
+    args = _build_parser().parse_args(argv)
+
+    collector = None
+    if args.timings or args.trace:
+        from DCF_model.timings import TimingCollector
+        collector = TimingCollector().start()
+    try:
+        status = args.func(args)
+    finally:
+        if collector is not None:
+            collector.stop()
+            if args.timings:
+                print(collector.report(), file=sys.stderr)
+            if args.trace:
+                collector.write_chrome_trace(args.trace)
+    if args.profile_startup:
+        print(f"[startup] total: {(time.perf_counter() - t0) * 1000:.1f} ms", file=sys.stderr)
+    return status
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
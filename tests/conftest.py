@@ -0,0 +1,26 @@
+import warnings
+
+import pytest
+
+from benchmarks.synthetic import write_workbook
+from DCF_model.ypf_model import YPFModel
+
+
+@pytest.fixture(scope="session")
+def data_dir(tmp_path_factory):
+    """A data directory holding one synthetic ticker, TST."""
+    path = tmp_path_factory.mktemp("data")
+    write_workbook(str(path / "TST_historicals.xlsx"), seed=1)
+    return path
+
+
+@pytest.fixture(scope="session")
+def data_file(data_dir):
+    return str(data_dir / "TST_historicals.xlsx")
+
+
+@pytest.fixture
+def model(data_file):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)   # one sheet name is > 31 chars
+        return YPFModel(data_file)
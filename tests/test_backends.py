@@ -0,0 +1,16 @@
+import pytest
+
+from excel_export.backends import Backend, _ArrowBackend
+
+
+def test_backends_must_implement_their_hooks():
+    class NoRows(Backend):
+        pass
+
+    class NoWriter(_ArrowBackend):
+        extension = "feather"
+
+    with pytest.raises(TypeError, match="abstract method"):
+        NoRows("out.txt")
+    with pytest.raises(TypeError, match="abstract method"):
+        NoWriter("out.feather")
@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+from DCF_model.cache import ResultCache
+
+
+@pytest.mark.parametrize("data", [b"", b"\x80\x05garbage", b"cnonexistent_module\nThing\n."])
+def test_corrupt_entries_are_misses(tmp_path, data):
+    cache = ResultCache(str(tmp_path))
+    cache.put("ab" * 32, {"ev": 1.0})
+    (_, store), = cache.stores
+    with open(store._path("ab" * 32), "wb") as f:
+        f.write(data)
+
+    cache.clear()
+    assert cache.get("ab" * 32) is None
+    assert cache.stats["misses"] == 1
+    cache.put("ab" * 32, {"ev": 2.0})
+    cache.clear()
+    assert cache.get("ab" * 32) == {"ev": 2.0}
+
+
+def test_concurrent_prunes_are_skipped(tmp_path):
+    cache = ResultCache(str(tmp_path), max_entries=1, prune_every=0)
+    for key in ("aa" * 32, "bb" * 32):
+        cache.put(key, 1)
+    with cache._pruning:   # as if another thread were pruning
+        assert cache.prune() == 0
+    assert cache.prune() == 1
+    assert sum(len(files) for _, _, files in os.walk(tmp_path)) == 1
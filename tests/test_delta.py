@@ -0,0 +1,87 @@
+import pytest
+
+from DCF_model.cache import ResultCache, result_key
+from DCF_model.delta import Delta
+from DCF_model.valuation import DCFValuation
+from DCF_model.ypf_model import YPFModel
+from excel_export.backends import model_rows
+from excel_export.exporter import ExcelExporter
+
+IS = "Income Statement"
+
+
+def test_cell_revision_replaces_the_series(model):
+    held = model.loader.field(IS, "nopat")
+    before = held[2025]
+    touched = model.apply(Delta({IS: {"nopat": {2025: 123.0, 2026: None}}}))
+
+    assert touched == ["Income Statement"]
+    assert "Income Statement" in model.dirty
+    patched = model.income_statement.line_items["nopat"]
+    assert patched[2025] == 123.0
+    assert 2026 not in patched
+    assert held[2025] == before and 2026 in held   # handed-out series keep their values
+
+
+def test_new_row(model):
+    model.apply(Delta({IS: {"new_line": {2025: 1.5}}}))
+    assert model.loader.field(IS, "new_line").to_dict() == {2025: 1.5}
+
+
+def test_new_year_extends_the_axes(model):
+    touched = model.apply(Delta({IS: {"nopat": {2035: 7.0}}}))
+
+    loader = model.loader
+    assert loader.ALL_YEARS[-1] == loader.PROJECTED_YEARS[-1] == 2035
+    assert loader.field(IS, "nopat")[2035] == 7.0
+    assert len(touched) == len(model.all_schedules)
+    assert DCFValuation(model).projected_years[-1] == 2035
+
+
+@pytest.mark.parametrize("layout", ["single", "sheets"])
+def test_exporter_rejects_years_outside_its_timeline(model, tmp_path, layout):
+    model.apply(Delta({IS: {"nopat": {2035: 7.0}}}))
+    with pytest.raises(ValueError, match=r"\[2035\] are outside the export timeline"):
+        ExcelExporter(model, str(tmp_path / "out.xlsx"), layout=layout).export()
+    with pytest.raises(ValueError, match="outside the export timeline"):
+        model_rows(model)
+
+
+def test_actuals_through_rolls_the_split(model):
+    model.apply(Delta(actuals_through=2025))
+    loader = model.loader
+    assert loader.HISTORICAL_YEARS[-1] == 2025
+    assert loader.PROJECTED_YEARS[0] == 2026
+    assert DCFValuation(model).valuation_year == 2025
+
+    with pytest.raises(ValueError, match="actuals_through must be a year"):
+        model.apply(Delta(actuals_through=2034))
+
+
+@pytest.mark.filterwarnings("ignore:Title is more than 31 characters")
+def test_patch_digest_chains_deltas_in_order(data_file):
+    first = Delta({IS: {"nopat": {2025: 1.0}}})
+    second = Delta(actuals_through=2025)
+    digests = []
+    for order in ((first, second), (first, second), (second, first)):
+        model = YPFModel(data_file)
+        start = model.loader.patch_digest
+        for delta in order:
+            model.apply(delta)
+        assert model.loader.revision == 2
+        digests.append(model.loader.patch_digest)
+
+    assert start not in digests
+    assert digests[0] == digests[1] != digests[2]
+
+
+def test_cached_results_keep_their_pre_patch_values(model):
+    cache = ResultCache()
+    old_key = result_key("summary", model)
+    old = cache.summary(model)["Income Statement"]["line_items"]["nopat"][2025]
+
+    model.apply(Delta({IS: {"nopat": {2025: old + 1.0}}}))
+
+    assert result_key("summary", model) != old_key
+    assert cache.get(old_key)["Income Statement"]["line_items"]["nopat"][2025] == old
+    assert cache.summary(model)["Income Statement"]["line_items"]["nopat"][2025] == old + 1.0
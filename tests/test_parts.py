@@ -0,0 +1,62 @@
+import re
+import zipfile
+
+import pytest
+from openpyxl import load_workbook
+
+from DCF_model.sensitivity import tornado
+from excel_export.exporter import ExcelExporter
+
+
+def _contents(path: str) -> dict:
+    """Everything a reader sees per sheet: cells with their styles, links and layout."""
+    wb = load_workbook(path)
+    out = {"sheets": wb.sheetnames}
+    for ws in wb.worksheets:
+        cells = {}
+        for row in ws.iter_rows():
+            for c in row:
+                if c.value is None and not c.has_style:
+                    continue
+                link = c.hyperlink
+                cells[c.coordinate] = (
+                    c.value, c.number_format, repr(c.font), repr(c.fill), repr(c.border),
+                    repr(c.alignment),
+                    (link.location, link.target, link.display) if link else None,
+                )
+        out[ws.title] = {
+            "cells":   cells,
+            "heights": {r: d.height for r, d in ws.row_dimensions.items() if d.height},
+            "widths":  {k: d.width for k, d in ws.column_dimensions.items()},
+            "merged":  sorted(str(r) for r in ws.merged_cells.ranges),
+            "freeze":  ws.freeze_panes,
+            "charts":  len(ws._charts),
+        }
+    # openpyxl recomputes dimensions on load, so read the written <dimension> refs
+    with zipfile.ZipFile(path) as z:
+        out["dimensions"] = {
+            name: re.search(rb'<dimension ref="([^"]+)"', z.read(name)).group(1)
+            for name in z.namelist() if name.startswith("xl/worksheets/sheet")
+        }
+    return out
+
+
+@pytest.mark.filterwarnings("ignore:Title is more than 31 characters")
+@pytest.mark.parametrize("layout, with_tornado",
+                         [("single", False), ("single", True), ("sheets", True)])
+def test_multi_process_export_matches_single_process(model, tmp_path, layout, with_tornado):
+    sensitivity = tornado(model) if with_tornado else None
+    paths = {}
+    for processes in (1, 2):
+        paths[processes] = str(tmp_path / f"{processes}.xlsx")
+        ExcelExporter(model, paths[processes], sensitivity=sensitivity, layout=layout,
+                      processes=processes).export()
+
+    plain, parts = _contents(paths[1]), _contents(paths[2])
+    assert plain["sheets"] == parts["sheets"]
+    assert plain["dimensions"] == parts["dimensions"]
+    for name in plain["sheets"]:
+        assert plain[name] == parts[name], name
+    if layout == "sheets":
+        links = [v[-1] for v in plain[plain["sheets"][1]]["cells"].values() if v[-1]]
+        assert links   # the comparison covers the back links
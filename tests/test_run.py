@@ -0,0 +1,38 @@
+import pytest
+
+import main
+from excel_export import run
+
+
+def test_export_rejects_workbook_options_for_data_formats(data_dir, tmp_path):
+    with pytest.raises(ValueError, match=r"\['tornado', 'workers'\] only apply to the xlsx"):
+        run.export("TST", str(data_dir), str(tmp_path), fmt="parquet",
+                   tornado_bump=0.1, workers=4)
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("argv", [
+    ["export", "TST", "--format", "csv", "--tornado", "0.1"],
+    ["export", "TST", "--format", "jsonl", "--layout", "sheets"],
+    ["export", "TST", "--format", "arrow", "--processes", "2"],
+])
+def test_cli_export_usage_errors(argv, data_dir, tmp_path, capsys):
+    status = main.main([*argv, "--data-dir", str(data_dir), "--out-dir", str(tmp_path)])
+    assert status == 2
+    assert "only apply to the xlsx format" in capsys.readouterr().err
+
+
+def test_dump_rejects_workbooks(data_dir, tmp_path, capsys):
+    out = str(tmp_path / "models.xlsx")
+    with pytest.raises(ValueError, match="dump writes data formats only"):
+        run.dump(None, out, str(data_dir))
+    assert main.main(["dump", "--out", out, "--data-dir", str(data_dir)]) == 2
+    assert "dump writes data formats only" in capsys.readouterr().err
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.filterwarnings("ignore:Title is more than 31 characters")
+def test_dump_infers_the_format_from_the_extension(data_dir, tmp_path):
+    out = tmp_path / "models.csv"
+    run.dump(None, str(out), str(data_dir))
+    assert out.read_text().startswith("ticker,schedule,path,label,depth,2020")
@@ -0,0 +1,44 @@
+import pytest
+
+from DCF_model.drivers import DriverModel
+from DCF_model.scenario_batch import run_scenarios
+from DCF_model.valuation import DCFValuation
+
+IS = "Income Statement"
+
+
+def enterprise_value(model):
+    return DCFValuation(model, 0.11).enterprise_value
+
+
+@pytest.fixture
+def scenarios(model):
+    out = [model.scenario(f"nopat {f:.0%}").scale(IS, "nopat", f) for f in (0.8, 1.0, 1.2)]
+    out.append(out[-1].child("nopat 120%, da 90%").scale(IS, "da", 0.9))
+    return out
+
+
+def test_batch_matches_dcf_valuation(model, scenarios):
+    res = run_scenarios(model, scenarios, wacc=0.11)
+    for i, scenario in enumerate(scenarios):
+        val = DCFValuation(scenario.model(), 0.11)
+        assert res.scalar("enterprise_value")[i] == pytest.approx(val.enterprise_value)
+        assert res.scalar("price_per_share")[i] == pytest.approx(val.price_per_share)
+        assert res.scalar("net_debt")[i] == pytest.approx(val.net_debt)
+
+
+def test_driver_model_reproduces_dcf_valuation(model):
+    ev = DriverModel(model, wacc=0.11).evaluate()["enterprise_value"]
+    assert ev == pytest.approx(DCFValuation(model, 0.11).enterprise_value)
+
+
+def test_callables_in_worker_processes(model, scenarios):
+    res = run_scenarios(model, scenarios, outputs=[enterprise_value],
+                        wacc=0.11, workers=2, chunk_size=2)
+    expected = run_scenarios(model, scenarios, outputs=["enterprise_value"], wacc=0.11)
+    assert res.scalar("enterprise_value") == pytest.approx(expected.scalar("enterprise_value"))
+
+
+def test_unpicklable_callable_is_rejected_up_front(model, scenarios):
+    with pytest.raises(ValueError, match="can't be sent to worker processes"):
+        run_scenarios(model, scenarios, outputs=[lambda m: 1.0], workers=2, chunk_size=2)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from DCF_model.autodiff import Dual
+from DCF_model.drivers import DriverModel
+from DCF_model.sensitivity import gradients
+
+
+def test_dual_matches_analytic_derivatives():
+    x = Dual.seed(np.array([1.0, 2.0, 4.0]))
+    y = (x * x / (1.0 + x)).cumprod().sum()
+    f = lambda v: np.cumprod(v * v / (1.0 + v)).sum()
+    v, h = x.value, 1e-6
+    fd = [(f(v + h * e) - f(v - h * e)) / (2 * h) for e in np.eye(3)]
+    assert y.value == pytest.approx(f(v))
+    np.testing.assert_allclose(y.tan, fd, rtol=1e-7)
+
+
+@pytest.fixture
+def driver_model(model):
+    return DriverModel(model, wacc=0.10, terminal_growth=0.02)
+
+
+def _central_difference(dm, output, label):
+    """d output / d label[year] for every projected year, by central differences."""
+    base = dm.base[label]
+    n = len(base)
+    h = 1e-6 * np.maximum(np.abs(base), 1e-2)
+    bumps = np.vstack([np.diag(h), -np.diag(h)])
+    out = dm.evaluate({label: base + bumps})[output]
+    return (out[:n] - out[n:]) / (2 * h)
+
+
+@pytest.mark.parametrize("output", ["enterprise_value", "price_per_share"])
+def test_driver_gradients_match_finite_differences(driver_model, output):
+    g = gradients(driver_model, output)
+    assert g.base_value == pytest.approx(driver_model.evaluate()[output])
+    for label in g.labels:
+        fd = _central_difference(driver_model, output, label)
+        exact = np.array([g.by_year[label][y] for y in g.years])
+        scale = max(np.abs(fd).max(), 1e-9)
+        np.testing.assert_allclose(exact, fd, rtol=1e-5, atol=1e-6 * scale,
+                                   err_msg=label)
+
+
+@pytest.mark.parametrize("output", ["enterprise_value", "price_per_share"])
+def test_rate_gradients_match_finite_differences(driver_model, output):
+    g = gradients(driver_model, output)
+    h = 1e-6
+    w, tg = driver_model.wacc, driver_model.terminal_growth
+    d_wacc = (driver_model.evaluate(wacc=w + h)[output]
+              - driver_model.evaluate(wacc=w - h)[output]) / (2 * h)
+    d_growth = (driver_model.evaluate(terminal_growth=tg + h)[output]
+                - driver_model.evaluate(terminal_growth=tg - h)[output]) / (2 * h)
+    assert g.wacc == pytest.approx(d_wacc, rel=1e-6)
+    assert g.terminal_growth == pytest.approx(d_growth, rel=1e-6)
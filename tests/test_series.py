@@ -0,0 +1,59 @@
+import math
+import pickle
+
+from DCF_model.series import Series, year_axis
+
+IS = "Income Statement"
+
+
+def test_nan_is_missing():
+    s = Series.from_dict({2020: 1.0, 2021: math.nan, 2022: 3.0})
+    assert len(s) == 2
+    assert 2021 not in s
+    assert s.get(2021) is None
+    assert list(s) == [2020, 2022]
+    assert s == {2020: 1.0, 2022: 3.0}
+
+
+def test_division_by_zero_is_missing():
+    s = Series.from_dict({2020: 1.0, 2021: 2.0}) / Series.from_dict({2020: 0.0, 2021: 4.0})
+    assert s.to_dict() == {2021: 0.5}
+    assert (0.0 / Series.from_dict({2020: 0.0})).to_dict() == {}
+
+
+def test_binary_ops_take_the_union_of_axes():
+    a = Series.from_dict({2020: 1.0, 2021: 2.0})
+    b = Series.from_dict({2021: 10.0, 2022: 20.0})
+    total = a + b
+    assert total.axis is year_axis([2020, 2021, 2022])
+    assert total.to_dict() == {2021: 12.0}   # a year missing from either side is missing
+    assert (a + {2021: 1.0}).to_dict() == {2021: 3.0}
+    assert (1.0 - a).to_dict() == {2020: 0.0, 2021: -1.0}
+
+
+def test_reindex():
+    s = Series.from_dict({2020: 1.0, 2021: 2.0})
+    wide = s.reindex(year_axis(range(2019, 2023)))
+    assert wide.axis.years == (2019, 2020, 2021, 2022)
+    assert wide.to_dict() == s.to_dict()
+    assert s.reindex(year_axis([2021])).to_dict() == {2021: 2.0}
+    assert s.reindex(s.axis) is s
+
+
+def test_pickle_restores_onto_the_shared_axis():
+    s = Series.from_dict({2020: 1.0, 2021: math.nan, 2022: 3.0})
+    copy = pickle.loads(pickle.dumps(s))
+    assert copy == s
+    assert copy.axis is s.axis
+    assert 2021 not in copy
+
+
+def test_scenario_overrides_are_series(model):
+    revenue = model.loader.field(IS, "revenue")
+    scenario = model.scenario("up").set(IS, "revenue", revenue * 1.1).scale(IS, "nopat", 0.5)
+
+    override = scenario.field(IS, "revenue")
+    assert isinstance(override, Series)
+    assert override[2026] == revenue[2026] * 1.1
+    assert scenario.model().income_statement.line_items["nopat"].pct_change()
+    assert model.loader.field(IS, "revenue") is revenue   # the base is left untouched
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+from DCF_model.cache import ResultCache
+from excel_export.server import ModelServer
+
+
+@pytest.fixture
+def server(data_dir, tmp_path):
+    server = ModelServer(str(data_dir), str(tmp_path), workers=1)
+    yield server
+    server.pool.shutdown()
+
+
+def _route(server, path, query=None, body=None):
+    return asyncio.run(server._route(path, query or {}, body))
+
+
+# ValueError is what _handle answers with 400 Bad Request
+@pytest.mark.parametrize("query", [{"wacc": ["0.02"], "terminal_growth": ["0.02"]},
+                                   {"wacc": ["0.01"]}, {"wacc": ["abc"]}])
+def test_bad_rates_are_a_value_error(server, query):
+    with pytest.raises(ValueError):
+        _route(server, "/valuation/TST", query)
+
+
+@pytest.mark.parametrize("body", [b"[1]", b'{"cells": 3}', b'{"cells": {"S": {"k": 5}}}',
+                                  b'{"cells": {"S": {"k": {"x": 1}}}}',
+                                  b'{"cells": {"S": {"k": {"2020": "a"}}}}',
+                                  b'{"actuals_through": "2025"}', b'{"cell": {}}', b"{"])
+def test_malformed_patch_is_a_value_error(server, body):
+    with pytest.raises(ValueError):
+        _route(server, "/patch/TST", body=body)
+
+
+def test_patch_then_valuation(server):
+    before = _route(server, "/valuation/TST")
+    spec = {"cells": {"Income Statement": {"nopat": {"2030": 1e6}}}}
+    result = _route(server, "/patch/TST", body=json.dumps(spec).encode())
+    assert result["schedules"] == ["Income Statement"]
+    assert _route(server, "/valuation/TST") != before
+
+
+def test_result_cache_io_runs_off_the_event_loop(data_dir, tmp_path, monkeypatch):
+    results = ResultCache(str(tmp_path / "cache"))
+    threads = []
+    for name in ("get", "put"):
+        method = getattr(results, name)
+        def record(*args, _method=method, _name=name):
+            threads.append((_name, threading.current_thread() is threading.main_thread()))
+            return _method(*args)
+        monkeypatch.setattr(results, name, record)
+
+    server = ModelServer(str(data_dir), str(tmp_path), workers=1, results=results)
+    try:
+        first = _route(server, "/valuation/TST")
+        assert _route(server, "/valuation/TST") == first
+    finally:
+        server.pool.shutdown()
+    assert threads == [("get", False), ("put", False), ("get", False)]
+
+
+def test_corrupt_result_cache_entry_is_recomputed(data_dir, tmp_path):
+    results = ResultCache(str(tmp_path / "cache"))
+    server = ModelServer(str(data_dir), str(tmp_path), workers=1, results=results)
+    try:
+        first = _route(server, "/valuation/TST")
+        (_, store), = results.stores
+        for root, _, files in os.walk(store.directory):
+            for name in files:
+                with open(os.path.join(root, name), "wb") as f:
+                    f.write(b"cnonexistent_module\nThing\n.")
+        results.clear()
+        assert _route(server, "/valuation/TST") == first
+    finally:
+        server.pool.shutdown()
+    assert results.stats["misses"] == 2
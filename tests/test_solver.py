@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from DCF_model.drivers import DriverModel
+from DCF_model.solver import goal_seek
+
+OIL = "pricing.oil_and_consolidates"
+
+
+@pytest.fixture
+def driver_model(model):
+    return DriverModel(model, wacc=0.10, terminal_growth=0.02)
+
+
+def test_solves_for_wacc(driver_model):
+    target = driver_model.evaluate(wacc=0.13)["enterprise_value"]
+    res = goal_seek(driver_model, target, output="enterprise_value", vary="wacc")
+
+    assert res.converged.all()
+    assert res.theta[0] == pytest.approx(0.13, rel=1e-6)
+    assert abs(res.residual[0]) <= 1e-8 * abs(target)
+    assert res.implied_path() == res.theta[0]
+
+
+def test_solves_for_a_driver_path_after_widening_the_bracket(driver_model):
+    base = driver_model.base[OIL]
+    target = driver_model.evaluate({OIL: base * 1.3})["price_per_share"]
+    # The root lies well outside the initial bracket, so it must be widened first
+    res = goal_seek(driver_model, target, vary=OIL, mode="scale", bracket=(0.2, 0.4))
+
+    assert res.converged.all()
+    assert res.theta[0] == pytest.approx(1.3, rel=1e-6)
+    assert res.iterations < 20   # Newton steps, not 40+ rounds of bisection
+    path = res.implied_path()
+    np.testing.assert_allclose([path[y] for y in driver_model.years], base * 1.3, rtol=1e-6)
+
+
+def test_broadcasts_over_targets_and_models(model, driver_model):
+    base = driver_model.base[OIL]
+    factors = np.array([0.9, 1.1, 1.3])
+    targets = driver_model.evaluate({OIL: base * factors[:, None]})["price_per_share"]
+    res = goal_seek(driver_model, targets, vary=OIL, mode="scale")
+    assert res.converged.all()
+    np.testing.assert_allclose(res.theta, factors, rtol=1e-6)
+
+    models = [driver_model, DriverModel(model, wacc=0.12, terminal_growth=0.02)]
+    evs = [dm.evaluate(wacc=0.14)["enterprise_value"] for dm in models]
+    res = goal_seek(models, evs, output="enterprise_value", vary="terminal_growth")
+    assert res.converged.all()
+    for i, dm in enumerate(models):
+        ev = dm.evaluate(terminal_growth=res.theta[i])["enterprise_value"]
+        assert ev == pytest.approx(evs[i], rel=1e-8)
+
+
+def test_reports_problems_without_a_bracket(driver_model):
+    ev = driver_model.evaluate()["enterprise_value"]
+    unreachable = -ev   # EV keeps its sign for every wacc > g on this data
+    res = goal_seek(driver_model, [ev, unreachable], output="enterprise_value",
+                    vary="wacc", max_expand=5)
+
+    assert res.converged.tolist() == [True, False]
+    assert np.isnan(res.theta[1]) and np.isnan(res.residual[1])
+    assert "1/2 converged" in repr(res)
@@ -0,0 +1,18 @@
+import math
+
+import pytest
+
+from DCF_model.valuation import DCFValuation
+
+
+@pytest.mark.parametrize("wacc, growth", [(0.02, 0.02), (0.01, 0.02), (math.nan, 0.02)])
+def test_rejects_wacc_not_above_growth(model, wacc, growth):
+    with pytest.raises(ValueError, match="must be greater than terminal_growth"):
+        DCFValuation(model, wacc, growth)
+
+
+def test_rechecks_rates_changed_on_the_instance(model):
+    val = DCFValuation(model, 0.10, 0.02)
+    val.wacc = 0.02
+    with pytest.raises(ValueError):
+        val.terminal_value
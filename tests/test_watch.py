@@ -0,0 +1,25 @@
+import os
+
+import pytest
+
+from excel_export.exporter import ExcelExporter
+from excel_export.watch import _rebuild
+
+
+@pytest.mark.filterwarnings("ignore:Title is more than 31 characters")
+def test_failed_rebuild_removes_its_temporary_file(data_file, tmp_path, monkeypatch):
+    def export(self):
+        with open(self.output_path, "wb") as f:
+            f.write(b"partial")
+        raise RuntimeError("export failed")
+
+    monkeypatch.setattr(ExcelExporter, "export", export)
+    with pytest.raises(RuntimeError, match="export failed"):
+        _rebuild("TST", data_file, str(tmp_path), "openpyxl")
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.filterwarnings("ignore:Title is more than 31 characters")
+def test_rebuild_writes_the_final_workbook(data_file, tmp_path):
+    final = _rebuild("TST", data_file, str(tmp_path), "openpyxl")
+    assert os.listdir(tmp_path) == [os.path.basename(final)]